@@ -0,0 +1,59 @@
+"""Host throughput against the test_basic regblock, with and without names"""
+
+from cocotb import test
+
+from benchlib.throughput import BEATS, Throughput
+from interfaces.clkrst import ClkReset
+
+from cocotbext.obi import ObiBus
+from cocotbext.obi import ObiHost
+
+SUITE = "basic"
+
+
+class testbench:
+    def __init__(self, dut, period=10):
+        self.period = period
+        self.incr = len(dut.s_obi_wdata) // 8
+        self.n_regs = 2 ** (len(dut.s_obi_addr) - 2)
+        self.cr = ClkReset(dut, period, reset_sense=1, resetname="rst")
+        self.dut = dut
+
+        self.bus = ObiBus.from_prefix(dut, "s_obi")
+        self.intf = ObiHost(self.bus, dut.clk)
+        self.names = [f"REG{i}" for i in range(self.n_regs)]
+        self.intf.addaddrmap({name: i * self.incr for i, name in enumerate(self.names)})
+
+
+async def run(dut, name, named=False, logging=False):
+    tb = testbench(dut)
+    if logging:
+        tb.intf.enable_logging()
+    await tb.cr.wait_clkn(200)
+
+    addrs = tb.names if named else [i * tb.incr for i in range(tb.n_regs)]
+    bench = Throughput(SUITE, name, tb.period, named=named, logging=logging)
+    bench.start()
+    for i in range(BEATS // 2):
+        addr = addrs[i % tb.n_regs]
+        await tb.intf.write(addr, i)
+        await tb.intf.read(addr, i)
+    bench.stop(BEATS // 2 * 2)
+
+    await tb.cr.end_test(10)
+
+
+@test()
+async def bench_numeric(dut):
+    await run(dut, "numeric")
+
+
+@test()
+async def bench_addrmap(dut):
+    """Registers accessed by AddressMap name"""
+    await run(dut, "addrmap", named=True)
+
+
+@test()
+async def bench_logging(dut):
+    await run(dut, "logging", logging=True)
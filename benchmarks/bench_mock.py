@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Throughput of ObiHost and ObiDevice on the mock bus (no simulator).
+
+Only the agents run, so the figures and profiles show the cost of the
+Python protocol engines alone:
+
+    python benchmarks/bench_mock.py --beats 20000
+    python -m cProfile -s tottime benchmarks/bench_mock.py --scenario mixed_bp
+"""
+
+import argparse
+import sys
+import time
+from random import Random
+
+from cocotbext.obi import (
+    MemoryRegion,
+    MockBus,
+    MockSim,
+    ObiDevice,
+    ObiHost,
+    ObiMonitor,
+    ObiOp,
+    ObiProtocolChecker,
+    ObiScoreboard,
+)
+
+SCENARIOS = ("writes", "reads", "mixed", "mixed_bp", "mixed_checked", "batch")
+
+
+def run(scenario: str, beats: int) -> tuple[int, float]:
+    """Run *beats* transfers of *scenario*; return (cycles, wall seconds)."""
+    with MockSim() as sim:
+        bus = MockBus(sim)
+        host = ObiHost(bus, sim.clock, seednum=1)
+        ObiDevice(bus, sim.clock, target=MemoryRegion(2**20), max_outstanding=4)
+        if scenario == "mixed_bp":
+            host.enable_backpressure()
+        if scenario == "mixed_checked":
+            monitor = ObiMonitor(bus, sim.clock)
+            monitor.start()
+            ObiScoreboard(monitor)
+            ObiProtocolChecker(bus, sim.clock)
+        rng = Random(1)
+
+        async def traffic():
+            if scenario == "batch":
+                ops = [
+                    (
+                        ObiOp(rng.randrange(2**18) * 4, i & 0xFFFFFFFF, write=True)
+                        if i % 2 == 0
+                        else ObiOp(rng.randrange(2**18) * 4)
+                    )
+                    for i in range(beats)
+                ]
+                await host.submit(ops)
+                return
+            for i in range(beats):
+                addr = rng.randrange(2**18) * 4
+                if scenario == "writes" or (
+                    scenario.startswith("mixed") and i % 2 == 0
+                ):
+                    host.write_nowait(addr, i & 0xFFFFFFFF)
+                else:
+                    host.read_nowait(addr)
+            await host.wait()
+
+        start = time.perf_counter()
+        sim.run_until(traffic())
+        return sim.cycle, time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--beats", type=int, default=10000)
+    parser.add_argument("--scenario", choices=SCENARIOS, nargs="+", default=SCENARIOS)
+    args = parser.parse_args()
+    for scenario in args.scenario:
+        cycles, seconds = run(scenario, args.beats)
+        print(
+            f"{scenario:14} {args.beats} beats {cycles} cycles {seconds:.2f}s "
+            f"{args.beats / seconds:9.0f} beats/s {cycles / seconds:9.0f} cycles/s"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
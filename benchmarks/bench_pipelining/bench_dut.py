@@ -0,0 +1,139 @@
+"""Host/device/monitor throughput over the test_pipelining loopback"""
+
+from random import randint
+
+from cocotb import test
+
+from benchlib.throughput import BEATS, Throughput
+from interfaces.clkrst import ClkReset
+
+from cocotbext.obi import MemoryRegion
+from cocotbext.obi import ObiBus
+from cocotbext.obi import ObiCoverageCollector
+from cocotbext.obi import ObiDevice
+from cocotbext.obi import ObiHost
+from cocotbext.obi import ObiMonitor
+from cocotbext.obi import ObiProtocolChecker
+from cocotbext.obi import ObiScoreboard
+
+SUITE = "pipelining"
+
+
+class testbench:
+    def __init__(self, dut, max_outstanding=4, period=10):
+        self.period = period
+        self.cr = ClkReset(dut, period, reset_sense=1, resetname="rst")
+        self.dut = dut
+
+        self.sbus = ObiBus.from_prefix(dut, "s_obi")
+        self.mbus = ObiBus.from_prefix(dut, "m_obi")
+
+        self.m = ObiHost(self.sbus, dut.clk, max_outstanding=max_outstanding)
+        self.s = ObiDevice(self.mbus, dut.clk, max_outstanding=max_outstanding)
+        self.s.target = MemoryRegion(2**16)
+
+
+def queue_traffic(tb, kind, beats):
+    """Queue *beats* writes, reads or a random mix on the host."""
+    for i in range(beats):
+        addr = (i * 4) & 0xFFFC
+        if kind == "write" or (kind == "mixed" and randint(0, 1)):
+            tb.m.write_nowait(addr, i)
+        else:
+            tb.m.read_nowait(addr)
+
+
+async def run(dut, name, kind, backpressure=False, logging=False, checking=False):
+    tb = testbench(dut)
+    if checking:
+        monitor = ObiMonitor(tb.sbus, dut.clk)
+        monitor.start()
+        ObiScoreboard(monitor)
+        ObiProtocolChecker(tb.sbus, dut.clk)
+        ObiCoverageCollector(tb.sbus, dut.clk)
+    if logging:
+        tb.m.enable_logging()
+        tb.s.enable_logging()
+    if backpressure:
+        tb.m.enable_backpressure(seednum=1)
+        tb.s.enable_backpressure(seednum=2)
+
+    await tb.cr.wait_clkn(20)
+
+    bench = Throughput(
+        SUITE,
+        name,
+        tb.period,
+        kind=kind,
+        backpressure=backpressure,
+        logging=logging,
+        checking=checking,
+    )
+    bench.start()
+    queue_traffic(tb, kind, BEATS)
+    await tb.m.wait()
+    bench.stop(BEATS)
+
+    await tb.cr.end_test(10)
+
+
+async def run_blocking(dut, name):
+    tb = testbench(dut, max_outstanding=1)
+    await tb.cr.wait_clkn(20)
+
+    bench = Throughput(SUITE, name, tb.period, kind="blocking")
+    bench.start()
+    for i in range(BEATS // 2):
+        await tb.m.write(i * 4, i)
+        await tb.m.read(i * 4, i)
+    bench.stop(BEATS // 2 * 2)
+
+    await tb.cr.end_test(10)
+
+
+@test()
+async def bench_write(dut):
+    await run(dut, "write", "write")
+
+
+@test()
+async def bench_read(dut):
+    await run(dut, "read", "read")
+
+
+@test()
+async def bench_mixed(dut):
+    await run(dut, "mixed", "mixed")
+
+
+@test()
+async def bench_write_backpressure(dut):
+    await run(dut, "write_backpressure", "write", backpressure=True)
+
+
+@test()
+async def bench_read_backpressure(dut):
+    await run(dut, "read_backpressure", "read", backpressure=True)
+
+
+@test()
+async def bench_mixed_backpressure(dut):
+    await run(dut, "mixed_backpressure", "mixed", backpressure=True)
+
+
+@test()
+async def bench_mixed_logging(dut):
+    """Host and device debug logging enabled"""
+    await run(dut, "mixed_logging", "mixed", logging=True)
+
+
+@test()
+async def bench_mixed_checking(dut):
+    """Monitor, scoreboard, protocol checker and coverage attached"""
+    await run(dut, "mixed_checking", "mixed", backpressure=True, checking=True)
+
+
+@test()
+async def bench_blocking(dut):
+    """One awaited write() then read() at a time"""
+    await run_blocking(dut, "blocking")
@@ -0,0 +1,74 @@
+"""Throughput measurement and JSON reporting for the benchmarks"""
+
+import json
+import os
+import platform
+import time
+from datetime import datetime, timezone
+
+import cocotb
+from cocotb.utils import get_sim_time
+
+from cocotbext.obi import __version__
+
+# Where results are written, and how many beats each scenario runs
+OUTPUT = os.environ.get("BENCH_OUTPUT", "bench_results.json")
+BEATS = int(os.environ.get("BENCH_BEATS", "2000"))
+
+_results: list[dict] = []
+
+
+def _metadata() -> dict:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "simulator": cocotb.SIM_NAME,
+        "simulator_version": cocotb.SIM_VERSION,
+        "cocotb": cocotb.__version__,
+        "cocotbext_obi": __version__,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "seed": cocotb.RANDOM_SEED,
+    }
+
+
+class Throughput:
+    """Time one scenario in wall-clock and simulated time.
+
+    Call :meth:`start` just before the traffic and :meth:`stop` once it has
+    completed; the result is appended to the JSON report straight away, so
+    the file is complete even if a later scenario fails.
+    """
+
+    def __init__(self, suite: str, name: str, period: int = 10, **params) -> None:
+        self.suite = suite
+        self.name = name
+        self.period = period
+        self.params = params
+        self._wall = 0.0
+        self._sim = 0
+
+    def start(self) -> None:
+        self._sim = get_sim_time("ns")
+        self._wall = time.perf_counter()
+
+    def stop(self, beats: int) -> dict:
+        wall = time.perf_counter() - self._wall
+        cycles = int((get_sim_time("ns") - self._sim) // self.period)
+        result = {
+            "suite": self.suite,
+            "name": self.name,
+            "params": self.params,
+            "beats": beats,
+            "cycles": cycles,
+            "wall_s": round(wall, 6),
+            "beats_per_s": round(beats / wall, 1),
+            "cycles_per_s": round(cycles / wall, 1),
+        }
+        _results.append(result)
+        with open(OUTPUT, "w") as f:
+            json.dump({"meta": _metadata(), "results": _results}, f, indent=1)
+        cocotb.log.info(
+            f"{self.suite}.{self.name}: {beats} beats in {cycles} cycles, "
+            f"{wall:.3f}s wall, {result['beats_per_s']:.0f} beats/s"
+        )
+        return result
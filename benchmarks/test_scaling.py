@@ -0,0 +1,207 @@
+"""Scaling micro-benchmarks for the memory and address-map classes (no simulator).
+
+Each test times a workload at size ``n`` and ``FACTOR * n`` (best of
+``REPEAT`` runs) and bounds the ratio: a workload with O(1) or O(log n)
+cost per operation grows about ``FACTOR`` times, a quadratic one about
+``FACTOR**2`` times. ``SLACK`` absorbs log factors and timer noise.
+
+Set ``BENCH_SCALE`` to run larger (or smaller) sizes.
+"""
+
+import asyncio
+import os
+import time
+from random import Random
+
+from cocotbext.obi import (
+    AddressMap,
+    AddressSpace,
+    BuddyAllocator,
+    MemoryRegion,
+    SparseMemory,
+)
+
+SCALE = float(os.environ.get("BENCH_SCALE", "1"))
+FACTOR = 8
+SLACK = 3
+REPEAT = 3
+
+
+def _n(n):
+    return max(1, int(n * SCALE))
+
+
+def _best(run, n):
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        run(n)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _growth(run, n):
+    """Time ratio of ``run(FACTOR * n)`` to ``run(n)``."""
+    run(n)  # warm up
+    return _best(run, FACTOR * n) / _best(run, n)
+
+
+def _linear(run, n):
+    ratio = _growth(run, n)
+    assert ratio < FACTOR * SLACK, f"{FACTOR}x the work took {ratio:.1f}x the time"
+
+
+def _constant(run, n):
+    ratio = _growth(run, n)
+    assert ratio < SLACK, f"{FACTOR}x the size took {ratio:.1f}x the time"
+
+
+# SparseMemory
+
+
+def test_sparse_memory_scattered_words():
+    """Word accesses scattered over 4 GiB cost the same however many blocks exist."""
+
+    def run(n):
+        mem = SparseMemory(2**32)
+        rng = Random(1)
+        for _ in range(n):
+            addr = rng.randrange(0, 2**32, 4)
+            mem.write(addr, b"\x01\x02\x03\x04")
+            mem.read(addr, 4)
+
+    _linear(run, _n(4000))
+
+
+def test_sparse_memory_footprint():
+    """Only touched 4 KiB blocks are stored, whatever the memory size."""
+    mem = SparseMemory(2**40)
+    for i in range(_n(1000)):
+        mem.write(i * 2**28, b"\xff")
+    assert len(mem.segs) == _n(1000)
+
+
+def test_sparse_memory_bulk_copy():
+    def run(n):
+        mem = SparseMemory(2**32)
+        data = bytes(range(256)) * (n // 256)
+        mem.write(0x1000_0000, data)
+        assert mem.read(0x1000_0000, len(data)) == data
+
+    _linear(run, _n(2**18))
+
+
+# MemoryRegion
+
+
+def test_memory_region_access_independent_of_size():
+    def run(n):
+        region = MemoryRegion(n * 4096)
+
+        async def traffic():
+            for i in range(2000):
+                addr = (i * 4099 * 4) % (n * 4096 - 4)
+                await region.write(addr, b"abcd")
+                await region.read(addr, 4)
+
+        asyncio.run(traffic())
+
+    _constant(run, _n(256))
+
+
+# AddressSpace
+
+
+def _space(n):
+    space = AddressSpace(2**32)
+    for i in range(n):
+        space.register_region(MemoryRegion(256), i * 256)
+    return space
+
+
+def test_address_space_register_regions():
+    _linear(_space, _n(250))
+
+
+def test_address_space_access_independent_of_region_count():
+    spaces = {}
+
+    def run(n):
+        space = spaces.get(n) or spaces.setdefault(n, _space(n))
+        rng = Random(1)
+
+        async def traffic():
+            for _ in range(500):
+                addr = rng.randrange(n) * 256
+                await space.write(addr, b"abcd")
+                await space.read(addr, 4)
+
+        asyncio.run(traffic())
+
+    _constant(run, _n(250))
+
+
+# BuddyAllocator
+
+
+def _allocator(n):
+    return BuddyAllocator(1 << (64 * n).bit_length(), 16)
+
+
+def test_buddy_allocate_then_free_in_order():
+    def run(n):
+        alloc = _allocator(n)
+        blocks = [alloc.alloc(16) for _ in range(n)]
+        for block in blocks:
+            alloc.free(block)
+
+    _linear(run, _n(12500))
+
+
+def test_buddy_random_sizes_and_free_order():
+    def run(n):
+        alloc = _allocator(n)
+        rng = Random(1)
+        blocks = [alloc.alloc(rng.choice((16, 32, 64))) for _ in range(n)]
+        rng.shuffle(blocks)
+        for block in blocks[: n // 2]:
+            alloc.free(block)
+        for _ in range(n // 2):
+            alloc.alloc(16)
+
+    _linear(run, _n(4000))
+
+
+# AddressMap
+
+
+def _addrmap(n):
+    am = AddressMap(word_bytes=4)
+    am.add({f"REG{i}": 4 * i for i in range(n)})
+    return am
+
+
+def test_addrmap_build():
+    _linear(_addrmap, _n(1250))
+
+
+def test_addrmap_resolve_independent_of_map_size():
+    maps = {}
+
+    def run(n):
+        am = maps.get(n) or maps.setdefault(n, _addrmap(n))
+        for i in range(2000):
+            am.resolve(f"REG{i % n}[0]")
+
+    _constant(run, _n(1250))
+
+
+def test_addrmap_format_independent_of_map_size():
+    maps = {}
+
+    def run(n):
+        am = maps.get(n) or maps.setdefault(n, _addrmap(n))
+        for i in range(200):
+            am.format(4 * (i % n))
+
+    _constant(run, _n(2500))
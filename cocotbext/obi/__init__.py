@@ -35,48 +35,102 @@ from .address_space import (
     WindowPool,
 )
 from .buddy_allocator import BuddyAllocator
-from .constants import InvalidAccess, OBIError, ObiResp
+from .constants import (
+    InvalidAccess,
+    OBIError,
+    ObiOrder,
+    ObiOrdering,
+    ObiResp,
+    ObiSampling,
+)
+from .coverage import ObiCoverage
 from .memory import Memory
+from .mock import MockBus, MockSim
 from .obi_base import ObiBase
 from .obi_bus import OBIBus, ObiBus
+from .obi_checker import ObiProtocolChecker
+from .obi_coverage import ObiCoverageCollector
 from .obi_device import ObiDevice
-from .obi_host import ObiHost
+from .obi_host import ObiBatch, ObiHost, ObiOp, ObiPollResult
 from .obi_interface import HAVE_COCOTBEXT_INTERFACE, ObiInterface
 from .obi_master import OBIMaster, ObiMaster
 from .obi_monitor import ObiMonitor, ObiTransaction
+from .obi_multi_host import ObiMultiHost
 from .obi_ram import ObiRam
+from .obi_scoreboard import ObiScoreboard
 from .obi_slave import ObiSlave
 from .sparse_memory import SparseMemory
+from .stall import (
+    FixedStall,
+    NoStall,
+    RandomStall,
+    StallDistribution,
+    StallSchedule,
+)
+from .timing_model import (
+    BandwidthLimit,
+    BankConflict,
+    CompositeTiming,
+    FixedLatency,
+    RefreshWindow,
+    RegionLatency,
+    TimingModel,
+)
 from .version import __version__
 
 __all__ = [
     "HAVE_COCOTBEXT_INTERFACE",
     "AddressMap",
     "AddressSpace",
+    "BandwidthLimit",
+    "BankConflict",
     "BuddyAllocator",
+    "CompositeTiming",
+    "FixedLatency",
+    "FixedStall",
     "InvalidAccess",
     "Memory",
     "MemoryInterface",
     "MemoryRegion",
+    "MockBus",
+    "MockSim",
+    "NoStall",
     "OBIBus",
     "OBIError",
     "OBIMaster",
     "ObiBase",
+    "ObiBatch",
     "ObiBus",
+    "ObiCoverage",
+    "ObiCoverageCollector",
     "ObiDevice",
     "ObiHost",
     "ObiInterface",
     "ObiMaster",
     "ObiMonitor",
+    "ObiMultiHost",
+    "ObiOp",
+    "ObiOrder",
+    "ObiOrdering",
+    "ObiPollResult",
+    "ObiProtocolChecker",
     "ObiRam",
     "ObiResp",
+    "ObiSampling",
+    "ObiScoreboard",
     "ObiSlave",
     "ObiTransaction",
     "PeripheralRegion",
     "Pool",
+    "RandomStall",
+    "RefreshWindow",
     "Region",
+    "RegionLatency",
     "SparseMemory",
     "SparseMemoryRegion",
+    "StallDistribution",
+    "StallSchedule",
+    "TimingModel",
     "Window",
     "WindowPool",
     "__version__",
@@ -23,6 +23,47 @@ THE SOFTWARE.
 """
 
 import re
+from bisect import bisect_right
+
+
+class _DeviceMap(dict):
+    """Name-to-address dict that counts its changes in :attr:`version`."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, name, addr):
+        self.version += 1
+        super().__setitem__(name, addr)
+
+    def __delitem__(self, name):
+        self.version += 1
+        super().__delitem__(name)
+
+    def __ior__(self, other):  # type: ignore[misc]
+        self.update(other)
+        return self
+
+    def clear(self):
+        self.version += 1
+        super().clear()
+
+    def pop(self, *args):
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self):
+        self.version += 1
+        return super().popitem()
+
+    def setdefault(self, name, addr=None):
+        self.version += 1
+        return super().setdefault(name, addr)
+
+    def update(self, *args, **kwargs):
+        self.version += 1
+        super().update(*args, **kwargs)
 
 
 class AddressMap(dict):
@@ -39,6 +80,11 @@ class AddressMap(dict):
     The object is keyed by device index (``int``). Each value is a ``dict``
     mapping register name (``str``) to byte address (``int``).
 
+    A map is copied when stored with :meth:`add`, ``am[device] = ...`` or
+    ``update()``, so later edits to the caller's dict are not seen. Edit
+    the stored copy instead (``am[device][name] = addr``); every change to
+    it is picked up by :meth:`resolve` and :meth:`format`.
+
     Parameters
     ----------
     word_bytes:
@@ -76,8 +122,23 @@ class AddressMap(dict):
         self.word_bytes = word_bytes
         self.multi_device = multi_device
         self._label_width = 10
+        # Reverse lookup index per device, see _reverse_index()
+        self._reverse = {}
+
+    def __setitem__(self, device, addrmap):
+        super().__setitem__(device, _DeviceMap(addrmap))
+
+    def update(self, *args, **kwargs):
+        for device, addrmap in dict(*args, **kwargs).items():
+            self[device] = addrmap
+
+    def setdefault(self, device, addrmap=None):
+        if device not in self:
+            self[device] = {} if addrmap is None else addrmap
+        return self[device]
 
     def add(self, addrmap, device=0):
+        """Store a copy of *addrmap* for *device* and update the label width."""
         self[device] = addrmap
         self._update_label_width()
 
@@ -99,17 +160,37 @@ class AddressMap(dict):
         if device not in self or not self[device]:
             return f"0x{addr:08x}"
 
-        best_name = None
-        best_base = -1
-        for name, base in self[device].items():
-            if addr < base or (addr - base) % self.word_bytes:
-                continue
-            if base > best_base:
-                idx = (addr - base) // self.word_bytes
-                best_name = name if idx == 0 else f"{name}[{idx}]"
-                best_base = base
-
-        return best_name if best_name is not None else f"0x{addr:08x}"
+        # The highest register base at or below addr a whole number of
+        # words away; the first name listed wins for a shared base
+        group = self._reverse_index(device).get(addr % self.word_bytes)
+        if group is not None:
+            bases, names = group
+            i = bisect_right(bases, addr) - 1
+            if i >= 0:
+                idx = (addr - bases[i]) // self.word_bytes
+                return names[i] if idx == 0 else f"{names[i]}[{idx}]"
+        return f"0x{addr:08x}"
+
+    def _reverse_index(self, device):
+        """``{base % word_bytes: (sorted bases, names)}`` for *device*.
+
+        Built on first use and rebuilt when the device's map is replaced or
+        edited.
+        """
+        device_map = self[device]
+        cached = self._reverse.get(device)
+        if cached and cached[0] is device_map and cached[1] == device_map.version:
+            return cached[2]
+        first = {}
+        for name, base in device_map.items():
+            first.setdefault(base, name)
+        index = {}
+        for base in sorted(first):
+            bases, names = index.setdefault(base % self.word_bytes, ([], []))
+            bases.append(base)
+            names.append(first[base])
+        self._reverse[device] = (device_map, device_map.version, index)
+        return index
 
     def format_col(self, label, prefix=""):
         """Pad address/register label so read/write data columns align."""
@@ -117,6 +198,7 @@ class AddressMap(dict):
         return f"{prefix}{label}".ljust(width)
 
     def _update_label_width(self):
+        self._reverse = {}
         width = 10
         for device_map in self.values():
             for name in device_map:
@@ -23,6 +23,7 @@ THE SOFTWARE.
 """
 
 import mmap
+from bisect import bisect_right, insort
 
 from .buddy_allocator import BuddyAllocator
 from .sparse_memory import SparseMemory
@@ -278,24 +279,33 @@ class PeripheralRegion(Region):
             self.obj.write(address, data, **kwargs)
 
 
+def _region_base(entry):
+    return entry[0]
+
+
 class AddressSpace(Region):
     def __init__(self, size=2**64, base=0, parent=None, **kwargs):
         super().__init__(size=size, base=base, parent=parent, **kwargs)
         self.pool_type = Pool
+        # (base, size, offset, region), sorted by base
         self.regions = []
 
     def find_regions(self, address, length=1):
-        regions = []
         if address < 0 or address >= self.size:
             raise ValueError("address out of range")
         if length < 0:
             raise ValueError("invalid length")
-        length = max(length, 1)
-        for base, size, translate, region in self.regions:
-            if address < base + size and base < address + length:
-                regions.append((base, size, translate, region))
-        regions.sort()
-        return regions
+        end = address + max(length, 1)
+        regions = self.regions
+        # Regions never overlap, so the range can only start inside the
+        # last one based at or below address
+        i = max(bisect_right(regions, address, key=_region_base) - 1, 0)
+        found = []
+        while i < len(regions) and regions[i][0] < end:
+            if address < regions[i][0] + regions[i][1]:
+                found.append(regions[i])
+            i += 1
+        return found
 
     def register_region(self, region, base, size=None, offset=0):
         if size is None:
@@ -307,7 +317,7 @@ class AddressSpace(Region):
             region._base = self.get_absolute_address(base)
         else:
             region._base = None
-        self.regions.append((base, size, offset, region))
+        insort(self.regions, (base, size, offset, region), key=_region_base)
 
     async def read(self, address, length, **kwargs):
         regions = self.find_regions(address, length)
@@ -22,14 +22,66 @@ THE SOFTWARE.
 
 """
 
+from collections import deque
+
+
+class _FreeList:
+    """Free blocks of one size, handed out oldest first.
+
+    A block removed to merge with its buddy stays queued and is dropped
+    when it reaches the front, so lookup, removal and allocation are all
+    constant time. Each entry carries the generation it was added in, so a
+    block freed again is not mistaken for its earlier, removed entry.
+    """
+
+    __slots__ = ("_gen", "_live", "_queue")
+
+    def __init__(self, blocks=()):
+        self._queue = deque()
+        self._live = {}
+        self._gen = 0
+        for block in blocks:
+            self.append(block)
+
+    def __len__(self):
+        return len(self._live)
+
+    def __contains__(self, block):
+        return block in self._live
+
+    def __iter__(self):
+        live = self._live
+        return (block for block, gen in self._queue if live.get(block) == gen)
+
+    def append(self, block):
+        self._gen += 1
+        self._live[block] = self._gen
+        self._queue.append((block, self._gen))
+
+    def remove(self, block):
+        del self._live[block]
+        if len(self._queue) > 2 * len(self._live) + 16:
+            live = self._live
+            self._queue = deque(
+                (queued, gen) for queued, gen in self._queue if live.get(queued) == gen
+            )
+
+    def popleft(self):
+        live = self._live
+        while True:
+            block, gen = self._queue.popleft()
+            if live.get(block) == gen:
+                del live[block]
+                return block
+
 
 class BuddyAllocator:
     def __init__(self, size, min_alloc=1):
         self.size = size
         self.min_alloc = min_alloc
 
-        self.free_lists = [[] for x in range((self.size - 1).bit_length())]
-        self.free_lists.append([0])
+        self.free_lists = [_FreeList() for x in range((self.size - 1).bit_length())]
+        self.free_lists.append(_FreeList([0]))
         self.allocations = {}
 
     def alloc(self, size):
@@ -49,14 +101,14 @@ class BuddyAllocator:
 
             while bucket > orig_bucket:
                 # split block
-                block = self.free_lists[bucket].pop(0)
+                block = self.free_lists[bucket].popleft()
                 bucket -= 1
                 self.free_lists[bucket].append(block)
                 self.free_lists[bucket].append(block + 2**bucket)
 
             if self.free_lists[bucket]:
                 # allocate
-                block = self.free_lists[bucket].pop(0)
+                block = self.free_lists[bucket].popleft()
                 self.allocations[block] = bucket
                 return block
 
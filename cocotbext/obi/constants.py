@@ -42,3 +42,43 @@ class ObiResp(enum.IntEnum):
 
     OKAY = 0
     ERROR = 1
+
+
+class ObiOrder(enum.Enum):
+    """Response scheduling policy for :class:`~cocotbext.obi.ObiDevice`.
+
+    ``IN_ORDER`` answers the oldest request first. ``AID`` answers the oldest
+    *ready* response, only keeping responses with the same id in order.
+    ``RANDOM`` picks at random among the ready responses that are the oldest
+    for their id.
+    """
+
+    IN_ORDER = "in_order"
+    AID = "aid"
+    RANDOM = "random"
+
+
+class ObiOrdering(enum.Enum):
+    """Read-after-write ordering for a blocking :meth:`ObiHost.read`.
+
+    ``STRICT`` waits for every earlier write to complete. ``ADDRESS`` only
+    waits for earlier writes to the bus words the read covers, so reads of
+    other addresses overlap writes still in flight. ``RELAXED`` never waits;
+    use :meth:`~cocotbext.obi.ObiHost.fence` where the order matters.
+    """
+
+    STRICT = "strict"
+    ADDRESS = "address"
+    RELAXED = "relaxed"
+
+
+class ObiSampling(enum.Enum):
+    """When an agent reads the bus for the cycle ending at a clock edge.
+
+    ``EDGE`` reads right after the rising edge, relying on writes made at the
+    edge being deferred. ``READONLY`` reads in the ReadOnly phase before the
+    edge, when every value is final, and drives only after the edge.
+    """
+
+    EDGE = "edge"
+    READONLY = "readonly"
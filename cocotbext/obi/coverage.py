@@ -0,0 +1,222 @@
+"""
+
+Copyright (c) 2024-2026 Daxzio
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+
+"""
+
+import json
+from array import array
+from collections.abc import Iterable
+from typing import Optional
+
+RESPONSES = ("read_ok", "read_err", "write_ok", "write_err")
+BACK_TO_BACK = ("RR", "RW", "WR", "WW")
+HAZARDS = ("raw_pending", "raw_next", "war_pending", "waw_pending")
+
+
+def _stall_labels(buckets: int) -> list[str]:
+    labels = ["0", "1"]
+    for i in range(2, buckets):
+        low = 1 << (i - 1)
+        labels.append(f"{low}-{2 * low - 1}")
+    labels[-1] = labels[-1].split("-")[0] + "+"
+    return labels[:buckets]
+
+
+class ObiCoverage:
+    """Functional coverage counters for OBI traffic.
+
+    Every coverpoint is a fixed array of hit counters, so memory does not
+    grow with the number of transactions and two runs are merged by adding
+    their counters. Coverpoints:
+
+    ``region``
+        Request address per region added with *regions*, plus ``other``.
+    ``be``
+        Byte-enable pattern of each request.
+    ``response``
+        Read/write response with or without ``err``.
+    ``back_to_back``
+        Kinds of two requests accepted in consecutive cycles.
+    ``hazard``
+        A read of a word with a write to it still outstanding
+        (``raw_pending``) or straight after a write to it (``raw_next``), and
+        writes to a word with a read or write to it outstanding.
+    ``outstanding``
+        Requests outstanding once a request is accepted.
+    ``gnt_stall``, ``rready_stall``
+        Cycles ``req`` waited for ``gnt`` and ``rvalid`` for ``rready``, in
+        power-of-two buckets.
+
+    :class:`~cocotbext.obi.ObiCoverageCollector` fills these in from a bus.
+
+    Parameters
+    ----------
+    regions:
+        ``(name, base, size)`` address ranges for the ``region`` coverpoint.
+    byte_lanes:
+        Data bus width in bytes. Default 4.
+    max_outstanding:
+        Deepest ``outstanding`` bin; deeper samples count there. Default 8.
+    stall_buckets:
+        Number of stall length buckets, the last one open-ended. Default 8.
+    """
+
+    def __init__(
+        self,
+        regions: Optional[Iterable[tuple[str, int, int]]] = None,
+        byte_lanes: int = 4,
+        max_outstanding: int = 8,
+        stall_buckets: int = 8,
+    ) -> None:
+        if byte_lanes < 1 or max_outstanding < 1 or stall_buckets < 2:
+            raise ValueError(
+                "need byte_lanes >= 1, max_outstanding >= 1, stall_buckets >= 2"
+            )
+        self.regions: list[tuple[str, int, int]] = []
+        for name, base, size in regions or ():
+            if size <= 0:
+                raise ValueError("region size must be positive")
+            for _, b, s in self.regions:
+                if base < b + s and b < base + size:
+                    raise ValueError(f"region {name} overlaps an earlier region")
+            self.regions.append((name, base, size))
+        self.byte_lanes = byte_lanes
+        self.max_outstanding = max_outstanding
+        self.stall_buckets = stall_buckets
+
+        stalls = _stall_labels(stall_buckets)
+        self.points: dict[str, list[str]] = {
+            "region": [name for name, _, _ in self.regions] + ["other"],
+            "be": [
+                f"0x{be:0{(byte_lanes + 3) // 4}x}" for be in range(1 << byte_lanes)
+            ],
+            "response": list(RESPONSES),
+            "back_to_back": list(BACK_TO_BACK),
+            "hazard": list(HAZARDS),
+            "outstanding": [str(n) for n in range(1, max_outstanding)]
+            + [f"{max_outstanding}+"],
+            "gnt_stall": stalls,
+            "rready_stall": list(stalls),
+        }
+        self.counts: dict[str, array] = {
+            point: array("Q", bytes(8 * len(labels)))
+            for point, labels in self.points.items()
+        }
+
+    def hit(self, point: str, index: int) -> None:
+        """Count one sample in bin *index* of *point*."""
+        self.counts[point][index] += 1
+
+    def region_index(self, addr: int) -> int:
+        for i, (_, base, size) in enumerate(self.regions):
+            if base <= addr < base + size:
+                return i
+        return len(self.regions)
+
+    def stall_index(self, cycles: int) -> int:
+        return min(cycles.bit_length(), self.stall_buckets - 1)
+
+    def outstanding_index(self, depth: int) -> int:
+        return min(depth, self.max_outstanding) - 1
+
+    def bins(self, point: str) -> dict[str, int]:
+        """Hit count of every bin of *point*, by label."""
+        return dict(zip(self.points[point], self.counts[point]))
+
+    def holes(self) -> list[tuple[str, str]]:
+        """``(point, label)`` of every bin never hit."""
+        return [
+            (point, label)
+            for point, labels in self.points.items()
+            for label, n in zip(labels, self.counts[point])
+            if not n
+        ]
+
+    @property
+    def bin_count(self) -> int:
+        return sum(len(labels) for labels in self.points.values())
+
+    @property
+    def covered(self) -> float:
+        """Fraction of bins hit at least once."""
+        return 1.0 - len(self.holes()) / self.bin_count
+
+    def clear(self) -> None:
+        for counts in self.counts.values():
+            for i in range(len(counts)):
+                counts[i] = 0
+
+    def merge(self, *others: "ObiCoverage") -> "ObiCoverage":
+        """Add the counters of *others*, which must have the same bins."""
+        for other in others:
+            if other.points != self.points:
+                raise ValueError("cannot merge coverage with different bins")
+        for other in others:
+            for point, counts in self.counts.items():
+                for i, n in enumerate(other.counts[point]):
+                    counts[i] += n
+        return self
+
+    def report(self) -> str:
+        lines = [f"OBI coverage {self.covered:.1%} of {self.bin_count} bins"]
+        for point, labels in self.points.items():
+            hit = sum(1 for n in self.counts[point] if n)
+            lines.append(f"  {point}: {hit}/{len(labels)}")
+            for label, n in zip(labels, self.counts[point]):
+                lines.append(f"    {label:>12} {n}")
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        return {
+            "regions": [list(region) for region in self.regions],
+            "byte_lanes": self.byte_lanes,
+            "max_outstanding": self.max_outstanding,
+            "stall_buckets": self.stall_buckets,
+            "counts": {point: list(counts) for point, counts in self.counts.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ObiCoverage":
+        cov = cls(
+            [tuple(region) for region in data["regions"]],
+            byte_lanes=data["byte_lanes"],
+            max_outstanding=data["max_outstanding"],
+            stall_buckets=data["stall_buckets"],
+        )
+        for point, counts in data["counts"].items():
+            if len(counts) != len(cov.points[point]):
+                raise ValueError(f"wrong number of {point} bins")
+            cov.counts[point] = array("Q", counts)
+        return cov
+
+    def save(self, path) -> None:
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path, *more) -> "ObiCoverage":
+        """Load a result saved with :meth:`save`, merging in any *more*."""
+        results = []
+        for name in (path, *more):
+            with open(name) as f:
+                results.append(cls.from_dict(json.load(f)))
+        return results[0].merge(*results[1:])
@@ -0,0 +1,465 @@
+"""
+
+Copyright (c) 2024-2026 Daxzio
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+
+"""
+
+from __future__ import annotations
+
+import sys
+from collections import deque
+from collections.abc import Coroutine, Iterable
+from types import ModuleType
+from typing import Any, Optional
+
+# Names the agent modules import from cocotb, replaced while a MockSim runs
+PATCHED = ("start_soon", "RisingEdge", "ReadOnly", "Event", "First", "get_sim_time")
+
+_UNITS = {"fs": -15, "ps": -12, "ns": -9, "us": -6, "ms": -3, "sec": 0}
+
+
+class MockValue(int):
+    """Value of a :class:`MockSignal`: an ``int`` that is never X or Z."""
+
+    is_resolvable = True
+
+
+_ZERO = MockValue(0)
+_ONE = MockValue(1)
+
+
+class MockSignal:
+    """A bus signal of *width* bits.
+
+    Like cocotb's default write scheduling, a write only takes effect once
+    every task woken in the current phase has run, and writing in the
+    ReadOnly phase raises ``RuntimeError``.
+    """
+
+    __slots__ = ("_edge", "_value", "mask", "name", "sim", "width")
+
+    def __init__(self, sim: MockSim, name: str, width: int = 1) -> None:
+        self.sim = sim
+        self.name = name
+        self.width = width
+        self.mask = (1 << width) - 1
+        self._value = _ZERO
+        # Tasks waiting for a rising edge (clock only)
+        self._edge: dict[MockTask, RisingEdge] = {}
+
+    def __len__(self) -> int:
+        return self.width
+
+    def __repr__(self) -> str:
+        return f"MockSignal({self.name}={int(self._value):#x})"
+
+    @property
+    def value(self) -> MockValue:
+        return self._value
+
+    @value.setter
+    def value(self, value: int) -> None:
+        if self.sim.readonly:
+            raise RuntimeError(f"Write to {self.name} in the ReadOnly phase")
+        self.sim._writes[self] = int(value) & self.mask
+
+
+class MockBus:
+    """Pure-Python stand-in for :class:`~cocotbext.obi.ObiBus`.
+
+    Host, device and monitors all take the same ``MockBus``, which makes it
+    a loopback: what one side drives the other samples.
+
+    Parameters
+    ----------
+    sim:
+        The :class:`MockSim` scheduling writes to the signals.
+    name:
+        Bus name, used as the signal name prefix and in the log names.
+    addr_width, data_width:
+        Widths of ``addr`` and of ``wdata``/``rdata`` in bits.
+    id_width:
+        Width of ``aid``/``rid``; ``0`` leaves them out.
+    """
+
+    def __init__(
+        self,
+        sim: MockSim,
+        name: Optional[str] = None,
+        addr_width: int = 32,
+        data_width: int = 32,
+        id_width: int = 1,
+    ) -> None:
+        self._name = name
+        self._signals: dict[str, MockSignal] = {}
+        widths = {
+            "req": 1,
+            "gnt": 1,
+            "addr": addr_width,
+            "we": 1,
+            "be": data_width // 8,
+            "wdata": data_width,
+            "rvalid": 1,
+            "rready": 1,
+            "rdata": data_width,
+            "err": 1,
+        }
+        if id_width:
+            widths.update(aid=id_width, rid=id_width)
+        for attr, width in widths.items():
+            signal = MockSignal(sim, f"{name}_{attr}" if name else attr, width)
+            setattr(self, attr, signal)
+            self._signals[attr] = signal
+
+
+class _Trigger:
+    __slots__ = ()
+
+    def __await__(self):
+        return (yield self)
+
+    def _prime(self, task: MockTask) -> None:
+        raise NotImplementedError
+
+
+class RisingEdge(_Trigger):
+    """Rising edge of the :class:`MockSim` clock."""
+
+    __slots__ = ("signal",)
+
+    def __init__(self, signal: MockSignal) -> None:
+        self.signal = signal
+
+    def _prime(self, task: MockTask) -> None:
+        if self.signal is not task.sim.clock:
+            raise NotImplementedError("MockSim only has edges on its clock")
+        self.signal._edge[task] = self
+
+
+class ReadOnly(_Trigger):
+    """The settled end of the current cycle, before the next edge."""
+
+    __slots__ = ()
+
+    def _prime(self, task: MockTask) -> None:
+        sim = task.sim
+        if sim.readonly:
+            raise RuntimeError("Already in the ReadOnly phase")
+        sim._readonly[task] = self
+
+
+class _EventWait(_Trigger):
+    __slots__ = ("event",)
+
+    def __init__(self, event: Event) -> None:
+        self.event = event
+
+    def __await__(self):
+        if self.event._set:
+            return self
+        return (yield self)
+
+    def _prime(self, task: MockTask) -> None:
+        self.event._waiters[task] = self
+
+
+class Event:
+    """Same interface as ``cocotb.triggers.Event``."""
+
+    def __init__(self, name: Optional[str] = None) -> None:
+        self.name = name
+        self._set = False
+        # One entry per task: a task waits on one trigger at a time
+        self._waiters: dict[MockTask, _EventWait] = {}
+
+    def set(self) -> None:
+        self._set = True
+        waiters, self._waiters = self._waiters, {}
+        for task, trigger in waiters.items():
+            task.sim._wake(task, trigger)
+
+    def clear(self) -> None:
+        self._set = False
+
+    def is_set(self) -> bool:
+        return self._set
+
+    def wait(self) -> _EventWait:
+        return _EventWait(self)
+
+
+class First(_Trigger):
+    """Wait for whichever of *triggers* fires first and return it."""
+
+    __slots__ = ("triggers",)
+
+    def __init__(self, *triggers: _Trigger) -> None:
+        self.triggers = triggers
+
+    def __await__(self):
+        for trigger in self.triggers:
+            if isinstance(trigger, _EventWait) and trigger.event._set:
+                return trigger
+        return (yield self)
+
+    def _prime(self, task: MockTask) -> None:
+        for trigger in self.triggers:
+            trigger._prime(task)
+
+
+class MockTask:
+    """A coroutine run by a :class:`MockSim`, like a cocotb ``Task``."""
+
+    __slots__ = ("_done", "_exception", "_result", "coro", "sim", "trigger")
+
+    def __init__(self, sim: MockSim, coro: Coroutine) -> None:
+        self.sim = sim
+        self.coro = coro
+        # What the task is blocked on; None while it runs or is ready
+        self.trigger: Optional[_Trigger] = None
+        self._done = False
+        self._result: Any = None
+        self._exception: Optional[BaseException] = None
+
+    def done(self) -> bool:
+        return self._done
+
+    def result(self) -> Any:
+        if not self._done:
+            raise RuntimeError("Task has not finished")
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def kill(self) -> None:
+        if self._done:
+            return
+        self._done = True
+        self.trigger = None
+        self.sim._tasks.discard(self)
+        # A task killing itself is closed once it yields
+        if self.sim._running is not self:
+            self.coro.close()
+
+    cancel = kill
+
+
+class MockSim:
+    """Minimal cycle-based scheduler and clock for the OBI agents.
+
+    Connect an :class:`~cocotbext.obi.ObiHost` and an
+    :class:`~cocotbext.obi.ObiDevice` through a :class:`MockBus` to run
+    them without an HDL simulator::
+
+        with MockSim() as sim:
+            bus = MockBus(sim)
+            host = ObiHost(bus, sim.clock)
+            device = ObiDevice(bus, sim.clock, target=MemoryRegion(2**16))
+
+            async def test():
+                await host.write(0x10, b"abcd")
+                assert await host.read(0x10, 4) == b"abcd"
+
+            sim.run_until(test())
+
+    While the ``with`` block is active, ``start_soon``, ``RisingEdge``,
+    ``ReadOnly``, ``Event``, ``First`` and ``get_sim_time`` in every loaded
+    ``cocotbext.obi`` module (and in *modules*) are replaced by the mock
+    versions, so agents must be created inside it; leaving it ends every
+    task. Each :meth:`step` is one clock cycle: tasks waiting for the rising
+    edge run, their writes are applied, then tasks waiting for
+    :class:`ReadOnly` run.
+
+    Parameters
+    ----------
+    period:
+        Clock period in *unit*, for :meth:`get_sim_time`.
+    unit:
+        Time unit of *period*.
+    modules:
+        Extra modules to patch, e.g. a test module that imports triggers
+        from cocotb.
+    """
+
+    def __init__(
+        self, period: int = 10, unit: str = "ns", modules: Iterable[ModuleType] = ()
+    ) -> None:
+        if unit not in _UNITS:
+            raise ValueError(f"Unknown time unit {unit!r}")
+        self.period = period
+        self.unit = unit
+        self.modules = list(modules)
+        self.clock = MockSignal(self, "clk")
+        self.cycle = 0
+        self.readonly = False
+        self._ready: deque[tuple[MockTask, Optional[_Trigger]]] = deque()
+        self._readonly: dict[MockTask, ReadOnly] = {}
+        self._writes: dict[MockSignal, int] = {}
+        self._running: Optional[MockTask] = None
+        self._error: Optional[BaseException] = None
+        self._saved: list[tuple[ModuleType, str, Any]] = []
+        self._tasks: set[MockTask] = set()
+
+    def __enter__(self) -> MockSim:  # noqa: PYI034
+        if self._saved:
+            raise RuntimeError("MockSim is already active")
+        replacements = {
+            "start_soon": self.start_soon,
+            "RisingEdge": RisingEdge,
+            "ReadOnly": ReadOnly,
+            "Event": Event,
+            "First": First,
+            "get_sim_time": self.get_sim_time,
+        }
+        modules = [
+            module
+            for name, module in list(sys.modules.items())
+            if name.startswith("cocotbext.obi.") and name != __name__
+        ]
+        for module in modules + self.modules:
+            namespace = vars(module)
+            for attr, value in replacements.items():
+                if attr in namespace:
+                    self._saved.append((module, attr, namespace[attr]))
+                    setattr(module, attr, value)
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        for task in list(self._tasks):
+            task.kill()
+        while self._saved:
+            module, attr, value = self._saved.pop()
+            setattr(module, attr, value)
+
+    def start_soon(self, coro: Coroutine) -> MockTask:
+        """Schedule *coro* to start in the current phase."""
+        task = MockTask(self, coro)
+        self._tasks.add(task)
+        self._ready.append((task, None))
+        return task
+
+    def get_sim_time(self, unit: str = "step") -> float:
+        """Time at the current cycle; ``"step"`` is the unit of *period*."""
+        time = self.cycle * self.period
+        if unit in ("step", self.unit):
+            return time
+        return time * 10.0 ** (_UNITS[self.unit] - _UNITS[unit])
+
+    def step(self) -> None:
+        """Advance one clock cycle."""
+        self._settle()
+        self.cycle += 1
+        clock = self.clock
+        clock._value = _ONE
+        edge, clock._edge = clock._edge, {}
+        for task, edge_trigger in edge.items():
+            self._wake(task, edge_trigger)
+        self._settle()
+        if self._readonly:
+            waiters, self._readonly = self._readonly, {}
+            self.readonly = True
+            try:
+                for task, trigger in waiters.items():
+                    self._wake(task, trigger)
+                self._run_ready()
+            finally:
+                self.readonly = False
+        clock._value = _ZERO
+        self._raise()
+
+    def run(self, cycles: int) -> None:
+        """Advance *cycles* clock cycles."""
+        for _ in range(cycles):
+            self.step()
+
+    def run_until(self, coro: Coroutine, max_cycles: int = 1_000_000) -> Any:
+        """Run until *coro* finishes and return its result.
+
+        Raises ``TimeoutError`` if it is still running after *max_cycles*,
+        and re-raises any exception from *coro* or a background task.
+        """
+        task = self.start_soon(coro)
+        self._settle()
+        self._raise()
+        for _ in range(max_cycles):
+            if task._done:
+                break
+            self.step()
+        else:
+            if not task._done:
+                task.kill()
+                raise TimeoutError(f"Not finished after {max_cycles} cycles")
+        return task.result()
+
+    def _raise(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _wake(self, task: MockTask, trigger: _Trigger) -> None:
+        armed = task.trigger
+        if armed is not trigger and not (
+            type(armed) is First and trigger in armed.triggers
+        ):
+            # Stale: the task has moved on since it registered
+            return
+        task.trigger = None
+        self._ready.append((task, trigger))
+
+    def _run_ready(self) -> None:
+        ready = self._ready
+        while ready:
+            task, trigger = ready.popleft()
+            if task._done:
+                continue
+            self._running = task
+            try:
+                armed = task.coro.send(trigger)
+            except StopIteration as stop:
+                self._tasks.discard(task)
+                task._done = True
+                task._result = stop.value
+                continue
+            except Exception as error:  # noqa: BLE001 - fails the run, as in cocotb
+                self._tasks.discard(task)
+                task._done = True
+                task._exception = error
+                if self._error is None:
+                    self._error = error
+                continue
+            finally:
+                self._running = None
+            if task._done:
+                task.coro.close()
+                continue
+            if not isinstance(armed, _Trigger):
+                task.kill()
+                raise TypeError(f"MockSim cannot wait on {armed!r}")
+            task.trigger = armed
+            armed._prime(task)
+
+    def _settle(self) -> None:
+        self._run_ready()
+        writes = self._writes
+        if writes:
+            self._writes = {}
+            for signal, value in writes.items():
+                signal._value = MockValue(value)
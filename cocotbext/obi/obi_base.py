@@ -2,17 +2,35 @@
 Base class for OBI drivers
 """
 
+import json
 import logging
-from random import randint, seed
+from collections.abc import Callable
+from random import Random, randint
+from typing import Optional, TypeVar, Union
 
+from cocotb.triggers import ReadOnly, RisingEdge
+
+from .constants import ObiSampling
+from .stall import CHANNELS, RandomStall, StallSchedule
 from .utils import resolve_x_int
 
+_T = TypeVar("_T")
+
 
 class ObiBase:
-    def __init__(self, bus, clock, name="monitor", seednum=None, **kwargs) -> None:
+    def __init__(
+        self,
+        bus,
+        clock,
+        name="monitor",
+        seednum=None,
+        sampling: Union[ObiSampling, str] = ObiSampling.EDGE,
+        **kwargs,
+    ) -> None:
         self.name = name
         self.bus = bus
         self.clock = clock
+        self.sampling = ObiSampling(sampling)
         if bus._name:
             self.log = logging.getLogger(f"cocotb.obi_{name}.{bus._name}")
         else:
@@ -51,9 +69,30 @@ class ObiBase:
             self.base_seed = seednum
         else:
             self.base_seed = randint(0, 0xFFFFFF)
-        seed(self.base_seed)
+        # Each agent owns its stream, so stalls don't depend on other agents
+        self.rng = Random(self.base_seed)
+        self.stall: dict[str, Callable[[Random], int]] = {
+            "req": RandomStall(),
+            "gnt": RandomStall(),
+            "rready": RandomStall(),
+            "rvalid": RandomStall(low=0),
+        }
         self.log.debug(f"Seed is set to {self.base_seed}")
 
+    async def _sample_cycle(self, sample: Callable[[], _T]) -> _T:
+        """Return ``sample()`` for the cycle ending at the next rising edge.
+
+        With :attr:`ObiSampling.READONLY` the bus is read in the ReadOnly
+        phase before the edge; either way the caller may drive on return.
+        """
+        if self.sampling is ObiSampling.READONLY:
+            await ReadOnly()
+            value = sample()
+            await RisingEdge(self.clock)
+            return value
+        await RisingEdge(self.clock)
+        return sample()
+
     @property
     def backpressure(self) -> bool:
         """True if any channel backpressure is enabled."""
@@ -64,34 +103,70 @@ class ObiBase:
             or self.backpressure_rvalid
         )
 
-    def _stall_cycles(self, enabled: bool) -> int:
-        """Random stall length, or 0, when *enabled* is true."""
+    def _stall_cycles(self, enabled: bool, channel: str) -> int:
+        """Stall length for *channel*, or 0, when *enabled* is true."""
         if not enabled:
             return 0
-        if 0 == randint(0, 0x3):
-            return randint(1, 0x8)
-        return 0
+        return self.stall[channel](self.rng)
+
+    def set_stall(self, channel: str, distribution: Callable[[Random], int]) -> None:
+        """Set the stall length distribution for *channel*.
+
+        *channel* is ``req``, ``gnt``, ``rready`` or ``rvalid``. Backpressure
+        must still be enabled for the channel with :meth:`enable_backpressure`::
+
+            host.set_stall("req", RandomStall(probability=0.5, high=2))
+            host.enable_backpressure(req=True)
+        """
+        if channel not in CHANNELS:
+            raise ValueError(f"Unknown channel {channel!r}, expected one of {CHANNELS}")
+        self.stall[channel] = distribution
+
+    def precompute_stalls(
+        self, length: int = 4096, channels: Optional[list[str]] = None
+    ) -> None:
+        """Replace the stall distributions with precomputed schedules.
+
+        *length* stalls are drawn for each of *channels* (default all) from the
+        current distribution using this agent's random stream, then replayed
+        in a loop. Save them with :meth:`save_stalls` to reproduce a run.
+        """
+        for channel in channels or CHANNELS:
+            self.stall[channel] = StallSchedule.generate(
+                self.stall[channel], length, self.rng
+            )
+
+    def save_stalls(self, path) -> None:
+        """Write the precomputed stall schedules of this agent to *path*."""
+        schedules = {
+            channel: dist.to_hex()
+            for channel, dist in self.stall.items()
+            if isinstance(dist, StallSchedule)
+        }
+        with open(path, "w") as f:
+            json.dump({"seed": self.base_seed, "stalls": schedules}, f, indent=1)
+
+    def load_stalls(self, path) -> None:
+        """Replay stall schedules written by :meth:`save_stalls`."""
+        with open(path) as f:
+            saved = json.load(f)
+        for channel, text in saved["stalls"].items():
+            self.set_stall(channel, StallSchedule.from_hex(text))
 
     @property
-    def delay(self):
+    def delay(self) -> int:
         """Cycles to postpone rvalid after a grant (device response delay)."""
-        if self.backpressure_rvalid:
-            if 0 == randint(0, 0x3):
-                return randint(0, 0x8)
-            else:
-                return 0
-        else:
-            return 0
+        return self._stall_cycles(self.backpressure_rvalid, "rvalid")
 
     @property
     def gnt_delay(self) -> int:
         """Cycles to hold gnt low after req, or 0 to grant immediately."""
-        return self._stall_cycles(self.backpressure_gnt)
+        return self._stall_cycles(self.backpressure_gnt, "gnt")
 
     @property
     def req_delay(self) -> int:
         """Cycles to wait before asserting req, or 0 to issue immediately."""
-        return self._stall_cycles(self.backpressure_req)
+        return self._stall_cycles(self.backpressure_req, "req")
 
     def enable_logging(self):
         self.log.setLevel(logging.DEBUG)
@@ -118,10 +193,13 @@ class ObiBase:
             host.enable_backpressure(req=True)             # A-channel gaps
             host.enable_backpressure(rready=True)          # R-channel stalls
             host.enable_backpressure(req=True, rready=False)
+
+        *seednum* reseeds this agent's own random stream only. Use
+        :meth:`set_stall` to change the stall length distribution.
         """
         if seednum is not None:
             self.base_seed = seednum
-            seed(seednum)
+            self.rng.seed(seednum)
         specified = {
             "req": req,
             "rready": rready,
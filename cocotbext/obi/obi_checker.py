@@ -0,0 +1,185 @@
+"""
+
+Copyright (c) 2024-2026 Daxzio
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from cocotb import start_soon
+
+from .obi_base import ObiBase
+from .obi_bus import ObiBus
+
+RULES = (
+    "req_retracted",
+    "req_unstable",
+    "rvalid_retracted",
+    "resp_unstable",
+    "resp_without_req",
+)
+
+
+def _bit(sig) -> bool:
+    value = sig.value
+    return value.is_resolvable and int(value) == 1
+
+
+class ObiProtocolChecker(ObiBase):
+    """Cycle-by-cycle OBI protocol assertions for one bus.
+
+    Rules, counted in :attr:`violations`:
+
+    ``req_retracted``
+        ``req`` dropped before ``gnt``.
+    ``req_unstable``
+        ``addr``, ``we``, ``be``, ``wdata`` or ``aid`` changed while ``req``
+        was waiting for ``gnt``.
+    ``rvalid_retracted``
+        ``rvalid`` dropped before ``rready``.
+    ``resp_unstable``
+        ``rdata``, ``err`` or ``rid`` changed while ``rvalid`` was waiting
+        for ``rready``.
+    ``resp_without_req``
+        A response was taken with no accepted request outstanding.
+
+    The bus is read once per clock and the state is a handful of fields,
+    whatever the traffic, so a checker can stay attached to every port.
+    Only the first violation of each rule is logged.
+
+    Parameters
+    ----------
+    bus, clock:
+        OBI bus and clock.
+    autostart:
+        Start checking immediately. Default ``True``.
+    """
+
+    def __init__(
+        self, bus: ObiBus, clock: Any, autostart: bool = True, **kwargs
+    ) -> None:
+        super().__init__(bus, clock, name="checker", **kwargs)
+
+        a_names = ["addr", "we", "be", "wdata"] + (["aid"] if self.has_aid else [])
+        r_names = ["rdata", "err"] + (["rid"] if self.has_rid else [])
+        self._a_fields = [getattr(self.bus, name) for name in a_names]
+        self._r_fields = [getattr(self.bus, name) for name in r_names]
+
+        self.violations: dict[str, int] = dict.fromkeys(RULES, 0)
+        self.cycles = 0
+        self.outstanding = 0
+        # Payload of a request waiting for gnt / a response waiting for rready
+        self._a_wait: Optional[tuple] = None
+        self._r_wait: Optional[tuple] = None
+
+        self._run_coroutine_obj: Any = None
+        if autostart:
+            self.start()
+
+    def start(self) -> None:
+        """(Re)start checking, forgetting any partial handshake."""
+        self.stop()
+        self._a_wait = None
+        self._r_wait = None
+        self._run_coroutine_obj = start_soon(self._run())
+
+    def stop(self) -> None:
+        if self._run_coroutine_obj is not None:
+            self._run_coroutine_obj.kill()
+            self._run_coroutine_obj = None
+
+    def clear(self) -> None:
+        """Reset the violation counts."""
+        self.violations = dict.fromkeys(RULES, 0)
+        self.cycles = 0
+
+    @property
+    def violation_count(self) -> int:
+        return sum(self.violations.values())
+
+    def assert_clean(self) -> None:
+        """Raise ``AssertionError`` listing the rules that were violated."""
+        failed = {rule: n for rule, n in self.violations.items() if n}
+        if failed:
+            summary = ", ".join(f"{rule}={n}" for rule, n in failed.items())
+            raise AssertionError(f"OBI protocol violations: {summary}")
+
+    async def _run(self) -> None:
+        while True:
+            self._check(*await self._sample_cycle(self._sample))
+
+    def _sample(self) -> tuple:
+        bus = self.bus
+        req = _bit(bus.req)
+        gnt = _bit(bus.gnt)
+        rvalid = _bit(bus.rvalid)
+        rready = _bit(bus.rready)
+        # The payloads are only needed while a handshake is pending
+        a = None
+        if (req and not gnt) or self._a_wait is not None:
+            a = tuple(sig.value for sig in self._a_fields)
+        r = None
+        if (rvalid and not rready) or self._r_wait is not None:
+            r = tuple(sig.value for sig in self._r_fields)
+        return req, gnt, a, rvalid, rready, r
+
+    def _check(
+        self,
+        req: bool,
+        gnt: bool,
+        a: Optional[tuple],
+        rvalid: bool,
+        rready: bool,
+        r: Optional[tuple],
+    ) -> None:
+        """Apply the rules to one cycle of sampled handshakes and payloads."""
+        self.cycles += 1
+
+        if self._a_wait is not None:
+            if not req:
+                self._violation("req_retracted")
+            elif a != self._a_wait:
+                self._violation("req_unstable")
+        self._a_wait = a if req and not gnt else None
+
+        if self._r_wait is not None:
+            if not rvalid:
+                self._violation("rvalid_retracted")
+            elif r != self._r_wait:
+                self._violation("resp_unstable")
+        self._r_wait = r if rvalid and not rready else None
+
+        # A response comes at the earliest one cycle after its grant
+        if rvalid and rready:
+            if self.outstanding:
+                self.outstanding -= 1
+            else:
+                self._violation("resp_without_req")
+        if req and gnt:
+            self.outstanding += 1
+
+    def _violation(self, rule: str) -> None:
+        count = self.violations[rule]
+        self.violations[rule] = count + 1
+        if count == 0:
+            self.log.error(f"OBI protocol violation {rule} in cycle {self.cycles}")
@@ -0,0 +1,199 @@
+"""
+
+Copyright (c) 2024-2026 Daxzio
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, Optional
+
+from cocotb import start_soon
+
+from .coverage import ObiCoverage
+from .obi_base import ObiBase
+from .obi_bus import ObiBus
+from .obi_checker import _bit
+
+# Bins of the "hazard" coverpoint, in the order of coverage.HAZARDS
+_RAW_PENDING, _RAW_NEXT, _WAR_PENDING, _WAW_PENDING = range(4)
+
+
+class ObiCoverageCollector(ObiBase):
+    """Passive monitor that counts OBI traffic into an :class:`ObiCoverage`.
+
+    The bus is read once per clock. Besides the counters, the only state is
+    one entry per outstanding request, used to pair responses (by ``rid``
+    where the bus has one) and to spot hazards.
+
+    Parameters
+    ----------
+    bus, clock:
+        OBI bus and clock.
+    coverage:
+        Counters to add to, e.g. one shared by several ports. By default a
+        new :class:`ObiCoverage` sized for the bus.
+    autostart:
+        Start collecting immediately. Default ``True``.
+    """
+
+    def __init__(
+        self,
+        bus: ObiBus,
+        clock: Any,
+        coverage: Optional[ObiCoverage] = None,
+        autostart: bool = True,
+        **kwargs,
+    ) -> None:
+        super().__init__(bus, clock, name="coverage", **kwargs)
+        if coverage is None:
+            coverage = ObiCoverage(byte_lanes=self.byte_lanes)
+        self.coverage = coverage
+
+        self.cycles = 0
+        self.outstanding = 0
+        self._reset_state()
+
+        self._run_coroutine_obj: Any = None
+        if autostart:
+            self.start()
+
+    def _reset_state(self) -> None:
+        self.outstanding = 0
+        self._gnt_wait = 0
+        self._rready_wait = 0
+        # (word, we) and cycle of the last accepted request
+        self._last: Optional[tuple[int, bool]] = None
+        self._last_cycle = -2
+        # Outstanding (word, we) per id, and per-word counts of them
+        self._pending: dict[int, deque[tuple[int, bool]]] = {}
+        self._pending_reads: dict[int, int] = {}
+        self._pending_writes: dict[int, int] = {}
+
+    def start(self) -> None:
+        """(Re)start collecting, forgetting any outstanding requests."""
+        self.stop()
+        self._reset_state()
+        self._run_coroutine_obj = start_soon(self._run())
+
+    def stop(self) -> None:
+        if self._run_coroutine_obj is not None:
+            self._run_coroutine_obj.kill()
+            self._run_coroutine_obj = None
+
+    async def _run(self) -> None:
+        while True:
+            self._observe(*await self._sample_cycle(self._sample))
+
+    def _sample(self) -> tuple:
+        bus = self.bus
+        req = _bit(bus.req)
+        gnt = _bit(bus.gnt)
+        rvalid = _bit(bus.rvalid)
+        rready = _bit(bus.rready)
+        a = None
+        if req and gnt:
+            a = (
+                self.sig_int(bus.addr),
+                _bit(bus.we),
+                self.sig_int(bus.be),
+                self.read_aid(),
+            )
+        r = None
+        if rvalid and rready:
+            r = (_bit(bus.err), self.sig_int(bus.rid) if self.has_rid else 0)
+        return req, gnt, a, rvalid, rready, r
+
+    def _observe(
+        self,
+        req: bool,
+        gnt: bool,
+        a: Optional[tuple],
+        rvalid: bool,
+        rready: bool,
+        r: Optional[tuple],
+    ) -> None:
+        """Count one cycle of sampled handshakes.
+
+        *a* is ``(addr, we, be, aid)`` of a request accepted this cycle and
+        *r* is ``(err, rid)`` of a response taken this cycle.
+        """
+        self.cycles += 1
+        cov = self.coverage
+        # A response taken this cycle belongs to a request accepted earlier
+        if rvalid:
+            if rready:
+                cov.hit("rready_stall", cov.stall_index(self._rready_wait))
+                self._rready_wait = 0
+                if r is not None:
+                    self._response(*r)
+            else:
+                self._rready_wait += 1
+        if req:
+            if gnt:
+                cov.hit("gnt_stall", cov.stall_index(self._gnt_wait))
+                self._gnt_wait = 0
+                if a is not None:
+                    self._request(*a)
+            else:
+                self._gnt_wait += 1
+
+    def _request(self, addr: int, we: bool, be: int, aid: int) -> None:
+        cov = self.coverage
+        word = addr // self.byte_lanes
+        cov.hit("region", cov.region_index(addr))
+        cov.hit("be", be)
+        if self._last is not None and self._last_cycle == self.cycles - 1:
+            cov.hit("back_to_back", 2 * self._last[1] + we)
+        if we:
+            if self._pending_reads.get(word):
+                cov.hit("hazard", _WAR_PENDING)
+            if self._pending_writes.get(word):
+                cov.hit("hazard", _WAW_PENDING)
+        else:
+            if self._pending_writes.get(word):
+                cov.hit("hazard", _RAW_PENDING)
+            if self._last == (word, True):
+                cov.hit("hazard", _RAW_NEXT)
+        self._last = (word, we)
+        self._last_cycle = self.cycles
+
+        key = aid if self.has_rid else 0
+        self._pending.setdefault(key, deque()).append((word, we))
+        counts = self._pending_writes if we else self._pending_reads
+        counts[word] = counts.get(word, 0) + 1
+        self.outstanding += 1
+        cov.hit("outstanding", cov.outstanding_index(self.outstanding))
+
+    def _response(self, err: bool, rid: int) -> None:
+        queue = self._pending.get(rid if self.has_rid else 0)
+        if not queue:
+            # Unmatched responses are for ObiProtocolChecker to report
+            return
+        word, we = queue.popleft()
+        counts = self._pending_writes if we else self._pending_reads
+        if counts[word] == 1:
+            del counts[word]
+        else:
+            counts[word] -= 1
+        self.outstanding -= 1
+        self.coverage.hit("response", 2 * we + err)
@@ -24,15 +24,26 @@ THE SOFTWARE.
 
 from __future__ import annotations
 
-from collections import deque
-from typing import Any, Optional
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Optional, Union
 
 from cocotb import start_soon
-from cocotb.triggers import RisingEdge
 
 from .address_space import SparseMemoryRegion
+from .constants import ObiOrder
 from .obi_base import ObiBase
 from .obi_bus import ObiBus
+from .timing_model import RegionLatency, TimingModel
+
+
+@dataclass(eq=False)
+class _ObiResponse:
+    # Compared by identity: two responses with equal fields are distinct
+    rid: int
+    rdata: int
+    err: int
+    ready: int
 
 
 class ObiDevice(ObiBase):
@@ -54,7 +65,26 @@ class ObiDevice(ObiBase):
         Size of the auto-created backing memory when *target* is not given.
     max_outstanding:
         Maximum number of accepted-but-unanswered requests. Default ``2``.
-        Responses are returned in strict order.
+    order:
+        Response scheduling policy, an :class:`ObiOrder` or its value
+        (``"in_order"``, ``"aid"``, ``"random"``). Default in-order.
+        Responses that share an id are always returned in request order.
+    timing:
+        Optional :class:`~cocotbext.obi.timing_model.TimingModel` that can
+        block grants (bandwidth caps, refresh windows) and add latency per
+        request (fixed, per region, bank conflicts).
+    sampling:
+        :class:`ObiSampling` discipline, as for :class:`ObiHost`.
+
+    Latency per address range is set with :meth:`add_latency_region`; a
+    response is not presented until its latency has elapsed. With
+    ``backpressure_rvalid`` enabled each response is also held back by a
+    random :attr:`delay`, while new requests keep being granted.
+
+    :meth:`peek`, :meth:`poke`, :meth:`load` and :meth:`dump` access the
+    target through the same :meth:`_read`/:meth:`_write` as bus requests,
+    but take no simulation time. Callbacks registered with
+    :meth:`add_backdoor_hook` are told about every backdoor write.
     """
 
     def __init__(
@@ -64,6 +94,8 @@ class ObiDevice(ObiBase):
         target=None,
         size_bytes: Optional[int] = None,
         max_outstanding: int = 2,
+        order: Union[ObiOrder, str] = ObiOrder.IN_ORDER,
+        timing: Optional[TimingModel] = None,
         autostart: bool = True,
         **kwargs,
     ) -> None:
@@ -76,6 +108,10 @@ class ObiDevice(ObiBase):
             self.target = SparseMemoryRegion(size)
 
         self.max_outstanding = max(1, int(max_outstanding))
+        self.order = ObiOrder(order)
+        self.latency_regions = RegionLatency()
+        self.timing = timing
+        self.backdoor_hooks: list[Callable[[int, bytes], Any]] = []
 
         self.bus.gnt.value = 0
         self.bus.rvalid.value = 0
@@ -90,12 +126,38 @@ class ObiDevice(ObiBase):
     def _restart(self) -> None:
         if self._run_coroutine_obj is not None:
             self._run_coroutine_obj.kill()
+        if self.timing is not None:
+            self.timing.reset()
         self._run_coroutine_obj = start_soon(self._run())
 
     def start(self) -> None:
         """(Re)start the responder coroutine."""
         self._restart()
 
+    def add_latency_region(self, base: int, size: int, cycles: int) -> None:
+        """Delay responses to ``[base, base + size)`` by *cycles* clocks."""
+        self.latency_regions.add(base, size, cycles)
+
+    def region_latency(self, addr: int) -> int:
+        """Extra response latency for a request to *addr*."""
+        return self.latency_regions.latency(addr)
+
+    def _select(self, pending: list[_ObiResponse], cycle: int) -> Optional[int]:
+        """Index of the response to present next, or ``None`` if none is ready."""
+        if self.order is ObiOrder.IN_ORDER:
+            return 0 if pending and pending[0].ready <= cycle else None
+        seen: set[int] = set()
+        ready: list[int] = []
+        for i, resp in enumerate(pending):
+            if resp.rid in seen:
+                continue
+            seen.add(resp.rid)
+            if resp.ready <= cycle:
+                if self.order is ObiOrder.AID:
+                    return i
+                ready.append(i)
+        return self.rng.choice(ready) if ready else None
+
     async def _write(self, address, data, strb=None):
         if strb is None:
             await self.target.write(address, data)
@@ -107,6 +169,58 @@ class ObiDevice(ObiBase):
     async def _read(self, address, length):
         return await self.target.read(address, length)
 
+    # --- Backdoor access -----------------------------------------------------
+
+    def add_backdoor_hook(self, hook: Callable[[int, bytes], Any]) -> None:
+        """Call ``hook(addr, data)`` with the bytes of every backdoor write.
+
+        For example ``device.add_backdoor_hook(scoreboard.load)`` keeps an
+        :class:`~cocotbext.obi.ObiScoreboard` shadow memory in step.
+        """
+        self.backdoor_hooks.append(hook)
+
+    def _notify(self, addr: int, data: bytes) -> None:
+        for hook in self.backdoor_hooks:
+            hook(addr, data)
+
+    async def peek(self, addr: int) -> int:
+        """Bus word at *addr*, without a bus access."""
+        data = await self._read(addr, self.byte_lanes)
+        return int.from_bytes(data, byteorder="little")
+
+    async def poke(self, addr: int, value: int, strb: Optional[int] = None) -> None:
+        """Write the bus word at *addr*, without a bus access.
+
+        *strb* selects byte lanes like ``be`` on the bus; ``None`` writes
+        them all.
+        """
+        data = (value & self.wdata_mask).to_bytes(self.byte_lanes, "little")
+        if strb is None:
+            await self._write(addr, data)
+            self._notify(addr, data)
+            return
+        await self._write(addr, data, strb)
+        lane = 0
+        while lane < self.byte_lanes:
+            if (strb >> lane) & 1:
+                end = lane
+                while end < self.byte_lanes and (strb >> end) & 1:
+                    end += 1
+                self._notify(addr + lane, data[lane:end])
+                lane = end
+            else:
+                lane += 1
+
+    async def load(self, addr: int, data: bytes) -> None:
+        """Write *data* from *addr* on, without bus accesses."""
+        data = bytes(data)
+        await self._write(addr, data)
+        self._notify(addr, data)
+
+    async def dump(self, addr: int, length: int) -> bytes:
+        """*length* bytes from *addr* on, without bus accesses."""
+        return bytes(await self._read(addr, length))
+
     async def _process(self, addr, we, be, wdata, aid) -> tuple[int, int, int]:
         """Apply a request and return the response tuple ``(rid, rdata, err)``."""
         try:
@@ -123,58 +237,87 @@ class ObiDevice(ObiBase):
             self.log.warning(f"Access 0x{addr:08x} Invalid: {e}")
             return (aid, 0, 1)
 
-    async def _run(self):
-        """Decoupled grant and response with back-to-back acceptance."""
+    def _sample_request(self) -> tuple[int, bool, int, int, int]:
+        """Request fields ``(addr, we, be, wdata, aid)`` on the bus."""
+        return (
+            self.sig_int(self.bus.addr),
+            self.sig_int(self.bus.we) == 1,
+            self.sig_int(self.bus.be),
+            self.sig_int(self.bus.wdata),
+            self.read_aid(),
+        )
+
+    async def _run(self) -> None:
+        """Decoupled grant and response with back-to-back acceptance.
+
+        Each clock edge first retires the handshakes of the cycle that just
+        ended (``req && gnt`` accepts a request, ``rvalid && rready`` retires
+        the presented response), then drives ``gnt`` and the response for the
+        next cycle. ``gnt`` signals readiness and may be high without ``req``.
+        A presented response is held until ``rready``, whatever the order.
+        """
         self.bus.gnt.value = 0
         self.bus.rvalid.value = 0
         self.bus.rdata.value = 0
         self.bus.err.value = 0
         self.write_rid(0)
 
-        pending: deque[tuple[int, int, int]] = deque()
+        pending: list[_ObiResponse] = []
+        current: Optional[_ObiResponse] = None
+        # gnt stall owed by the next beat, drawn as the previous one is
+        # accepted so that a beat arriving after idle cycles pays it too
         gnt_stall = 0
-        await RisingEdge(self.clock)
+        stall_drawn = False
+        grant = False
+        cycle = 0
 
-        while True:
+        def sample() -> tuple[bool, bool, Optional[tuple[int, bool, int, int, int]]]:
             req = self.sig_int(self.bus.req) == 1
-            can_accept = len(pending) < self.max_outstanding
-            grant = False
+            rready = self.sig_int(self.bus.rready) == 1
+            if not (grant and req):
+                return req, rready, None
+            return req, rready, self._sample_request()
 
-            if gnt_stall > 0:
+        while True:
+            req, rready, request = await self._sample_cycle(sample)
+            cycle += 1
+
+            if current is not None and rready:
+                pending.remove(current)
+                current = None
+            if request is not None:
+                addr, we, be, wdata, aid = request
+                rid, rdata, err = await self._process(addr, we, be, wdata, aid)
+                ready = cycle + self.region_latency(addr) + self.delay
+                if self.timing is not None:
+                    ready += self.timing.accept(cycle - 1, addr, we)
+                pending.append(_ObiResponse(rid, rdata, err, ready))
+
+            if request is not None:
+                stall_drawn = False
+            if not stall_drawn:
+                stall_drawn = True
+                gnt_stall = self.gnt_delay
+            elif gnt_stall and req:
+                # Only a waiting request spends the stall, idle cycles don't
                 gnt_stall -= 1
-            elif req and can_accept:
-                stall = self.gnt_delay
-                if stall:
-                    gnt_stall = stall - 1
-                else:
-                    grant = True
+            grant = (
+                not gnt_stall
+                and len(pending) < self.max_outstanding
+                and (self.timing is None or self.timing.can_accept(cycle))
+            )
 
             self.bus.gnt.value = 1 if grant else 0
 
-            present = bool(pending)
-            if present:
-                rid, rdata, err = pending[0]
+            if current is None:
+                index = self._select(pending, cycle)
+                if index is not None:
+                    current = pending[index]
+            if current is not None:
                 self.bus.rvalid.value = 1
-                self.write_rid(rid)
-                self.bus.rdata.value = rdata
-                self.bus.err.value = err
+                self.write_rid(current.rid)
+                self.bus.rdata.value = current.rdata
+                self.bus.err.value = current.err
             else:
                 self.bus.rvalid.value = 0
                 self.bus.err.value = 0
-
-            if grant:
-                addr = self.sig_int(self.bus.addr)
-                we = self.sig_int(self.bus.we) == 1
-                be = self.sig_int(self.bus.be)
-                wdata = self.sig_int(self.bus.wdata)
-                aid = self.read_aid()
-
-            rready = self.sig_int(self.bus.rready) == 1
-            pop = present and rready
-
-            await RisingEdge(self.clock)
-
-            if pop:
-                pending.popleft()
-            if grant:
-                pending.append(await self._process(addr, we, be, wdata, aid))
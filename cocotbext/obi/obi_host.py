@@ -22,30 +22,94 @@ THE SOFTWARE.
 
 """
 
-import logging
 import math
 from collections import deque
+from collections.abc import Callable, Generator, Iterable
 from dataclasses import dataclass
 from typing import Any, Optional, Union
 
 from cocotb import start_soon
-from cocotb.triggers import Event, First, RisingEdge
+from cocotb.triggers import Event, First, ReadOnly, RisingEdge
+from cocotb.utils import get_sim_time
 
 from .address_map import AddressMap
-from .constants import OBIError
+from .constants import OBIError, ObiOrdering, ObiSampling
 from .obi_base import ObiBase
+from .obi_device import ObiDevice
 from .utils import resolve_x_int
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class _ObiTxOp:
     write: bool
     addr: int
-    data: bytes
+    # Write data, or the expected read data when check is set
+    data: int
     strb: int
     error_expected: bool
     tx_id: int
-    event: Event
+    # Created by _op_event() only for beats someone waits on
+    event: Optional[Event] = None
+    check: bool = False
+    aid: int = 0
+    # Poll reads are not logged or queued; the value is left in rdata
+    poll: bool = False
+    rdata: int = 0
+    # Transfers of a submit() batch share its event; reads fill results[slot]
+    batch: Optional["ObiBatch"] = None
+    slot: int = 0
+
+
+@dataclass
+class ObiOp:
+    """One bus-word transfer for :meth:`ObiHost.submit`.
+
+    *addr* is a byte address; register names and wide data are not
+    resolved. A write drives *data*, which it must be given, with byte
+    enables *strb*. A read compares the returned word with *data* unless
+    it is empty.
+    """
+
+    addr: int
+    data: Union[int, bytes] = b""
+    write: bool = False
+    strb: int = -1
+    error_expected: bool = False
+
+    def __post_init__(self) -> None:
+        if self.write and isinstance(self.data, bytes) and not self.data:
+            raise ValueError(f"ObiOp write to 0x{self.addr:08x} has no data")
+
+
+class ObiBatch:
+    """Completion of the transfers queued by one :meth:`ObiHost.submit`.
+
+    Awaiting it returns :attr:`results`, the data of every read in the
+    batch in submission order, once all of its transfers have completed.
+    """
+
+    def __init__(self) -> None:
+        self.remaining = 0
+        self.results: list[Union[bytes, int]] = []
+        self.event = Event()
+
+    def done(self) -> bool:
+        return self.remaining == 0
+
+    def __await__(self) -> Generator[Any, Any, list[Union[bytes, int]]]:
+        if self.remaining:
+            yield from self.event.wait().__await__()
+        return self.results
+
+
+@dataclass
+class ObiPollResult:
+    """Outcome of :meth:`ObiHost.poll`."""
+
+    matched: bool = False
+    value: int = 0
+    reads: int = 0
+    cycles: int = 0
 
 
 class ObiHost(ObiBase):
@@ -71,6 +135,35 @@ class ObiHost(ObiBase):
         transactions. Default ``2``. Values ``>1`` allow the address phase of
         transaction N+1 to overlap the data phase of N when the subordinate
         supports it.
+    out_of_order:
+        Match responses to requests by ``rid`` instead of assuming strict
+        order. Each beat in flight holds a unique ``aid``; no id is reused
+        until its response arrives. Requires ``aid`` and ``rid`` on the bus.
+        Default ``False``.
+    sampling:
+        :class:`ObiSampling` discipline: ``"edge"`` (default) reads the bus
+        right after each rising edge, ``"readonly"`` reads it in the
+        ReadOnly phase before the edge and drives after it.
+    autostart:
+        Start the channel coroutines immediately. :class:`ObiMultiHost`
+        creates its ports with ``autostart=False`` and steps them itself.
+    target:
+        Transaction-level mode: apply every transfer directly to this
+        :class:`~cocotbext.obi.address_space.MemoryInterface` (e.g. a
+        ``MemoryRegion`` or ``AddressSpace``) or :class:`ObiDevice` instead
+        of driving the bus, which stays idle. The API, address map, strobes,
+        expected data and error checks are unchanged. Default ``None``
+        (pin-level).
+    latency:
+        Clock cycles each transfer takes in transaction-level mode, one
+        transfer at a time. Default ``0``: transfers complete without
+        simulation time passing, except the reads of :meth:`poll`, which
+        take at least one.
+    ordering:
+        :class:`ObiOrdering` of a blocking :meth:`read` (and :meth:`poll`)
+        against earlier writes: ``"strict"`` (default) waits for all of
+        them, ``"address"`` only for those to the words it reads,
+        ``"relaxed"`` for none. :meth:`fence` always waits for all of them.
     """
 
     def __init__(
@@ -80,12 +173,21 @@ class ObiHost(ObiBase):
         name: str = "host",
         timeout_cycles: int = 1000,
         max_outstanding: int = 2,
+        out_of_order: bool = False,
+        autostart: bool = True,
+        target: Optional[Any] = None,
+        latency: int = 0,
+        ordering: Union[ObiOrdering, str] = ObiOrdering.STRICT,
         **kwargs,
     ) -> None:
         super().__init__(bus, clock, name=name, **kwargs)
 
+        if out_of_order and not (self.has_aid and self.has_rid):
+            raise ValueError("out_of_order requires aid and rid signals on the bus")
+
         self.timeout_cycles = timeout_cycles  # -1 disables timeout
         self.max_outstanding = max(1, int(max_outstanding))
+        self.out_of_order = out_of_order
         self.exception_enabled = True
         self.exception_occurred = False
         self.return_int = False
@@ -97,20 +199,45 @@ class ObiHost(ObiBase):
 
         self.addrmap = AddressMap(word_bytes=self.wbytes, multi_device=False)
 
+        if isinstance(target, ObiDevice) and target.byte_lanes != self.wbytes:
+            raise ValueError("target device data width differs from the bus")
+        if latency < 0:
+            raise ValueError("latency must be non-negative")
+        self.target: Any = target
+        self.latency = latency
+        self._ordering = ObiOrdering(ordering)
+
         self.log.info(f"OBI {self.name} configuration:")
         self.log.info(f"  Address width: {self.address_width} bits")
         self.log.info(f"  Data width: {self.wwidth} bits ({self.wbytes} bytes)")
         self.log.info(f"  BE width: {self.be_width} bits")
         self.log.info(f"  Max outstanding: {self.max_outstanding}")
+        if self.out_of_order:
+            self.log.info(f"  Out-of-order: {1 << self.aid_width} ids")
         if self.timeout_cycles >= 0:
             self.log.info(f"  Timeout: {self.timeout_cycles} clock cycles")
         else:
             self.log.info("  Timeout: disabled")
+        if self.target is not None:
+            self.log.info(f"  Transaction-level: {self.latency} cycle latency")
+        self.log.info(f"  Ordering: {self.ordering.value}")
 
         self.queue_tx: deque[_ObiTxOp] = deque()
         self.queue_rx: deque[tuple[bytes, int]] = deque()
         self.outstanding: deque[_ObiTxOp] = deque()
         self.tx_id = 0
+        # Write fence: tx ids of writes not yet retired in order, those that
+        # completed out of order, and the (last tx id, event) of each
+        # blocking read waiting for them
+        self._pending_writes: deque[int] = deque()
+        self._writes_done: set[int] = set()
+        self._fences: deque[tuple[int, Event]] = deque()
+        # Address ordering only: incomplete writes by bus word and tx id
+        self._write_hazards: dict[int, dict[int, _ObiTxOp]] = {}
+
+        # Out-of-order mode: ids free for issue and in-flight beats by id
+        self._free_ids: deque[int] = deque(range(1 << self.aid_width))
+        self._inflight: dict[int, _ObiTxOp] = {}
 
         self.sync = Event()
 
@@ -118,9 +245,12 @@ class ObiHost(ObiBase):
         self._idle.set()
         self._rx_event = Event()
         self._a_wake = Event()
+        self._r_wake = Event()
 
         self._presented: Optional[_ObiTxOp] = None
         self._req_pause = 0
+        self._req_drawn = False
+        self._rready_stall = 0
         self._gnt_timeout = 0
         self._resp_timeout = 0
 
@@ -137,8 +267,8 @@ class ObiHost(ObiBase):
 
         self._a_coroutine_obj: Any = None
         self._r_coroutine_obj: Any = None
-        self._rready_coroutine_obj: Any = None
-        self._restart()
+        if autostart:
+            self._restart()
 
     # --- Address map helpers -------------------------------------------------
 
@@ -190,9 +320,10 @@ class ObiHost(ObiBase):
         index: int = -1,
     ) -> None:
         """Write *data* to an OBI device and wait for completion."""
-        events = self._enqueue_write(
+        ops = self._enqueue_write(
             addr, data, strb, error_expected, length, device, index
         )
+        events = [self._op_event(op) for op in ops]
         for event in events:
             await event.wait()
         for _ in range(self.intra_delay):
@@ -209,9 +340,7 @@ class ObiHost(ObiBase):
         index: int = -1,
     ) -> None:
         """Queue a write without waiting for completion."""
-        self._enqueue_write(
-            addr, data, strb, error_expected, length, device, index
-        )
+        self._enqueue_write(addr, data, strb, error_expected, length, device, index)
 
     def _enqueue_write(
         self,
@@ -222,51 +351,171 @@ class ObiHost(ObiBase):
         length: int = -1,
         device: int = 0,
         index: int = -1,
-    ) -> list[Event]:
+    ) -> list[_ObiTxOp]:
         resolved = self.calc_address(addr, device, index)
         num_transactions = self.calc_length(length, data, self.wbytes)
-        events: list[Event] = []
+        ops: list[_ObiTxOp] = []
 
         for i in range(num_transactions):
             addrb = resolved + i * self.wbytes
             if isinstance(data, int):
                 subdata = (data >> self.wwidth * i) & self.wdata_mask
-                datab = subdata.to_bytes(self.wbytes, "little")
             else:
-                datab = data[i * self.wbytes : (i + 1) * self.wbytes]
+                subdata = int.from_bytes(
+                    data[i * self.wbytes : (i + 1) * self.wbytes], "little"
+                )
             self.tx_id += 1
-            event = Event()
-            events.append(event)
-            self.queue_tx.append(
-                _ObiTxOp(True, addrb, datab, strb, error_expected, self.tx_id, event)
-            )
+            op = _ObiTxOp(True, addrb, subdata, strb, error_expected, self.tx_id)
+            ops.append(op)
+            self._pending_writes.append(self.tx_id)
+        self.queue_tx.extend(ops)
+        if self._ordering is ObiOrdering.ADDRESS:
+            self._add_hazards(ops)
 
         self.sync.set()
         self._idle.clear()
-        return events
-
-    def _leading_write(self) -> Optional[_ObiTxOp]:
-        if self._presented is not None and self._presented.write:
-            return self._presented
-        if self.outstanding and self.outstanding[0].write:
-            return self.outstanding[0]
-        if self.queue_tx and self.queue_tx[0].write:
-            return self.queue_tx[0]
-        return None
-
-    async def _await_prior_writes(self) -> None:
-        """Wait for earlier writes to complete before a blocking ``read()``.
-
-        ``read_nowait()`` does not do this, so queued reads can still overlap
-        in-flight writes on the bus.
+        return ops
+
+    def submit(self, ops: Iterable[ObiOp]) -> ObiBatch:
+        """Queue a batch of transfers and return its :class:`ObiBatch`.
+
+        Each :class:`ObiOp` is one bus word at a byte address, so the batch
+        is queued without address map lookups or splitting, and the whole
+        batch shares one completion event. As with :meth:`write_nowait`
+        and :meth:`read_nowait`, nothing waits for earlier writes; use
+        :meth:`fence` first where that matters.
         """
-        while True:
-            op = self._leading_write()
-            if op is None:
-                return
-            await op.event.wait()
-            if op is self._leading_write():
-                await RisingEdge(self.clock)
+        batch = ObiBatch()
+        wbytes = self.wbytes
+        txs: list[_ObiTxOp] = []
+        reads = 0
+        tx_id = self.tx_id
+        for op in ops:
+            data = op.data
+            if isinstance(data, int):
+                check = True
+            elif len(data) > wbytes:
+                raise ValueError(f"ObiOp data wider than the bus: {len(data)} bytes")
+            else:
+                check = data != b""
+                data = int.from_bytes(data, "little")
+            tx_id += 1
+            txs.append(
+                _ObiTxOp(
+                    op.write,
+                    op.addr,
+                    data & self.wdata_mask,
+                    op.strb,
+                    op.error_expected,
+                    tx_id,
+                    check=check and not op.write,
+                    batch=batch,
+                    slot=reads,
+                )
+            )
+            if not op.write:
+                reads += 1
+        if not txs:
+            return batch
+
+        for tx in txs:
+            if tx.write:
+                self._pending_writes.append(tx.tx_id)
+        self.queue_tx.extend(txs)
+        if self._ordering is ObiOrdering.ADDRESS:
+            self._add_hazards(txs)
+        self.tx_id = tx_id
+        batch.remaining = len(txs)
+        batch.results = [b""] * reads
+        self.sync.set()
+        self._idle.clear()
+        return batch
+
+    @property
+    def ordering(self) -> ObiOrdering:
+        """The :class:`ObiOrdering` of blocking reads; may be changed at any time."""
+        return self._ordering
+
+    @ordering.setter
+    def ordering(self, ordering: Union[ObiOrdering, str]) -> None:
+        self._ordering = ObiOrdering(ordering)
+        # Writes are only tracked by address while it is needed
+        self._write_hazards = {}
+        if self._ordering is ObiOrdering.ADDRESS:
+            incomplete = list(self.outstanding)
+            if self._presented is not None and self._presented not in incomplete:
+                incomplete.append(self._presented)
+            self._add_hazards(incomplete)
+            self._add_hazards(self.queue_tx)
+
+    def _add_hazards(self, ops: Iterable[_ObiTxOp]) -> None:
+        hazards = self._write_hazards
+        for op in ops:
+            if op.write:
+                hazards.setdefault(op.addr // self.wbytes, {})[op.tx_id] = op
+
+    async def fence(self) -> None:
+        """Wait for every write queued so far to complete.
+
+        A barrier whatever the :attr:`ordering`: transfers queued after the
+        call, by this or other coroutines, are not waited for. The wait is a
+        single event, set once the oldest incomplete write is newer than
+        every transfer queued before the call.
+        """
+        if not self._pending_writes:
+            return
+        event = Event()
+        self._fences.append((self.tx_id, event))
+        await event.wait()
+
+    async def _order_read(self, addr: int, length: int) -> None:
+        """Wait for the earlier writes a read of *addr* must follow."""
+        if self._ordering is ObiOrdering.STRICT:
+            await self.fence()
+        elif self._ordering is ObiOrdering.ADDRESS and self._write_hazards:
+            hazards = self._write_hazards
+            words = range(addr // self.wbytes, (addr + length - 1) // self.wbytes + 1)
+            events = [
+                self._op_event(op)
+                for w in words
+                if w in hazards
+                for op in hazards[w].values()
+            ]
+            for event in events:
+                await event.wait()
+
+    @staticmethod
+    def _op_event(op: _ObiTxOp) -> Event:
+        """The completion event of an incomplete *op*, created on first use."""
+        if op.event is None:
+            op.event = Event()
+        return op.event
+
+    def _retire_write(self, op: _ObiTxOp) -> None:
+        if self._write_hazards:
+            word = op.addr // self.wbytes
+            hazards = self._write_hazards.get(word)
+            if hazards is not None:
+                hazards.pop(op.tx_id, None)
+                if not hazards:
+                    del self._write_hazards[word]
+
+        tx_id = op.tx_id
+        pending = self._pending_writes
+        if not pending or pending[0] != tx_id:
+            self._writes_done.add(tx_id)
+            return
+        pending.popleft()
+        while pending and pending[0] in self._writes_done:
+            self._writes_done.remove(pending.popleft())
+        self._release_fences()
+
+    def _release_fences(self) -> None:
+        """Set the fences that no longer wait for an incomplete write."""
+        pending = self._pending_writes
+        fences = self._fences
+        while fences and (not pending or fences[0][0] < pending[0]):
+            fences.popleft()[1].set()
 
     async def read(
         self,
@@ -279,12 +528,14 @@ class ObiHost(ObiBase):
     ) -> Union[bytes, int]:
         """Read data from an OBI device.
 
-        Waits for any earlier writes to finish first so the returned value is
-        coherent with those writes. Use :meth:`read_nowait` to issue a read
-        without that wait.
+        Waits for earlier writes to finish first, as set by :attr:`ordering`,
+        so the returned value is coherent with those writes. Use
+        :meth:`read_nowait` to issue a read without that wait.
         """
-        await self._await_prior_writes()
-        rx_id = self.read_nowait(addr, data, error_expected, length, device, index)
+        resolved = self.calc_address(addr, device, index)
+        num_transactions = self.calc_length(length, data, self.rbytes)
+        await self._order_read(resolved, num_transactions * self.rbytes)
+        rx_id = self.read_nowait(resolved, data, error_expected, length, device)
         found = False
         ret: bytes = b""
         while not found:
@@ -317,20 +568,20 @@ class ObiHost(ObiBase):
         resolved = self.calc_address(addr, device, index)
         num_transactions = self.calc_length(length, data, self.rbytes)
         last_tx_id = self.tx_id
+        # Bytes are compared whole against every beat, ints split per beat
+        check = isinstance(data, int) or data != b""
+        if isinstance(data, bytes):
+            expected = int.from_bytes(data, "little")
 
         for i in range(num_transactions):
             addrb = resolved + i * self.rbytes
             if isinstance(data, int):
-                subdata = (data >> self.rwidth * i) & self.rdata_mask
-                datab = subdata.to_bytes(self.rbytes, "little")
-            else:
-                datab = data
+                expected = (data >> self.rwidth * i) & self.rdata_mask
             self.tx_id += 1
             last_tx_id = self.tx_id
-            event = Event()
             self.queue_tx.append(
                 _ObiTxOp(
-                    False, addrb, datab, -1, error_expected, self.tx_id, event
+                    False, addrb, expected, -1, error_expected, self.tx_id, check=check
                 )
             )
 
@@ -344,21 +595,114 @@ class ObiHost(ObiBase):
         data: Union[int, bytes] = b"",
         device: int = 0,
         index: int = -1,
-    ) -> None:
-        """Repeatedly read *addr* until the returned data equals *data*."""
-        resolved = self.calc_address(addr, device)
-        label = self.format_addr(resolved, device)
-        self.log.info(f"Poll  {self._format_addr_col(label)}")
-        level_num = self.log.getEffectiveLevel()
-        self.log.setLevel(logging.WARNING)
-        if isinstance(data, int):
-            datab = data.to_bytes(self.rbytes, "little")
+        *,
+        mask: int = -1,
+        predicate: Optional[Callable[[int], bool]] = None,
+        interval: int = 0,
+        backoff: float = 1.0,
+        max_interval: Optional[int] = None,
+        max_cycles: int = -1,
+        outstanding: int = 1,
+    ) -> ObiPollResult:
+        """Read the bus word at *addr* until it matches; return the statistics.
+
+        The poll ends when ``value & mask == data & mask``, or when
+        ``predicate(value)`` is true if a *predicate* is given. Each read is
+        issued as soon as the previous one returns; *interval* idle cycles
+        are inserted between reads instead, multiplied by *backoff* after
+        every miss up to *max_interval*. With no *interval*, *outstanding*
+        reads (at most ``max_outstanding``) are kept in flight, so the poll
+        must not be used on registers with read side effects.
+
+        Earlier writes complete before the first read, as :attr:`ordering`
+        sets for :meth:`read`. The individual reads are not logged. If
+        *max_cycles* (``-1`` for no limit) pass without a match, a
+        ``TimeoutError`` is raised, or with ``exception_enabled`` off
+        ``exception_occurred`` is set and the result returned with
+        ``matched`` false.
+        """
+        resolved = self.calc_address(addr, device, index)
+        if predicate is None:
+            if isinstance(data, bytes):
+                if not data:
+                    raise ValueError("poll needs data or a predicate")
+                data = int.from_bytes(data, byteorder="little")
+            expected = data
+
+            def predicate(value: int) -> bool:
+                return (value ^ expected) & mask == 0
+
+        label = self._format_addr_col(self.format_addr(resolved, device))
+        self.log.info(f"Poll  {label}")
+        await self._order_read(resolved, self.rbytes)
+
+        result = ObiPollResult()
+        counter = start_soon(self._count_cycles(result))
+        depth = 1 if interval else max(1, min(outstanding, self.max_outstanding))
+        inflight: deque[_ObiTxOp] = deque()
+        wait = interval
+        # The budget is checked here rather than by the counter, which only
+        # runs while time passes: a read that took none counts as a cycle
+        last_time = get_sim_time()
+        untimed = 0
+        try:
+            while True:
+                while len(inflight) < depth:
+                    inflight.append(self._queue_poll_read(resolved))
+                op = inflight.popleft()
+                await self._op_event(op).wait()
+                result.reads += 1
+                result.value = op.rdata
+                if predicate(op.rdata):
+                    result.matched = True
+                    break
+                now = get_sim_time()
+                if now == last_time:
+                    untimed += 1
+                last_time = now
+                if 0 <= max_cycles <= result.cycles + untimed:
+                    break
+                if wait:
+                    if max_cycles >= 0:
+                        wait = min(wait, max_cycles - result.cycles - untimed)
+                    for _ in range(wait):
+                        await RisingEdge(self.clock)
+                    wait = math.ceil(wait * backoff)
+                    if max_interval is not None:
+                        wait = min(wait, max_interval)
+        finally:
+            counter.kill()
+
+        self.ret = result.value.to_bytes(self.rbytes, "little")
+        if result.matched:
+            self.log.info(
+                f"Poll  {label}: 0x{result.value:08x} after {result.reads} reads, "
+                f"{result.cycles} cycles"
+            )
         else:
-            datab = data
-        self.ret = None
-        while self.ret != datab:
-            await self.read(addr, device=device, index=index)
-        self.log.setLevel(level_num)
+            msg = (
+                f"Poll timeout: 0x{result.value:08x} at {label.strip()} after "
+                f"{result.reads} reads, {result.cycles} cycles"
+            )
+            self.exception_occurred = True
+            if self.exception_enabled:
+                self.log.critical(msg)
+                raise TimeoutError(msg)
+            self.log.warning(msg)
+        return result
+
+    def _queue_poll_read(self, addr: int) -> _ObiTxOp:
+        self.tx_id += 1
+        op = _ObiTxOp(False, addr, 0, -1, False, self.tx_id, Event(), poll=True)
+        self.queue_tx.append(op)
+        self.sync.set()
+        self._idle.clear()
+        return op
+
+    async def _count_cycles(self, result: ObiPollResult) -> None:
+        while True:
+            await RisingEdge(self.clock)
+            result.cycles += 1
 
     # --- Lifecycle / status --------------------------------------------------
 
@@ -367,36 +711,76 @@ class ObiHost(ObiBase):
             self._a_coroutine_obj.kill()
         if self._r_coroutine_obj is not None:
             self._r_coroutine_obj.kill()
-        if self._rready_coroutine_obj is not None:
-            self._rready_coroutine_obj.kill()
-        self._presented = None
+        self._reset_state()
+        if self.target is not None:
+            self._a_coroutine_obj = start_soon(self._run_direct())
+            self._r_coroutine_obj = None
+            return
+        self._a_coroutine_obj = start_soon(self._run_a_channel())
+        self._r_coroutine_obj = start_soon(self._run_r_channel())
+
+    def start(self) -> None:
+        """(Re)start the channel coroutines.
+
+        Transfers already granted stay outstanding and their responses are
+        still collected. A request being presented but not yet granted is
+        withdrawn and issued again after the restart, ahead of the queue.
+        """
+        self._restart()
+
+    def _reset_state(self) -> None:
+        op = self._presented
+        if op is not None:
+            self._deassert_req()
+            self._presented = None
+            if self.out_of_order:
+                del self._inflight[op.aid]
+                self._free_ids.appendleft(op.aid)
+            self.queue_tx.appendleft(op)
+        if self.target is not None and self.outstanding:
+            # A transaction-level transfer cut short is simply applied again
+            self.queue_tx.extendleft(reversed(self.outstanding))
+            self.outstanding.clear()
         self._req_pause = 0
+        self._req_drawn = False
+        self._rready_stall = 0
         self._gnt_timeout = 0
         self._resp_timeout = 0
         self._a_wake.clear()
-        self._a_coroutine_obj = start_soon(self._run_a_channel())
-        self._r_coroutine_obj = start_soon(self._run_r_channel())
-        self._rready_coroutine_obj = start_soon(self._run_rready())
-
-    async def _run_rready(self) -> None:
-        """Drive the R-channel ready signal."""
         self.bus.rready.value = 1
-        while True:
-            await RisingEdge(self.clock)
-            if not self.backpressure_rready:
-                self.bus.rready.value = 1
-                continue
-            stall = self.rready_delay
-            if stall:
-                self.bus.rready.value = 0
-                for _ in range(stall):
-                    await RisingEdge(self.clock)
+
+    @property
+    def _active(self) -> bool:
+        """True while any channel still has work to do on the next clock."""
+        return bool(
+            self.queue_tx
+            or self.outstanding
+            or self._presented is not None
+            or self._rready_stall
+        )
+
+    def _rready_step(self) -> None:
+        """Advance the rready stall state by one clock.
+
+        ``rready`` is low exactly while a stall is counting down, so the
+        signal is only written when a stall starts or ends.
+        """
+        if self._rready_stall > 0:
+            self._rready_stall -= 1
+            if self._rready_stall == 0:
                 self.bus.rready.value = 1
+            return
+        if not self.backpressure_rready:
+            return
+        stall = self.rready_delay
+        if stall:
+            self.bus.rready.value = 0
+            self._rready_stall = stall
 
     @property
     def rready_delay(self) -> int:
         """Number of cycles to hold rready low, or 0 to stay ready."""
-        return self._stall_cycles(self.backpressure_rready)
+        return self._stall_cycles(self.backpressure_rready, "rready")
 
     @property
     def count_tx(self) -> int:
@@ -416,14 +800,13 @@ class ObiHost(ObiBase):
 
     @property
     def idle(self) -> bool:
-        return (
-            self.empty_tx
-            and not self.outstanding
-            and self._presented is None
-        )
+        return self.empty_tx and not self.outstanding and self._presented is None
 
     def clear(self) -> None:
         """Clears the RX and TX queues"""
+        for op in reversed(self.queue_tx):
+            if op.write:
+                self._retire_write(op)
         self.queue_tx.clear()
         self.queue_rx.clear()
 
@@ -444,50 +827,67 @@ class ObiHost(ObiBase):
         if self.has_aid:
             self.bus.aid.value = 0
 
-    def _drive_req(self, op: _ObiTxOp) -> None:
+    def _log_request(self, op: _ObiTxOp) -> None:
         if op.addr < 0 or op.addr >= 2**self.address_width:
             raise ValueError("Address out of range")
+        if op.poll:
+            return
+        label = self.format_addr(op.addr)
+        if op.write:
+            self.log.info(f"Write {self._format_addr_col(label)}: 0x{op.data:08x}")
+        else:
+            self.log.info(f"Read  {self._format_addr_col(label)}")
+
+    def _op_be(self, op: _ObiTxOp) -> int:
+        if not op.write or -1 == op.strb:
+            return self.be_mask
+        return op.strb & self.be_mask
+
+    def _drive_req(self, op: _ObiTxOp) -> None:
+        self._log_request(op)
 
         self.bus.req.value = 1
         self.bus.we.value = op.write
         self.bus.addr.value = op.addr
         if self.has_aid:
-            self.bus.aid.value = op.tx_id & self.aid_mask
-
-        label = self.format_addr(op.addr)
+            self.bus.aid.value = op.aid
         if op.write:
-            data_int = int.from_bytes(op.data, byteorder="little")
-            self.log.info(f"Write {self._format_addr_col(label)}: 0x{data_int:08x}")
-            self.bus.wdata.value = data_int & self.wdata_mask
-            if -1 == op.strb:
-                self.bus.be.value = self.be_mask
-            else:
-                self.bus.be.value = op.strb & self.be_mask
+            self.bus.wdata.value = op.data
         else:
-            self.log.info(f"Read  {self._format_addr_col(label)}")
             self.bus.wdata.value = 0
-            self.bus.be.value = self.be_mask
+        self.bus.be.value = self._op_be(op)
 
     def _can_present(self) -> bool:
         total = len(self.outstanding) + (1 if self._presented is not None else 0)
+        if self.out_of_order and not self._free_ids:
+            return False
         return bool(self.queue_tx) and total < self.max_outstanding
 
     def _present_next(self) -> None:
+        # Each beat draws one req stall and is presented once it has run out
         if self._req_pause > 0:
             self._req_pause -= 1
-            self._deassert_req()
-            return
+            if self._req_pause:
+                self._deassert_req()
+                return
         if not self._can_present():
             self._deassert_req()
             self._update_idle()
             return
-        if self.backpressure_req:
+        if self.backpressure_req and not self._req_drawn:
+            self._req_drawn = True
             stall = self.req_delay
             if stall:
                 self._req_pause = stall
                 self._deassert_req()
                 return
+        self._req_drawn = False
         op = self.queue_tx.popleft()
+        if self.out_of_order:
+            op.aid = self._free_ids.popleft()
+            self._inflight[op.aid] = op
+        else:
+            op.aid = op.tx_id & self.aid_mask
         self._drive_req(op)
         self._presented = op
         self._gnt_timeout = 0
@@ -504,93 +904,211 @@ class ObiHost(ObiBase):
                 self.sync.clear()
                 await self.sync.wait()
 
-            await First(RisingEdge(self.clock), self._a_wake.wait())
-            if self._a_wake.is_set():
+            readonly = self.sampling is ObiSampling.READONLY
+            wake = self._a_wake.wait()
+            if readonly:
+                fired = await First(ReadOnly(), wake)
+            else:
+                fired = await First(RisingEdge(self.clock), wake)
+            if fired is wake:
+                # The R channel freed a slot after this clock was handled;
+                # a req stall in progress still counts down once per clock
                 self._a_wake.clear()
-                if self._presented is None:
+                if self._presented is None and not self._req_pause:
                     self._present_next()
-                    continue
-
-            req_sample = bool(int(self.bus.req.value))
-            gnt_sample = bool(int(self.bus.gnt.value))
-
-            # Advance when the beat was accepted (req && gnt) or when idle.
-            if (req_sample and gnt_sample) or (not req_sample):
-                if req_sample and gnt_sample and self._presented is not None:
-                    self.outstanding.append(self._presented)
-                    self._presented = None
-                    self._gnt_timeout = 0
+                continue
 
-                if self._presented is None:
-                    self._present_next()
-            elif self._presented is not None:
-                self._gnt_timeout += 1
-                if (
-                    self.timeout_cycles >= 0
-                    and self._gnt_timeout >= self.timeout_cycles
-                ):
-                    addr = self._presented.addr
-                    msg = (
-                        f"Request timeout: No gnt after {self._gnt_timeout} cycles "
-                        f"(addr=0x{addr:08x})"
-                    )
-                    self.log.critical(msg)
-                    raise TimeoutError(msg)
+            req, gnt = self._a_sample()
+            if readonly:
+                await RisingEdge(self.clock)
+            # The step below sees any slot the R channel freed this clock
+            self._a_wake.clear()
+            self._a_step(req, gnt)
+
+    def _a_sample(self) -> tuple[bool, bool]:
+        return bool(int(self.bus.req.value)), bool(int(self.bus.gnt.value))
+
+    def _a_step(self, req: bool, gnt: bool) -> None:
+        """Advance the A channel by one clock given the sampled handshake."""
+        # Advance when the beat was accepted (req && gnt) or when idle.
+        if (req and gnt) or (not req):
+            if req and gnt and self._presented is not None:
+                self.outstanding.append(self._presented)
+                self._r_wake.set()
+                self._presented = None
+                self._gnt_timeout = 0
+
+            if self._presented is None:
+                self._present_next()
+        elif self._presented is not None:
+            self._gnt_timeout += 1
+            if self.timeout_cycles >= 0 and self._gnt_timeout >= self.timeout_cycles:
+                addr = self._presented.addr
+                msg = (
+                    f"Request timeout: No gnt after {self._gnt_timeout} cycles "
+                    f"(addr=0x{addr:08x})"
+                )
+                self.log.critical(msg)
+                raise TimeoutError(msg)
 
     async def _run_r_channel(self) -> None:
-        """Collect OBI responses (R channel) in strict order."""
-        await RisingEdge(self.clock)
+        """Collect OBI responses (R channel) and drive ``rready``."""
+        # No initial wait: after a restart the very next edge may retire a
+        # response to a transfer that is still outstanding
         while True:
-            await RisingEdge(self.clock)
-
-            if self.outstanding:
-                self._resp_timeout += 1
-                if (
-                    self.timeout_cycles >= 0
-                    and self._resp_timeout >= self.timeout_cycles
-                ):
-                    addr = self.outstanding[0].addr
-                    msg = (
-                        f"Response timeout: No rvalid after {self._resp_timeout} "
-                        f"cycles (addr=0x{addr:08x})"
-                    )
-                    self.log.critical(msg)
-                    raise TimeoutError(msg)
-            else:
+            # Nothing can arrive until the A channel gets a beat granted
+            if not self.outstanding and not self._rready_stall:
                 self._resp_timeout = 0
+                self._r_wake.clear()
+                await self._r_wake.wait()
+                # Draw a stall as the channel wakes, so that the first
+                # response can be stalled too
+                self._rready_step()
 
-            if not (self.bus.rvalid.value and self.bus.rready.value):
-                continue
+            self._r_step(await self._sample_cycle(self._r_sample))
+            self._rready_step()
 
-            if not self.outstanding:
-                continue
+    def _r_sample(self) -> Optional[tuple[int, bool, int]]:
+        """``(rid, err, rdata)`` if a response is taken this cycle, else ``None``.
 
-            op = self.outstanding.popleft()
+        ``rdata`` is only read for read responses.
+        """
+        if (
+            not (self.bus.rvalid.value and self.bus.rready.value)
+            or not self.outstanding
+        ):
+            return None
+        if self.out_of_order:
+            rid = self.sig_int(self.bus.rid)
+            op = self._inflight.get(rid)
+        else:
+            rid = 0
+            op = self.outstanding[0]
+        rdata = 0
+        if op is not None and not op.write:
+            rdata = resolve_x_int(self.bus.rdata) & self.rdata_mask
+        return rid, bool(int(self.bus.err.value)), rdata
+
+    def _r_step(self, resp: Optional[tuple[int, bool, int]]) -> None:
+        """Advance the R channel by one clock given :meth:`_r_sample`."""
+        if self.outstanding:
+            self._resp_timeout += 1
+            if self.timeout_cycles >= 0 and self._resp_timeout >= self.timeout_cycles:
+                addr = self.outstanding[0].addr
+                msg = (
+                    f"Response timeout: No rvalid after {self._resp_timeout} "
+                    f"cycles (addr=0x{addr:08x})"
+                )
+                self.log.critical(msg)
+                raise TimeoutError(msg)
+        else:
             self._resp_timeout = 0
 
-            self._check_error(op.error_expected, op.addr)
+        if resp is None or not self.outstanding:
+            return
 
-            if not op.write:
-                ret = resolve_x_int(self.bus.rdata) & self.rdata_mask
-                self.log.info(f"Value read: 0x{ret:08x}")
-                if op.data != b"":
-                    data_int = int.from_bytes(op.data, byteorder="little")
-                    if data_int != ret:
-                        raise ValueError(
-                            f"Expected 0x{data_int:08x} doesn't match "
-                            f"returned 0x{ret:08x}"
-                        )
-                ret_bytes = ret.to_bytes(self.rbytes, "little")
+        rid, err, ret = resp
+        if self.out_of_order:
+            op = self._match_rid(rid)
+        else:
+            op = self.outstanding.popleft()
+        self._resp_timeout = 0
+        self._complete(op, err, ret)
+        if self._presented is None and self._can_present():
+            self._a_wake.set()
+
+    def _complete(self, op: _ObiTxOp, err: bool, ret: int) -> None:
+        """Check the response to *op* and wake whoever waits for it."""
+        if op.write:
+            self._retire_write(op)
+        self._check_error(op.error_expected, op.addr, err)
+
+        if op.poll:
+            op.rdata = ret
+        elif not op.write:
+            self.log.info(f"Value read: 0x{ret:08x}")
+            if op.check and op.data != ret:
+                raise ValueError(
+                    f"Expected 0x{op.data:08x} doesn't match returned 0x{ret:08x}"
+                )
+            ret_bytes = ret.to_bytes(self.rbytes, "little")
+            if op.batch is None:
                 self.queue_rx.append((ret_bytes, op.tx_id))
                 self._rx_event.set()
+            else:
+                op.batch.results[op.slot] = ret if self.return_int else ret_bytes
 
+        if op.event is not None:
             op.event.set()
-            self._update_idle()
-            if self._presented is None and self._can_present():
-                self._a_wake.set()
+        if op.batch is not None:
+            op.batch.remaining -= 1
+            if not op.batch.remaining:
+                op.batch.event.set()
+        self._update_idle()
+
+    # --- Transaction-level mode ----------------------------------------------
 
-    def _check_error(self, error_expected: bool, addr: int) -> None:
-        err = bool(int(self.bus.err.value))
+    async def _run_direct(self) -> None:
+        """Apply queued transfers to :attr:`target`, one at a time."""
+        while True:
+            while not self.queue_tx:
+                self._update_idle()
+                self.sync.clear()
+                await self.sync.wait()
+            op = self.queue_tx.popleft()
+            self._log_request(op)
+            self.outstanding.append(op)
+            err, ret = await self._access_target(op)
+            # A poll read always takes a clock, so polling cannot spin
+            # without simulation time passing
+            for _ in range(max(self.latency, op.poll)):
+                await RisingEdge(self.clock)
+            self.outstanding.popleft()
+            self._complete(op, err, ret)
+
+    async def _access_target(self, op: _ObiTxOp) -> tuple[bool, int]:
+        """``(err, rdata)`` of *op* applied to :attr:`target`.
+
+        An :class:`ObiDevice` target handles the access as if it came over
+        its bus. For a memory target, writes go through the byte enables
+        and any exception from the target becomes an error response, as in
+        :class:`ObiDevice`.
+        """
+        be = self._op_be(op)
+        wdata = op.data if op.write else 0
+        if isinstance(self.target, ObiDevice):
+            _, rdata, err = await self.target._process(
+                op.addr, op.write, be, wdata, op.aid
+            )
+            return bool(err), rdata
+        try:
+            if not op.write:
+                data = await self.target.read(op.addr, self.rbytes)
+                return False, int.from_bytes(data, byteorder="little")
+            data = wdata.to_bytes(self.wbytes, "little")
+            if be == self.be_mask:
+                await self.target.write(op.addr, data)
+            else:
+                for i in range(self.wbytes):
+                    if (be >> i) & 1:
+                        await self.target.write(op.addr + i, data[i : i + 1])
+            return False, 0
+        except Exception as e:  # noqa: BLE001 - any target fault becomes err=1
+            self.log.warning(f"Access 0x{op.addr:08x} Invalid: {e}")
+            return True, 0
+
+    def _match_rid(self, rid: int) -> _ObiTxOp:
+        """Retire the in-flight beat whose ``aid`` equals the response ``rid``."""
+        op = self._inflight.pop(rid, None)
+        if op is None:
+            msg = f"Response with rid={rid} matches no outstanding request"
+            self.log.critical(msg)
+            raise OBIError(msg)
+        self.outstanding.remove(op)
+        self._free_ids.append(rid)
+        return op
+
+    def _check_error(self, error_expected: bool, addr: int, err: bool) -> None:
         if err != error_expected:
             msg = (
                 f"ERR: incorrect error received {err} "
@@ -24,12 +24,12 @@ THE SOFTWARE.
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
-from typing import Any, Optional
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from typing import Any
 
-import cocotb
 from cocotb import start_soon
-from cocotb.triggers import ReadOnly, RisingEdge
+from cocotb.triggers import Event, ReadOnly, RisingEdge
 from cocotb.utils import get_sim_time
 
 from .obi_base import ObiBase
@@ -49,6 +49,7 @@ class ObiTransaction:
         rdata: int = 0,
         err: bool = False,
         rid: int = 0,
+        seq: int = 0,
     ) -> None:
         self.addr = addr
         self.we = we
@@ -59,6 +60,8 @@ class ObiTransaction:
         self.rdata = rdata
         self.err = err
         self.rid = rid
+        # Position in grant order, which is the order the target applies them
+        self.seq = seq
 
     def __repr__(self) -> str:  # pragma: no cover
         return (
@@ -72,52 +75,75 @@ class ObiMonitor(ObiBase):
     def __init__(self, bus: ObiBus, clock: Any, **kwargs) -> None:
         super().__init__(bus, clock, name="monitor", **kwargs)
         self.disable_logging()
-        self._queue: list[ObiTransaction] = []
-        self._active: bool = False
-        self._aid_latched: int = 0
-        self._req_sample: Optional[ObiTransaction] = None
+        self._queue: deque[ObiTransaction] = deque()
+        self._queue_event = Event()
+        # Accepted requests awaiting their response, per rid
+        self._pending: dict[int, deque[ObiTransaction]] = {}
+        self._seq = 0
+        self.callbacks: list[Callable[[ObiTransaction], Any]] = []
         self._run_coroutine_obj: Any = None
-        self._check_sync_coroutines: list[Any] = []
-        self._last_clk_time: int = 0
+        self._check_sync_coroutine_obj: Any = None
+        self.sync_violations: dict[str, int] = {}
 
     def start(self) -> None:
         if self._run_coroutine_obj is not None:
             self._run_coroutine_obj.kill()
-        self._run_coroutine_obj = cocotb.start_soon(self._run())
+        self._run_coroutine_obj = start_soon(self._run())
+
+    def add_callback(self, callback: Callable[[ObiTransaction], Any]) -> None:
+        """Call ``callback(txn)`` with every completed transaction.
+
+        Each callback sees every transaction, whoever takes them from the
+        queue with :meth:`recv` or :meth:`drain`.
+        """
+        self.callbacks.append(callback)
 
     def enable_check_sync(self) -> None:
-        """Enable checking that bus signals only change on clock edges."""
+        """Enable checking that bus signals only change on clock edges.
+
+        Every signal is read once when it has settled after an edge and
+        again at the next rising edge, before that edge updates anything.
+        A difference means the signal changed between edges. Violations are
+        counted per signal in :attr:`sync_violations`; only the first one of
+        each signal is logged.
+        """
         self.disable_check_sync()
-        self._last_clk_time = get_sim_time()
-        self._check_sync_coroutines.append(start_soon(self._check_sync_clock()))
-        for name in self.bus._signals:
-            if hasattr(self.bus, name):
-                self._check_sync_coroutines.append(
-                    start_soon(self._check_sync_signal(name, getattr(self.bus, name)))
-                )
+        self._check_sync_coroutine_obj = start_soon(self._check_sync())
 
     def disable_check_sync(self) -> None:
         """Disable the synchronous signal-change check."""
-        for coro in self._check_sync_coroutines:
-            coro.kill()
-        self._check_sync_coroutines.clear()
+        if self._check_sync_coroutine_obj is not None:
+            self._check_sync_coroutine_obj.kill()
+            self._check_sync_coroutine_obj = None
 
-    async def _check_sync_clock(self) -> None:
+    @property
+    def sync_violation_count(self) -> int:
+        """Total number of signal changes seen between clock edges."""
+        return sum(self.sync_violations.values())
+
+    async def _check_sync(self) -> None:
+        names = [name for name in self.bus._signals if hasattr(self.bus, name)]
+        handles = [getattr(self.bus, name) for name in names]
+        await ReadOnly()
+        settled = [h.value for h in handles]
         while True:
             await RisingEdge(self.clock)
-            self._last_clk_time = get_sim_time()
-
-    async def _check_sync_signal(self, name: str, signal: Any) -> None:
-        while True:
-            await signal.value_change
-            if get_sim_time() != self._last_clk_time:
-                await ReadOnly()
-                if get_sim_time() != self._last_clk_time:
-                    self.log.error(
-                        f"Signal {name} changed at {get_sim_time()}, "
-                        f"which is not aligned with the last clock edge at "
-                        f"{self._last_clk_time}"
-                    )
+            before = [h.value for h in handles]
+            if before != settled:
+                for name, old, new in zip(names, settled, before):
+                    if old != new:
+                        self._sync_violation(name)
+            await ReadOnly()
+            settled = [h.value for h in handles]
+
+    def _sync_violation(self, name: str) -> None:
+        count = self.sync_violations.get(name, 0)
+        self.sync_violations[name] = count + 1
+        if count == 0:
+            self.log.error(
+                f"Signal {name} changed between clock edges "
+                f"(seen at the edge at {get_sim_time()})"
+            )
 
     @property
     def empty_txn(self) -> bool:
@@ -125,42 +151,59 @@ class ObiMonitor(ObiBase):
 
     async def _run(self) -> None:
         while True:
-            await RisingEdge(self.clock)
-
-            # Capture A-channel request when req asserted and we're idle
-            if (self.sig_int(self.bus.req) == 1) and not self._active:
-                self._active = True
-                self._aid_latched = self.read_aid()
-                self._req_sample = ObiTransaction(
-                    addr=self.sig_int(self.bus.addr),
-                    we=bool(self.sig_int(self.bus.we)),
-                    be=self.sig_int(self.bus.be),
-                    wdata=self.sig_int(self.bus.wdata),
-                    aid=self._aid_latched,
-                )
-
-            # When response is valid, emit a completed transaction
-            if self._active and self.sig_int(self.bus.rvalid) == 1:
-                r = ObiTransaction(
-                    addr=self._req_sample.addr if self._req_sample else 0,
-                    we=self._req_sample.we if self._req_sample else False,
-                    be=self._req_sample.be if self._req_sample else 0,
-                    wdata=self._req_sample.wdata if self._req_sample else 0,
-                    aid=self._aid_latched,
-                    rvalid=True,
-                    rdata=self.sig_int(self.bus.rdata),
-                    err=bool(self.sig_int(self.bus.err)),
-                    rid=self.sig_int(self.bus.rid) if self.has_rid else 0,
-                )
-                self._queue.append(r)
-                if self.sig_int(self.bus.rready) == 1:
-                    self._active = False
-                    self._req_sample = None
+            await self._sample_cycle(self._observe)
+
+    def _observe(self) -> None:
+        """Record the handshakes of one clock cycle.
+
+        A request is captured when it is granted and emitted as a completed
+        transaction when its response is taken, matched by ``rid`` when the
+        bus has one, so pipelined and out-of-order traffic is followed.
+        """
+        bus = self.bus
+        # A response taken this cycle belongs to a request granted earlier
+        if self.sig_int(bus.rvalid) == 1 and self.sig_int(bus.rready) == 1:
+            rid = self.sig_int(bus.rid) if self.has_rid else 0
+            pending = self._pending.get(rid)
+            if pending:
+                txn = pending.popleft()
+                txn.rvalid = True
+                txn.rdata = self.sig_int(bus.rdata)
+                txn.err = bool(self.sig_int(bus.err))
+                txn.rid = rid
+                self._queue.append(txn)
+                self._queue_event.set()
+                for callback in self.callbacks:
+                    callback(txn)
+
+        if self.sig_int(bus.req) == 1 and self.sig_int(bus.gnt) == 1:
+            aid = self.read_aid()
+            txn = ObiTransaction(
+                addr=self.sig_int(bus.addr),
+                we=bool(self.sig_int(bus.we)),
+                be=self.sig_int(bus.be),
+                wdata=self.sig_int(bus.wdata),
+                aid=aid,
+                seq=self._seq,
+            )
+            self._seq += 1
+            self._pending.setdefault(aid if self.has_rid else 0, deque()).append(txn)
+
+    def drain(self) -> list[ObiTransaction]:
+        """Remove and return every completed transaction received so far."""
+        batch = list(self._queue)
+        self._queue.clear()
+        return batch
+
+    async def wait_txn(self) -> None:
+        """Wait until at least one completed transaction is queued."""
+        while not self._queue:
+            self._queue_event.clear()
+            await self._queue_event.wait()
 
     async def recv(self) -> ObiTransaction:
-        while not self._queue:
-            await RisingEdge(self.clock)
-        return self._queue.pop(0)
+        await self.wait_txn()
+        return self._queue.popleft()
 
     async def __aiter__(self) -> AsyncIterator[ObiTransaction]:
         while True:
@@ -0,0 +1,159 @@
+"""
+
+Copyright (c) 2024-2026 Daxzio
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+
+"""
+
+import logging
+from collections.abc import Iterable, Iterator
+from typing import Any, Union
+
+from cocotb import start_soon
+from cocotb.triggers import Event, ReadOnly, RisingEdge
+
+from .constants import ObiSampling
+from .obi_host import ObiHost
+
+
+class ObiMultiHost:
+    """Several OBI host ports on one clock, driven by a single coroutine.
+
+    Each port is an ordinary :class:`ObiHost` with the same ``write``/``read``
+    API, but instead of three coroutines per port one scheduler samples
+    every port once per rising edge and steps its R channel, ``rready`` and
+    A channel in turn. When no port has work the scheduler sleeps until a
+    transfer is queued, so idle buses cost nothing.
+
+    Parameters
+    ----------
+    buses:
+        Iterable of :class:`ObiBus` objects, one per port. More ports can be
+        added later with :meth:`add_port`.
+    clock:
+        Clock signal shared by all ports.
+    name:
+        Name prefix; port *n* is named ``f"{name}{n}"``.
+    sampling:
+        :class:`ObiSampling` discipline used for every port. Default
+        ``"edge"``.
+    **kwargs:
+        Default keyword arguments for every :class:`ObiHost` port
+        (``timeout_cycles``, ``max_outstanding``, ``seednum``, ...).
+    """
+
+    def __init__(
+        self,
+        buses: Iterable[Any],
+        clock,
+        name: str = "host",
+        sampling: Union[ObiSampling, str] = ObiSampling.EDGE,
+        **kwargs,
+    ) -> None:
+        self.clock = clock
+        self.name = name
+        self.sampling = ObiSampling(sampling)
+        self.log = logging.getLogger(f"cocotb.{name}")
+        self.port_kwargs = kwargs
+        self.ports: list[ObiHost] = []
+        self._wake = Event()
+        self._coroutine_obj: Any = None
+
+        for bus in buses:
+            self.add_port(bus)
+
+        self._restart()
+
+    def add_port(self, bus, **kwargs) -> ObiHost:
+        """Create a host port on *bus* and return it.
+
+        *kwargs* override the defaults given to the constructor.
+        """
+        params = {**self.port_kwargs, **kwargs}
+        params.setdefault("name", f"{self.name}{len(self.ports)}")
+        params["sampling"] = self.sampling
+        if params.get("target") is not None:
+            raise ValueError("transaction-level hosts can't be multi-host ports")
+        port = ObiHost(bus, self.clock, autostart=False, **params)
+        # Queueing a transfer on any port wakes the shared scheduler
+        port.sync = self._wake
+        self.ports.append(port)
+        self._wake.set()
+        return port
+
+    def __getitem__(self, index: int) -> ObiHost:
+        return self.ports[index]
+
+    def __len__(self) -> int:
+        return len(self.ports)
+
+    def __iter__(self) -> Iterator[ObiHost]:
+        return iter(self.ports)
+
+    @property
+    def idle(self) -> bool:
+        return all(port.idle for port in self.ports)
+
+    async def wait(self) -> None:
+        """Wait until every port is idle"""
+        for port in self.ports:
+            await port.wait()
+
+    def start(self) -> None:
+        """(Re)start the scheduler coroutine."""
+        self._restart()
+
+    def _restart(self) -> None:
+        if self._coroutine_obj is not None:
+            self._coroutine_obj.kill()
+        for port in self.ports:
+            port._reset_state()
+        self._coroutine_obj = start_soon(self._run())
+
+    async def _run(self) -> None:
+        # No initial wait, as in ObiHost: a restarted port may still have
+        # responses outstanding
+        while True:
+            if not any(port._active for port in self.ports):
+                for port in self.ports:
+                    port._deassert_req()
+                    port._update_idle()
+                self._wake.clear()
+                await self._wake.wait()
+
+            if self.sampling is ObiSampling.READONLY:
+                await ReadOnly()
+                samples = self._sample()
+                await RisingEdge(self.clock)
+            else:
+                await RisingEdge(self.clock)
+                samples = self._sample()
+            for port, resp, (req, gnt) in samples:
+                port._r_step(resp)
+                port._rready_step()
+                port._a_step(req, gnt)
+                port._a_wake.clear()
+
+    def _sample(self) -> list[tuple[ObiHost, Any, tuple[bool, bool]]]:
+        return [
+            (port, port._r_sample(), port._a_sample())
+            for port in self.ports
+            if port._active
+        ]
@@ -0,0 +1,241 @@
+"""
+
+Copyright (c) 2024-2026 Daxzio
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from typing import Any, Optional
+
+from cocotb import start_soon
+from cocotb.triggers import Event
+
+from .obi_monitor import ObiMonitor, ObiTransaction
+from .sparse_memory import SparseMemory
+
+
+class ObiScoreboard:
+    """Check the reads seen by an :class:`ObiMonitor` against a shadow memory.
+
+    Completed transactions are passed on by a monitor callback, so the
+    monitor's own queue is left to other consumers, and applied in batches
+    in the order they were granted: writes update the shadow through their
+    ``be`` mask, reads are compared with it on the enabled lanes. Transactions
+    with ``err`` set change nothing and are not compared, and those inside a
+    region added with :meth:`exclude` (e.g. volatile status registers) are
+    skipped. Unless *check_unwritten* is set, only bytes that were written
+    or :meth:`load`-ed are compared.
+
+    Mismatches are counted in :attr:`mismatches`; the first *max_failures*
+    are logged and kept in :attr:`failures`. Transactions granted before
+    the scoreboard was created are ignored. A granted request whose
+    response the monitor never saw is skipped once every later one has
+    been checked, with a warning, and counted in :attr:`missing`.
+
+    Parameters
+    ----------
+    monitor:
+        Monitor whose transactions are consumed.
+    memory:
+        Shadow memory, e.g. a preloaded :class:`SparseMemory`. By default an
+        empty one covering the bus address space.
+    check_unwritten:
+        Also compare bytes never written, against the contents of *memory*.
+        Default ``False``.
+    max_failures:
+        Number of mismatches logged and kept. Default 16.
+    autostart:
+        Start consuming the monitor's transactions immediately. Default
+        ``True``.
+    """
+
+    def __init__(
+        self,
+        monitor: ObiMonitor,
+        memory: Optional[Any] = None,
+        check_unwritten: bool = False,
+        max_failures: int = 16,
+        autostart: bool = True,
+    ) -> None:
+        self.monitor = monitor
+        self.byte_lanes = monitor.byte_lanes
+        size = 2**monitor.address_width
+        self.memory = memory if memory is not None else SparseMemory(size)
+        self.check_unwritten = check_unwritten
+        # 0xff for every byte whose shadow value is known
+        self._known = None if check_unwritten else SparseMemory(size)
+        self.max_failures = max_failures
+        self.excluded: list[tuple[int, int]] = []
+        # Byte mask for every be value
+        self._be_masks = [
+            sum(0xFF << (8 * i) for i in range(self.byte_lanes) if (be >> i) & 1)
+            for be in range(1 << self.byte_lanes)
+        ]
+        # Transactions that completed ahead of an earlier grant
+        self._held: dict[int, ObiTransaction] = {}
+        self._next_seq = monitor._seq
+        # Transactions received from the monitor and not yet processed
+        self._inbox: list[ObiTransaction] = []
+        self._inbox_event = Event()
+        monitor.add_callback(self._receive)
+
+        bus_name = monitor.bus._name
+        if bus_name:
+            self.log = logging.getLogger(f"cocotb.obi_scoreboard.{bus_name}")
+        else:
+            self.log = logging.getLogger("cocotb.obi_scoreboard")
+
+        self.reads = 0
+        self.writes = 0
+        self.errors = 0
+        self.skipped = 0
+        self.mismatches = 0
+        self.missing = 0
+        self.failures: list[str] = []
+
+        self._run_coroutine_obj: Any = None
+        if autostart:
+            self.start()
+
+    def start(self) -> None:
+        self.stop()
+        self._run_coroutine_obj = start_soon(self._run())
+
+    def stop(self) -> None:
+        if self._run_coroutine_obj is not None:
+            self._run_coroutine_obj.kill()
+            self._run_coroutine_obj = None
+
+    def exclude(self, base: int, size: int) -> None:
+        """Neither track nor check accesses to ``[base, base + size)``."""
+        if size <= 0:
+            raise ValueError("size must be positive")
+        self.excluded.append((base, size))
+
+    def load(self, addr: int, data: bytes) -> None:
+        """Set shadow contents, e.g. to match a preloaded memory."""
+        self.memory.write(addr, data)
+        if self._known is not None:
+            self._known.write(addr, b"\xff" * len(data))
+
+    def assert_clean(self) -> None:
+        """Raise ``AssertionError`` if any read did not match the shadow."""
+        if self.mismatches:
+            raise AssertionError(
+                f"{self.mismatches} OBI read mismatches, first: {self.failures[0]}"
+            )
+
+    def _receive(self, txn: ObiTransaction) -> None:
+        self._inbox.append(txn)
+        self._inbox_event.set()
+
+    async def _run(self) -> None:
+        while True:
+            while not self._inbox:
+                self._inbox_event.clear()
+                await self._inbox_event.wait()
+            batch = self._inbox
+            self._inbox = []
+            self.process(batch)
+            if self._held:
+                self._skip_missing()
+
+    def process(self, batch: Iterable[ObiTransaction]) -> None:
+        """Check a batch of completed transactions."""
+        held = self._held
+        for txn in batch:
+            if txn.seq != self._next_seq:
+                if txn.seq > self._next_seq:
+                    held[txn.seq] = txn
+                continue
+            self._apply(txn)
+            self._next_seq += 1
+            self._apply_held()
+
+    def _apply_held(self) -> None:
+        held = self._held
+        while self._next_seq in held:
+            self._apply(held.pop(self._next_seq))
+            self._next_seq += 1
+
+    def _skip_missing(self) -> None:
+        """Give up on granted requests that can no longer get a response.
+
+        The monitor pairs responses with the oldest request of their rid, so
+        anything older than every request it still waits for is lost.
+        """
+        monitor = self.monitor
+        oldest = min(
+            (queue[0].seq for queue in monitor._pending.values() if queue),
+            default=monitor._seq,
+        )
+        held = self._held
+        while held and self._next_seq < oldest:
+            resume = min(min(held), oldest)
+            count = resume - self._next_seq
+            self.missing += count
+            self.log.warning(
+                f"Scoreboard: no response seen for {count} transaction(s) "
+                f"granted from #{self._next_seq}, not checked"
+            )
+            self._next_seq = resume
+            self._apply_held()
+
+    def _apply(self, txn: ObiTransaction) -> None:
+        if txn.err:
+            self.errors += 1
+            return
+        addr = txn.addr
+        for base, size in self.excluded:
+            if base <= addr < base + size:
+                self.skipped += 1
+                return
+        lanes = self.byte_lanes
+        mask = self._be_masks[txn.be]
+        shadow = int.from_bytes(self.memory.read(addr, lanes), "little")
+        if txn.we:
+            self.writes += 1
+            value = (shadow & ~mask) | (txn.wdata & mask)
+            self.memory.write(addr, value.to_bytes(lanes, "little"))
+            if self._known is not None:
+                known = int.from_bytes(self._known.read(addr, lanes), "little")
+                self._known.write(addr, (known | mask).to_bytes(lanes, "little"))
+            return
+        self.reads += 1
+        if self._known is not None:
+            mask &= int.from_bytes(self._known.read(addr, lanes), "little")
+        if (shadow ^ txn.rdata) & mask:
+            self._mismatch(txn, shadow, mask)
+
+    def _mismatch(self, txn: ObiTransaction, expected: int, mask: int) -> None:
+        self.mismatches += 1
+        if len(self.failures) < self.max_failures:
+            digits = 2 * self.byte_lanes
+            message = (
+                f"read 0x{txn.addr:08x} returned 0x{txn.rdata:0{digits}x}, "
+                f"expected 0x{expected & mask:0{digits}x} "
+                f"(mask 0x{mask:0{digits}x})"
+            )
+            self.failures.append(message)
+            self.log.error(f"Scoreboard mismatch: {message}")
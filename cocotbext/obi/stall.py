@@ -0,0 +1,140 @@
+"""
+
+Copyright (c) 2024-2026 Daxzio
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+
+"""
+
+import sys
+from array import array
+from collections.abc import Callable
+from random import Random
+from typing import Union
+
+CHANNELS = ("req", "gnt", "rready", "rvalid")
+
+
+class StallDistribution:
+    """Stall lengths for one handshake channel.
+
+    An agent calls the distribution with its own :class:`random.Random`
+    whenever a stall may start, and holds the handshake off for the
+    returned number of cycles (``0`` for no stall). Any callable taking a
+    ``Random`` and returning an ``int`` can be used in its place.
+    """
+
+    def __call__(self, rng: Random) -> int:
+        return 0
+
+
+class NoStall(StallDistribution):
+    """Never stall."""
+
+
+class FixedStall(StallDistribution):
+    """Always stall for *cycles* cycles."""
+
+    def __init__(self, cycles: int) -> None:
+        if cycles < 0:
+            raise ValueError("cycles must be non-negative")
+        self.cycles = cycles
+
+    def __call__(self, rng: Random) -> int:
+        return self.cycles
+
+
+class RandomStall(StallDistribution):
+    """Stall with *probability*, for a uniform ``low..high`` cycles.
+
+    Uses a single ``rng.random()`` draw per call. The defaults match the
+    original coin-flip backpressure: a 1-in-4 chance of a 1 to 8 cycle stall.
+    """
+
+    def __init__(self, probability: float = 0.25, low: int = 1, high: int = 8) -> None:
+        if not 0.0 <= probability <= 1.0:
+            raise ValueError("probability must be between 0 and 1")
+        if low < 0 or high < low:
+            raise ValueError("need 0 <= low <= high")
+        self.probability = probability
+        self.low = low
+        self.high = high
+
+    def __call__(self, rng: Random) -> int:
+        r = rng.random()
+        if r >= self.probability:
+            return 0
+        span = self.high - self.low + 1
+        return self.low + min(span - 1, int(r * span / self.probability))
+
+
+class StallSchedule(StallDistribution):
+    """Precomputed stall lengths, replayed in order.
+
+    Each call returns the next entry and wraps around at the end, so a stall
+    costs one array lookup and the sequence is identical on every simulator.
+    Entries are stored as a compact ``array("H")`` (0 to 65535 cycles).
+    """
+
+    def __init__(self, stalls) -> None:
+        self.stalls = array("H", stalls)
+        if not self.stalls:
+            raise ValueError("stall schedule must not be empty")
+        self.index = 0
+
+    @classmethod
+    def generate(
+        cls,
+        distribution: Callable[[Random], int],
+        length: int,
+        rng: Union[Random, int, None] = None,
+    ) -> "StallSchedule":
+        """Draw *length* stalls from *distribution* using *rng* (or a seed)."""
+        if not isinstance(rng, Random):
+            rng = Random(rng)
+        return cls(distribution(rng) for _ in range(length))
+
+    def __call__(self, rng: Random) -> int:
+        value = self.stalls[self.index]
+        self.index += 1
+        if self.index == len(self.stalls):
+            self.index = 0
+        return value
+
+    def __len__(self) -> int:
+        return len(self.stalls)
+
+    def reset(self) -> None:
+        """Replay from the first entry."""
+        self.index = 0
+
+    def to_hex(self) -> str:
+        """Little-endian hex encoding of the schedule, for saving to a file."""
+        data = array("H", self.stalls)
+        if sys.byteorder != "little":
+            data.byteswap()
+        return data.tobytes().hex()
+
+    @classmethod
+    def from_hex(cls, text: str) -> "StallSchedule":
+        data = array("H")
+        data.frombytes(bytes.fromhex(text))
+        if sys.byteorder != "little":
+            data.byteswap()
+        return cls(data)
@@ -0,0 +1,171 @@
+"""
+
+Copyright (c) 2024-2026 Daxzio
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+
+"""
+
+from collections import deque
+from typing import Optional
+
+
+class TimingModel:
+    """Deterministic performance model for an OBI device.
+
+    :class:`~cocotbext.obi.ObiDevice` asks :meth:`can_accept` before driving
+    ``gnt`` for a cycle and calls :meth:`accept` once for every request it
+    accepts. The value returned by :meth:`accept` is the number of extra
+    cycles before the response may be presented.
+
+    The base class adds no latency and never blocks a grant. Subclasses model
+    one effect each; combine them with :class:`CompositeTiming`.
+    """
+
+    def can_accept(self, cycle: int) -> bool:
+        """True if ``gnt`` may be asserted in *cycle*."""
+        return True
+
+    def accept(self, cycle: int, addr: int, we: bool) -> int:
+        """Record a request accepted in *cycle* and return its extra latency."""
+        return 0
+
+    def reset(self) -> None:
+        """Forget any state built up by earlier requests."""
+
+
+class FixedLatency(TimingModel):
+    """Constant response latency, optionally different for writes."""
+
+    def __init__(self, cycles: int, write_cycles: Optional[int] = None) -> None:
+        if cycles < 0 or (write_cycles is not None and write_cycles < 0):
+            raise ValueError("latency must be non-negative")
+        self.cycles = cycles
+        self.write_cycles = cycles if write_cycles is None else write_cycles
+
+    def accept(self, cycle: int, addr: int, we: bool) -> int:
+        return self.write_cycles if we else self.cycles
+
+
+class RegionLatency(TimingModel):
+    """Response latency per address range, *default* elsewhere."""
+
+    def __init__(self, default: int = 0) -> None:
+        self.default = default
+        self.regions: list[tuple[int, int, int]] = []
+
+    def add(self, base: int, size: int, cycles: int) -> None:
+        """Delay responses to ``[base, base + size)`` by *cycles* clocks."""
+        if size <= 0 or cycles < 0:
+            raise ValueError("size must be positive and cycles non-negative")
+        for b, s, _ in self.regions:
+            if base < b + s and b < base + size:
+                raise ValueError("overlaps existing latency region")
+        self.regions.append((base, size, cycles))
+
+    def latency(self, addr: int) -> int:
+        for base, size, cycles in self.regions:
+            if base <= addr < base + size:
+                return cycles
+        return self.default
+
+    def accept(self, cycle: int, addr: int, we: bool) -> int:
+        return self.latency(addr)
+
+
+class BandwidthLimit(TimingModel):
+    """Accept at most *beats* requests in any *window* consecutive cycles."""
+
+    def __init__(self, beats: int, window: int) -> None:
+        if beats < 1 or window < beats:
+            raise ValueError("need 1 <= beats <= window")
+        self.beats = beats
+        self.window = window
+        self._accepted: deque[int] = deque()
+
+    def can_accept(self, cycle: int) -> bool:
+        while self._accepted and self._accepted[0] <= cycle - self.window:
+            self._accepted.popleft()
+        return len(self._accepted) < self.beats
+
+    def accept(self, cycle: int, addr: int, we: bool) -> int:
+        self._accepted.append(cycle)
+        return 0
+
+    def reset(self) -> None:
+        self._accepted.clear()
+
+
+class BankConflict(TimingModel):
+    """Interleaved banks that stay busy for *busy* cycles after each access.
+
+    The bank is ``(addr // interleave) % banks``. A request to a bank that is
+    still busy waits for it, and that wait is returned as extra latency.
+    """
+
+    def __init__(self, banks: int, interleave: int, busy: int) -> None:
+        if banks < 1 or interleave < 1 or busy < 0:
+            raise ValueError("banks and interleave must be positive")
+        self.banks = banks
+        self.interleave = interleave
+        self.busy = busy
+        self._free_at = [0] * banks
+
+    def bank(self, addr: int) -> int:
+        return (addr // self.interleave) % self.banks
+
+    def accept(self, cycle: int, addr: int, we: bool) -> int:
+        bank = self.bank(addr)
+        wait = max(0, self._free_at[bank] - cycle)
+        self._free_at[bank] = cycle + wait + self.busy
+        return wait
+
+    def reset(self) -> None:
+        self._free_at = [0] * self.banks
+
+
+class RefreshWindow(TimingModel):
+    """Block grants for *duration* cycles out of every *period*."""
+
+    def __init__(self, period: int, duration: int, offset: int = 0) -> None:
+        if period < 1 or not 0 <= duration < period:
+            raise ValueError("need 0 <= duration < period")
+        self.period = period
+        self.duration = duration
+        self.offset = offset
+
+    def can_accept(self, cycle: int) -> bool:
+        return (cycle - self.offset) % self.period >= self.duration
+
+
+class CompositeTiming(TimingModel):
+    """Combine models: a grant needs every model, latencies add up."""
+
+    def __init__(self, *models: TimingModel) -> None:
+        self.models = list(models)
+
+    def can_accept(self, cycle: int) -> bool:
+        return all(m.can_accept(cycle) for m in self.models)
+
+    def accept(self, cycle: int, addr: int, we: bool) -> int:
+        return sum(m.accept(cycle, addr, we) for m in self.models)
+
+    def reset(self) -> None:
+        for m in self.models:
+            m.reset()
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Run the cocotb test suites for several simulators and seeds in parallel.
+
+Every (suite, variant, simulator) is compiled once into its own build
+directory under --out. The first seed of each build compiles it, and the
+remaining seeds reuse it, running concurrently with everything else. Each
+run writes its own results file and log, and all results are merged into
+one JUnit file (--junit).
+
+    python scripts/regress.py --sims icarus verilator --seeds 8 -j 16
+    python scripts/regress.py --suites test_pipelining --seed-list 1 2 3
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+from collections.abc import Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+TESTS = ROOT / "tests"
+
+# One `make test_all` line: the suite directory and the make variables
+SUITE_LINE = re.compile(r"cd tests/(\w+) && \$\(MAKE\) clean sim (.*?)\)")
+
+
+def load_suites(makefile: Path = ROOT / "Makefile") -> list[tuple[str, dict[str, str]]]:
+    """
+    Read the suites and their make variables from `make test_all`.
+
+    The regression runs exactly what `make test_all` runs, so the two lists
+    cannot drift apart. SIM and WAVES are set per run and left out.
+
+    Returns:
+        (suite directory, make variables) in Makefile order
+    """
+    suites = []
+    for suite, args in SUITE_LINE.findall(makefile.read_text()):
+        variables = dict(arg.split("=", 1) for arg in args.split() if "=" in arg)
+        variables.pop("SIM", None)
+        variables.pop("WAVES", None)
+        suites.append((suite, variables))
+    if not suites:
+        raise RuntimeError(f"no test suites found in {makefile}")
+    return suites
+
+
+SUITES = load_suites()
+
+
+class Build(NamedTuple):
+    suite: str
+    variables: tuple[tuple[str, str], ...]
+    sim: str
+
+    @property
+    def name(self) -> str:
+        parts = [self.suite] + [f"{k}{v}" for k, v in self.variables] + [self.sim]
+        return "-".join(parts)
+
+
+class Result(NamedTuple):
+    build: Build
+    seed: int
+    returncode: int
+    seconds: float
+    results_file: Path
+    log_file: Path
+
+
+def run_seed(build: Build, seed: int, out: Path) -> Result:
+    """
+    Run one seed of a build with make, in the build's own directories.
+
+    Args:
+        build: Suite, make variables and simulator
+        seed: Value for COCOTB_RANDOM_SEED (RANDOM_SEED before cocotb 2.0)
+        out: Root of the regression output tree
+
+    Returns:
+        The outcome, with the paths of the results file and log
+    """
+    build_dir = out / build.name
+    build_dir.mkdir(parents=True, exist_ok=True)
+    results_file = build_dir / f"results_{seed}.xml"
+    log_file = build_dir / f"seed_{seed}.log"
+    results_file.unlink(missing_ok=True)
+
+    # `regression` instead of `sim`: the suite Makefiles make `sim` wipe the
+    # build directory for icarus, which is exactly what is to be reused.
+    cmd = [
+        "make",
+        "-C",
+        str(TESTS / build.suite),
+        "regression",
+        f"SIM={build.sim}",
+        "WAVES=0",
+        f"SIM_BUILD={build_dir / 'sim_build'}",
+        f"COCOTB_RESULTS_FILE={results_file}",
+        f"COCOTB_RANDOM_SEED={seed}",
+        f"RANDOM_SEED={seed}",
+    ] + [f"{k}={v}" for k, v in build.variables]
+
+    start = time.monotonic()
+    with open(log_file, "w") as log:
+        proc = subprocess.run(cmd, check=False, stdout=log, stderr=subprocess.STDOUT)
+    return Result(
+        build, seed, proc.returncode, time.monotonic() - start, results_file, log_file
+    )
+
+
+def run_regression(
+    builds: Sequence[Build], seeds: Sequence[int], out: Path, jobs: int
+) -> list[Result]:
+    """
+    Run every seed of every build on a pool of *jobs* workers.
+
+    The first seed of a build compiles it; its other seeds are only queued
+    once that has finished, so they all reuse the compiled build.
+
+    Args:
+        builds: Builds to run
+        seeds: Seeds to run each build with
+        out: Root of the regression output tree
+        jobs: Number of simulations to run at once
+
+    Returns:
+        One result per build and seed, in completion order
+    """
+    results: list[Result] = []
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        pending: set[Future] = {
+            pool.submit(run_seed, build, seeds[0], out) for build in builds
+        }
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                results.append(result)
+                report(result)
+                # Without a results file the build itself failed; other
+                # seeds would only race to rebuild it
+                if result.seed == seeds[0] and result.results_file.exists():
+                    for seed in seeds[1:]:
+                        pending.add(pool.submit(run_seed, result.build, seed, out))
+    return results
+
+
+def count_tests(results_file: Path) -> tuple[int, int]:
+    """
+    Count the tests and failures in a cocotb results file.
+
+    Returns:
+        (tests, failures); (0, 0) if the file is missing or unreadable
+    """
+    try:
+        root = ET.parse(results_file).getroot()
+    except (OSError, ET.ParseError):
+        return 0, 0
+    cases = root.findall(".//testcase")
+    failed = [
+        c for c in cases if c.find("failure") is not None or c.find("error") is not None
+    ]
+    return len(cases), len(failed)
+
+
+def passed(result: Result) -> bool:
+    tests, failures = count_tests(result.results_file)
+    return result.returncode == 0 and tests > 0 and failures == 0
+
+
+def report(result: Result) -> None:
+    tests, failures = count_tests(result.results_file)
+    status = "PASS" if passed(result) else "FAIL"
+    print(
+        f"{status} {result.build.name} seed={result.seed} "
+        f"tests={tests} failures={failures} {result.seconds:.1f}s",
+        flush=True,
+    )
+    if status == "FAIL":
+        print(f"     log: {result.log_file}", flush=True)
+
+
+def merge_results(results: Sequence[Result], junit: Path) -> None:
+    """
+    Merge the results files of all runs into one JUnit file.
+
+    Each run becomes a testsuite named after its build and seed. A run
+    that wrote no results file (e.g. a compile error) is recorded as a
+    single errored testcase pointing at its log.
+    """
+    merged = ET.Element("testsuites", name="cocotbext-obi regression")
+    for result in sorted(results, key=lambda r: (r.build.name, r.seed)):
+        name = f"{result.build.name}.seed{result.seed}"
+        suite = ET.SubElement(merged, "testsuite", name=name)
+        try:
+            cases = ET.parse(result.results_file).getroot().findall(".//testcase")
+        except (OSError, ET.ParseError):
+            cases = []
+        for case in cases:
+            case.set("classname", f"{name}.{case.get('classname', '')}")
+            suite.append(case)
+        if not cases:
+            case = ET.SubElement(suite, "testcase", classname=name, name="make")
+            ET.SubElement(
+                case,
+                "error",
+                message=f"make exited with {result.returncode}, see {result.log_file}",
+            )
+        suite.set("tests", str(len(suite.findall("testcase"))))
+    ET.indent(merged)
+    ET.ElementTree(merged).write(junit, encoding="utf-8", xml_declaration=True)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--sims", nargs="+", default=["icarus", "verilator"])
+    parser.add_argument(
+        "--suites", nargs="+", help="Suite directories to run (default: all)"
+    )
+    seeds = parser.add_mutually_exclusive_group()
+    seeds.add_argument(
+        "--seeds", type=int, default=1, help="Run seeds 1..N (default: 1)"
+    )
+    seeds.add_argument("--seed-list", nargs="+", type=int, help="Explicit seeds")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count() or 1, help="Parallel runs"
+    )
+    parser.add_argument(
+        "--out", type=Path, default=ROOT / "regress_build", help="Output directory"
+    )
+    parser.add_argument(
+        "--junit",
+        type=Path,
+        default=None,
+        help="Merged results file (default: OUT/results.xml)",
+    )
+    args = parser.parse_args(argv)
+
+    suites = SUITES
+    if args.suites:
+        unknown = set(args.suites) - {suite for suite, _ in SUITES}
+        if unknown:
+            parser.error(f"unknown suites: {', '.join(sorted(unknown))}")
+        suites = [s for s in SUITES if s[0] in args.suites]
+    seed_list = args.seed_list or list(range(1, args.seeds + 1))
+    builds = [
+        Build(suite, tuple(sorted(variables.items())), sim)
+        for sim in args.sims
+        for suite, variables in suites
+    ]
+    out = args.out.resolve()
+    junit = args.junit or out / "results.xml"
+
+    print(
+        f"Running {len(builds)} builds x {len(seed_list)} seeds "
+        f"on {args.jobs} workers into {out}",
+        flush=True,
+    )
+    start = time.monotonic()
+    results = run_regression(builds, seed_list, out, args.jobs)
+    merge_results(results, junit)
+
+    failed = [r for r in results if not passed(r)]
+    print(
+        f"{len(results) - len(failed)}/{len(results)} runs passed "
+        f"in {time.monotonic() - start:.1f}s, results in {junit}"
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,27 @@
+"""Shared fixtures for the pure-Python tests on the mock bus."""
+
+import pytest
+
+from cocotbext.obi import MemoryRegion, MockBus, ObiDevice, ObiHost
+
+
+@pytest.fixture
+def obi_pair():
+    """Factory connecting an ObiHost to a memory-backed ObiDevice.
+
+    ``obi_pair(sim, device={...}, **host_kwargs)`` returns ``(host, device)``
+    on a bus with 2-bit ids. Both sides allow 4 outstanding transfers;
+    *host_kwargs* go to ObiHost and the *device* dict to ObiDevice.
+    """
+
+    def make(sim, device=None, **host_kwargs):
+        bus = MockBus(sim, id_width=2)
+        host = ObiHost(bus, sim.clock, **{"max_outstanding": 4, **host_kwargs})
+        dev = ObiDevice(
+            bus,
+            sim.clock,
+            **{"target": MemoryRegion(2**12), "max_outstanding": 4, **(device or {})},
+        )
+        return host, dev
+
+    return make
@@ -1,5 +1,6 @@
 from random import randint
 from cocotb import test
+from cocotb.utils import get_sim_time
 
 from interfaces.clkrst import ClkReset
 
@@ -10,6 +11,10 @@ from cocotbext.obi.obi_device import ObiDevice
 from cocotbext.obi.obi_ram import ObiRam
 
 from cocotbext.obi.address_space import MemoryRegion
+from cocotbext.obi.timing_model import BandwidthLimit
+from cocotbext.obi.timing_model import CompositeTiming
+from cocotbext.obi.timing_model import FixedLatency
+from cocotbext.obi.timing_model import RefreshWindow
 
 
 class testbench:
@@ -130,6 +135,43 @@ async def test_obi_device(dut):
     await tb.cr.end_test(20)
 
 
+class CountingDevice(ObiDevice):
+    """ObiDevice counting the requests it accepts"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.accepted = 0
+
+    async def _process(self, addr, we, be, wdata, aid):
+        self.accepted += 1
+        return await super()._process(addr, we, be, wdata, aid)
+
+
+@test()
+async def test_obi_device_single_grant(dut):
+    """Every request is granted and answered exactly once"""
+    tb = testbench(dut, reset_sense=1)
+    tb.m.max_outstanding = 4
+    tb.s = CountingDevice(tb.mbus, getattr(dut, "clk"), max_outstanding=4)
+    tb.s.target = MemoryRegion(2**tb.s.address_width)
+
+    await tb.cr.wait_clkn(20)
+    # gnt signals readiness, so an idle device holds it high
+    assert tb.mbus.gnt.value == 1
+
+    tb.m.enable_backpressure()
+    tb.s.enable_backpressure()
+    x = [randint(0, 0xFFFFFFFF) for _ in range(32)]
+    for i in range(32):
+        tb.m.write_nowait(0x0000 + i * 0x4, x[i])
+    for i in range(32):
+        await tb.m.read(0x0000 + i * 0x4, x[i])
+    await tb.m.wait()
+    assert tb.s.accepted == 64
+
+    await tb.cr.end_test(20)
+
+
 @test()
 async def test_obi_ram(dut):
     tb = testbench(dut, reset_sense=1)
@@ -180,3 +222,91 @@ async def test_obi_ram(dut):
         assert int.from_bytes(r, "little") == x[i]
 
     await tb.cr.end_test(20)
+
+
+@test()
+async def test_obi_ram_timing(dut):
+    tb = testbench(dut, reset_sense=1)
+    tb.s = ObiRam(tb.mbus, getattr(dut, "clk"), timing=FixedLatency(12))
+    tb.s.add_latency_region(0x1000, 0x1000, 30)
+
+    await tb.cr.wait_clkn(20)
+
+    start = get_sim_time("ns")
+    await tb.m.write(0x0010, 0x87654321)
+    await tb.m.read(0x0010, 0x87654321)
+    assert get_sim_time("ns") - start >= 2 * 12 * tb.cr.period
+
+    start = get_sim_time("ns")
+    await tb.m.read(0x1010, 0x00000000)
+    assert get_sim_time("ns") - start >= (12 + 30) * tb.cr.period
+
+    # One beat every four cycles, with a refresh gap every 64 cycles
+    tb.s.timing = CompositeTiming(BandwidthLimit(1, 4), RefreshWindow(64, 8))
+    x = [randint(0, 0xFFFFFFFF) for _ in range(32)]
+    start = get_sim_time("ns")
+    for i in range(32):
+        tb.m.write_nowait(0x0000 + i * 0x4, x[i])
+    await tb.m.wait()
+    assert get_sim_time("ns") - start >= 31 * 4 * tb.cr.period
+
+    for i in range(32):
+        await tb.m.read(0x0000 + i * 0x4, x[i])
+
+    await tb.cr.end_test(20)
+
+
+@test()
+async def test_monitor_check_sync(dut):
+    tb = testbench(dut, reset_sense=1)
+    tb.s = ObiRam(tb.mbus, getattr(dut, "clk"))
+    tb.obi_mon.enable_check_sync()
+
+    await tb.cr.wait_clkn(20)
+
+    tb.m.enable_backpressure()
+    tb.s.enable_backpressure()
+    x = [randint(0, 0xFFFFFFFF) for _ in range(32)]
+    for i in range(32):
+        tb.m.write_nowait(0x0000 + i * 0x4, x[i])
+    for i in range(32):
+        tb.m.read_nowait(0x0000 + i * 0x4, x[i])
+    await tb.m.wait()
+
+    assert tb.obi_mon.sync_violation_count == 0
+    tb.obi_mon.disable_check_sync()
+
+    await tb.cr.end_test(20)
+
+
+@test()
+async def test_monitor_pipelined(dut):
+    """The monitor pairs pipelined, backpressured requests with their responses"""
+    tb = testbench(dut, reset_sense=1)
+    tb.m.max_outstanding = 4
+    tb.s = ObiDevice(tb.mbus, getattr(dut, "clk"), max_outstanding=4)
+    tb.s.target = MemoryRegion(2**tb.s.address_width)
+    tb.m.enable_backpressure()
+    tb.s.enable_backpressure()
+
+    await tb.cr.wait_clkn(20)
+    tb.obi_mon.drain()
+
+    x = [randint(0, 0xFFFFFFFF) for _ in range(16)]
+    for i in range(16):
+        tb.m.write_nowait(0x0100 + i * 0x4, x[i])
+    for i in range(16):
+        tb.m.read_nowait(0x0100 + i * 0x4)
+    await tb.m.wait()
+    await tb.cr.wait_clkn(2)
+
+    txns = tb.obi_mon.drain()
+    assert len(txns) == 32
+    assert [t.seq for t in txns] == sorted(t.seq for t in txns)
+    for i, t in enumerate(txns[:16]):
+        assert t.we and t.addr == 0x0100 + i * 0x4 and t.wdata == x[i]
+    for i, t in enumerate(txns[16:]):
+        assert not t.we and t.addr == 0x0100 + i * 0x4 and t.rdata == x[i]
+    assert not any(t.err for t in txns)
+
+    await tb.cr.end_test(20)
@@ -53,3 +53,40 @@ def test_format_addr_col_alignment():
     long = m._format_addr_col("AES_CTRL_AUX_SHADOWED")
     assert len(short) == len(long)
     assert m._format_addr_col("AES_KEY_SHARE0[7]").endswith(" ")
+
+
+def test_format_addr_alignment_and_shared_base():
+    m = _host_with_map({"A": 0x00, "B": 0x02, "ALIAS": 0x10, "C": 0x10})
+    assert m.format_addr(0x0C) == "A[3]"
+    assert m.format_addr(0x0E) == "B[3]"
+    assert m.format_addr(0x01) == "0x00000001"
+    # The first name listed for a base wins
+    assert m.format_addr(0x14) == "ALIAS[1]"
+
+
+def test_format_addr_after_map_changes():
+    m = _host_with_map({"A": 0x00})
+    assert m.format_addr(0x20) == "A[8]"
+    m.addrmap[0] = {"A": 0x00, "B": 0x20}
+    assert m.format_addr(0x20) == "B"
+    m.addrmap[0]["C"] = 0x40
+    assert m.format_addr(0x44) == "C[1]"
+
+
+def test_format_addr_after_value_edited_in_place():
+    m = _host_with_map({"A": 0x00, "B": 0x20})
+    assert m.format_addr(0x24) == "B[1]"
+    m.addrmap[0]["B"] = 0x40
+    assert m.format_addr(0x24) == "A[9]"
+    assert m.format_addr(0x44) == "B[1]"
+    del m.addrmap[0]["B"]
+    assert m.format_addr(0x44) == "A[17]"
+
+
+def test_addrmap_stores_a_copy():
+    regs = {"A": 0x00}
+    am = AddressMap(word_bytes=4)
+    am.add(regs)
+    regs["A"] = 0x10
+    assert am.resolve("A") == 0x00
+    assert am.format(0x10) == "A[4]"
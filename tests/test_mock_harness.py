@@ -0,0 +1,276 @@
+"""ObiHost and ObiDevice on the pure-Python mock bus (no simulator)."""
+
+from random import Random
+
+import pytest
+
+from cocotbext.obi import (
+    FixedLatency,
+    MemoryRegion,
+    MockBus,
+    MockSim,
+    ObiDevice,
+    ObiHost,
+    ObiMonitor,
+    ObiProtocolChecker,
+    ObiScoreboard,
+    StallSchedule,
+    TimingModel,
+)
+from cocotbext.obi.mock import Event, MockSignal, ReadOnly, RisingEdge
+
+
+@pytest.mark.parametrize("sampling", ["edge", "readonly"])
+def test_write_read_roundtrip(sampling):
+    with MockSim() as sim:
+        bus = MockBus(sim, "obi")
+        host = ObiHost(bus, sim.clock, sampling=sampling)
+        region = MemoryRegion(2**16)
+        ObiDevice(bus, sim.clock, target=region, sampling=sampling)
+        checker = ObiProtocolChecker(bus, sim.clock, sampling=sampling)
+
+        async def test():
+            await host.write(0x10, b"\x01\x02\x03\x04")
+            await host.write(0x14, 0xCAFEF00D)
+            assert await host.read(0x10) == b"\x01\x02\x03\x04"
+            await host.read(0x14, 0xCAFEF00D)
+            return await region.read(0x10, 8)
+
+        assert sim.run_until(test()) == bytes.fromhex("01020304 0df0feca")
+        checker.assert_clean()
+
+
+@pytest.mark.parametrize("order", ["in_order", "random"])
+def test_pipelined_traffic_with_backpressure(order):
+    with MockSim() as sim:
+        bus = MockBus(sim, id_width=2)
+        host = ObiHost(bus, sim.clock, seednum=1)
+        device = ObiDevice(
+            bus,
+            sim.clock,
+            max_outstanding=4,
+            order=order,
+            timing=FixedLatency(1, write_cycles=0),
+            seednum=2,
+        )
+        host.enable_backpressure()
+        device.enable_backpressure()
+        checker = ObiProtocolChecker(bus, sim.clock)
+        monitor = ObiMonitor(bus, sim.clock)
+        monitor.start()
+        scoreboard = ObiScoreboard(monitor, check_unwritten=True)
+        rng = Random(3)
+        expected = {}
+
+        async def test():
+            for _ in range(300):
+                addr = rng.randrange(64) * 4
+                if rng.random() < 0.5:
+                    data = rng.randbytes(4)
+                    expected[addr] = data
+                    host.write_nowait(addr, data)
+                elif addr in expected:
+                    host.read_nowait(addr)
+            await host.wait()
+            for addr, data in expected.items():
+                await host.read(addr, data)
+
+        sim.run_until(test())
+        sim.run(2)
+        checker.assert_clean()
+        scoreboard.assert_clean()
+        assert scoreboard.reads >= len(expected)
+
+
+def test_equal_responses_are_retired_by_identity():
+    class SameReadyCycle(TimingModel):
+        def accept(self, cycle, addr, we):
+            return 20 - cycle
+
+    class YoungestFirst(ObiDevice):
+        def _select(self, pending, cycle):
+            ready = [i for i, resp in enumerate(pending) if resp.ready <= cycle]
+            if not ready:
+                return None
+            presented.append(pending[ready[-1]])
+            return ready[-1]
+
+    presented = []
+    with MockSim() as sim:
+        bus = MockBus(sim)
+        host = ObiHost(bus, sim.clock, max_outstanding=4)
+        # Four reads of one word with one ready cycle: equal-valued responses
+        YoungestFirst(bus, sim.clock, max_outstanding=4, timing=SameReadyCycle())
+        for _ in range(4):
+            host.read_nowait(0x10)
+        sim.run_until(host.wait())
+
+    assert len(presented) == 4
+    assert len({id(resp) for resp in presented}) == 4
+
+
+def test_scoreboard_and_recv_share_a_monitor():
+    with MockSim() as sim:
+        bus = MockBus(sim)
+        host = ObiHost(bus, sim.clock)
+        ObiDevice(bus, sim.clock)
+        monitor = ObiMonitor(bus, sim.clock)
+        monitor.start()
+        scoreboard = ObiScoreboard(monitor)
+        received = []
+
+        async def consumer():
+            async for txn in monitor:
+                received.append(txn)
+
+        sim.start_soon(consumer())
+
+        async def test():
+            for i in range(16):
+                await host.write(4 * i, i)
+                await host.read(4 * i, i)
+
+        sim.run_until(test())
+        sim.run(2)
+        assert len(received) == 32
+        assert (scoreboard.writes, scoreboard.reads) == (16, 16)
+        scoreboard.assert_clean()
+
+
+class _RecordingSignal(MockSignal):
+    """Records every value written, with the cycle it was written in."""
+
+    def __init__(self, sim, name):
+        super().__init__(sim, name)
+        self.writes = []
+
+    @MockSignal.value.setter
+    def value(self, value):
+        self.writes.append((self.sim.cycle, int(value)))
+        MockSignal.value.fset(self, value)
+
+
+def test_rready_only_written_when_a_stall_starts_or_ends():
+    with MockSim() as sim:
+        bus = MockBus(sim)
+        bus.rready = _RecordingSignal(sim, "rready")
+        host = ObiHost(bus, sim.clock, max_outstanding=4, seednum=7)
+        ObiDevice(bus, sim.clock, max_outstanding=4)
+        host.set_stall("rready", StallSchedule([0, 2, 0, 0, 3]))
+        host.enable_backpressure(rready=True)
+        del bus.rready.writes[:]
+
+        async def test():
+            for i in range(64):
+                host.write_nowait(4 * i, i)
+            await host.wait()
+
+        sim.run_until(test())
+        # Let a stall drawn on the last response run out
+        sim.run(4)
+        writes = bus.rready.writes
+        values = [value for _, value in writes]
+        assert values == [0, 1] * (len(writes) // 2)
+        # Low for exactly the length of each stall
+        stalls = [
+            end - start for (start, _), (end, _) in zip(writes[::2], writes[1::2])
+        ]
+        assert set(stalls) == {2, 3}
+        assert len(writes) < sim.cycle // 2
+
+
+def test_first_response_can_be_stalled():
+    with MockSim() as sim:
+        bus = MockBus(sim)
+        host = ObiHost(bus, sim.clock)
+        ObiDevice(bus, sim.clock)
+        host.set_stall("rready", StallSchedule([3]))
+        host.enable_backpressure(rready=True)
+        trace = []
+
+        async def sample():
+            while True:
+                await ReadOnly()
+                if int(bus.rvalid.value):
+                    trace.append(int(bus.rready.value))
+                await RisingEdge(sim.clock)
+
+        sim.start_soon(sample())
+        sim.run(5)
+        sim.run_until(host.write(0x0, 1))
+        assert trace == [0, 0, 0, 1]
+
+
+def test_check_sync_flags_changes_between_edges():
+    with MockSim() as sim:
+        bus = MockBus(sim)
+        monitor = ObiMonitor(bus, sim.clock)
+        monitor.enable_check_sync()
+
+        async def drive():
+            # Changes on the clock edge are fine
+            for i in range(8):
+                await RisingEdge(sim.clock)
+                bus.wdata.value = i
+
+        sim.run_until(drive())
+        sim.run(2)
+        assert monitor.sync_violations == {}
+        # Changed after the ReadOnly phase, before the next edge
+        bus.addr.value = 1
+        sim.run(4)
+        assert monitor.sync_violations == {"addr": 1}
+        assert monitor.sync_violation_count == 1
+
+
+def test_scheduler_phases():
+    with MockSim() as sim:
+        bus = MockBus(sim)
+        event = Event()
+        seen = []
+
+        async def driver():
+            await RisingEdge(sim.clock)
+            bus.req.value = 1
+            seen.append(("drive", sim.cycle, int(bus.req.value)))
+            await ReadOnly()
+            seen.append(("settled", sim.cycle, int(bus.req.value)))
+            with pytest.raises(RuntimeError):
+                bus.req.value = 0
+            event.set()
+
+        async def waiter():
+            await event.wait()
+            seen.append(("event", sim.cycle, sim.readonly))
+            return sim.get_sim_time("ns")
+
+        sim.start_soon(driver())
+        assert sim.run_until(waiter()) == 10
+        assert seen == [
+            ("drive", 1, 0),
+            ("settled", 1, 1),
+            ("event", 1, True),
+        ]
+
+
+def test_timeout_and_task_errors():
+    with MockSim() as sim:
+
+        async def forever():
+            while True:
+                await RisingEdge(sim.clock)
+
+        with pytest.raises(TimeoutError):
+            sim.run_until(forever(), max_cycles=10)
+
+        async def fail():
+            await RisingEdge(sim.clock)
+            raise ValueError("boom")
+
+        sim.start_soon(fail())
+        with pytest.raises(ValueError, match="boom"):
+            sim.run(2)
+    # Leaving the block restores the cocotb names
+    from cocotbext.obi import obi_host
+
+    assert obi_host.RisingEdge is not RisingEdge
@@ -0,0 +1,173 @@
+module dut (
+    input  wire clk,
+    input  wire rst,
+
+    // Port 0
+    input  wire        s0_obi_req,
+    output wire        s0_obi_gnt,
+    input  wire [31:0] s0_obi_addr,
+    input  wire        s0_obi_we,
+    input  wire [3:0]  s0_obi_be,
+    input  wire [31:0] s0_obi_wdata,
+    input  wire [0:0]  s0_obi_aid,
+    output wire        s0_obi_rvalid,
+    input  wire        s0_obi_rready,
+    output wire [31:0] s0_obi_rdata,
+    output wire        s0_obi_err,
+    output wire [0:0]  s0_obi_rid,
+
+    output wire        m0_obi_req,
+    input  wire        m0_obi_gnt,
+    output wire [31:0] m0_obi_addr,
+    output wire        m0_obi_we,
+    output wire [3:0]  m0_obi_be,
+    output wire [31:0] m0_obi_wdata,
+    output wire [0:0]  m0_obi_aid,
+    input  wire        m0_obi_rvalid,
+    output wire        m0_obi_rready,
+    input  wire [31:0] m0_obi_rdata,
+    input  wire        m0_obi_err,
+    input  wire [0:0]  m0_obi_rid,
+
+    // Port 1
+    input  wire        s1_obi_req,
+    output wire        s1_obi_gnt,
+    input  wire [31:0] s1_obi_addr,
+    input  wire        s1_obi_we,
+    input  wire [3:0]  s1_obi_be,
+    input  wire [31:0] s1_obi_wdata,
+    input  wire [0:0]  s1_obi_aid,
+    output wire        s1_obi_rvalid,
+    input  wire        s1_obi_rready,
+    output wire [31:0] s1_obi_rdata,
+    output wire        s1_obi_err,
+    output wire [0:0]  s1_obi_rid,
+
+    output wire        m1_obi_req,
+    input  wire        m1_obi_gnt,
+    output wire [31:0] m1_obi_addr,
+    output wire        m1_obi_we,
+    output wire [3:0]  m1_obi_be,
+    output wire [31:0] m1_obi_wdata,
+    output wire [0:0]  m1_obi_aid,
+    input  wire        m1_obi_rvalid,
+    output wire        m1_obi_rready,
+    input  wire [31:0] m1_obi_rdata,
+    input  wire        m1_obi_err,
+    input  wire [0:0]  m1_obi_rid,
+
+    // Port 2
+    input  wire        s2_obi_req,
+    output wire        s2_obi_gnt,
+    input  wire [31:0] s2_obi_addr,
+    input  wire        s2_obi_we,
+    input  wire [3:0]  s2_obi_be,
+    input  wire [31:0] s2_obi_wdata,
+    input  wire [0:0]  s2_obi_aid,
+    output wire        s2_obi_rvalid,
+    input  wire        s2_obi_rready,
+    output wire [31:0] s2_obi_rdata,
+    output wire        s2_obi_err,
+    output wire [0:0]  s2_obi_rid,
+
+    output wire        m2_obi_req,
+    input  wire        m2_obi_gnt,
+    output wire [31:0] m2_obi_addr,
+    output wire        m2_obi_we,
+    output wire [3:0]  m2_obi_be,
+    output wire [31:0] m2_obi_wdata,
+    output wire [0:0]  m2_obi_aid,
+    input  wire        m2_obi_rvalid,
+    output wire        m2_obi_rready,
+    input  wire [31:0] m2_obi_rdata,
+    input  wire        m2_obi_err,
+    input  wire [0:0]  m2_obi_rid,
+
+    // Port 3
+    input  wire        s3_obi_req,
+    output wire        s3_obi_gnt,
+    input  wire [31:0] s3_obi_addr,
+    input  wire        s3_obi_we,
+    input  wire [3:0]  s3_obi_be,
+    input  wire [31:0] s3_obi_wdata,
+    input  wire [0:0]  s3_obi_aid,
+    output wire        s3_obi_rvalid,
+    input  wire        s3_obi_rready,
+    output wire [31:0] s3_obi_rdata,
+    output wire        s3_obi_err,
+    output wire [0:0]  s3_obi_rid,
+
+    output wire        m3_obi_req,
+    input  wire        m3_obi_gnt,
+    output wire [31:0] m3_obi_addr,
+    output wire        m3_obi_we,
+    output wire [3:0]  m3_obi_be,
+    output wire [31:0] m3_obi_wdata,
+    output wire [0:0]  m3_obi_aid,
+    input  wire        m3_obi_rvalid,
+    output wire        m3_obi_rready,
+    input  wire [31:0] m3_obi_rdata,
+    input  wire        m3_obi_err,
+    input  wire [0:0]  m3_obi_rid
+);
+
+// Four independent loopbacks: s<n>_obi_* (manager VIP) to m<n>_obi_*
+// (subordinate VIP), all on the one clock.
+
+assign m0_obi_req    = s0_obi_req;
+assign m0_obi_addr   = s0_obi_addr;
+assign m0_obi_we     = s0_obi_we;
+assign m0_obi_be     = s0_obi_be;
+assign m0_obi_wdata  = s0_obi_wdata;
+assign m0_obi_aid    = s0_obi_aid;
+assign m0_obi_rready = s0_obi_rready;
+
+assign s0_obi_gnt    = m0_obi_gnt;
+assign s0_obi_rvalid = m0_obi_rvalid;
+assign s0_obi_rdata  = m0_obi_rdata;
+assign s0_obi_err    = m0_obi_err;
+assign s0_obi_rid    = m0_obi_rid;
+
+assign m1_obi_req    = s1_obi_req;
+assign m1_obi_addr   = s1_obi_addr;
+assign m1_obi_we     = s1_obi_we;
+assign m1_obi_be     = s1_obi_be;
+assign m1_obi_wdata  = s1_obi_wdata;
+assign m1_obi_aid    = s1_obi_aid;
+assign m1_obi_rready = s1_obi_rready;
+
+assign s1_obi_gnt    = m1_obi_gnt;
+assign s1_obi_rvalid = m1_obi_rvalid;
+assign s1_obi_rdata  = m1_obi_rdata;
+assign s1_obi_err    = m1_obi_err;
+assign s1_obi_rid    = m1_obi_rid;
+
+assign m2_obi_req    = s2_obi_req;
+assign m2_obi_addr   = s2_obi_addr;
+assign m2_obi_we     = s2_obi_we;
+assign m2_obi_be     = s2_obi_be;
+assign m2_obi_wdata  = s2_obi_wdata;
+assign m2_obi_aid    = s2_obi_aid;
+assign m2_obi_rready = s2_obi_rready;
+
+assign s2_obi_gnt    = m2_obi_gnt;
+assign s2_obi_rvalid = m2_obi_rvalid;
+assign s2_obi_rdata  = m2_obi_rdata;
+assign s2_obi_err    = m2_obi_err;
+assign s2_obi_rid    = m2_obi_rid;
+
+assign m3_obi_req    = s3_obi_req;
+assign m3_obi_addr   = s3_obi_addr;
+assign m3_obi_we     = s3_obi_we;
+assign m3_obi_be     = s3_obi_be;
+assign m3_obi_wdata  = s3_obi_wdata;
+assign m3_obi_aid    = s3_obi_aid;
+assign m3_obi_rready = s3_obi_rready;
+
+assign s3_obi_gnt    = m3_obi_gnt;
+assign s3_obi_rvalid = m3_obi_rvalid;
+assign s3_obi_rdata  = m3_obi_rdata;
+assign s3_obi_err    = m3_obi_err;
+assign s3_obi_rid    = m3_obi_rid;
+
+endmodule
@@ -0,0 +1,88 @@
+from random import randint
+from cocotb import start_soon
+from cocotb import test
+
+from interfaces.clkrst import ClkReset
+
+from cocotbext.obi import ObiBus
+from cocotbext.obi import ObiDevice
+from cocotbext.obi import ObiMultiHost
+
+from cocotbext.obi.address_space import MemoryRegion
+
+PORTS = 4
+
+
+class testbench:
+    def __init__(self, dut, reset_sense=1, period=10):
+
+        self.cr = ClkReset(dut, period, reset_sense=reset_sense, resetname="rst")
+        self.dut = dut
+
+        clk = getattr(dut, "clk")
+        sbuses = [ObiBus.from_prefix(dut, f"s{n}_obi") for n in range(PORTS)]
+        self.m = ObiMultiHost(sbuses, clk, max_outstanding=4)
+        self.s = []
+        for n in range(PORTS):
+            dev = ObiDevice(
+                ObiBus.from_prefix(dut, f"m{n}_obi"), clk, max_outstanding=4
+            )
+            dev.target = MemoryRegion(2**dev.address_width)
+            self.s.append(dev)
+
+
+async def exercise(port, values):
+    for i, val in enumerate(values):
+        await port.write(0x0000 + i * 0x4, val)
+    for i, val in enumerate(values):
+        r = await port.read(0x0000 + i * 0x4)
+        assert int.from_bytes(r, "little") == val
+
+
+@test()
+async def test_multiport(dut):
+    tb = testbench(dut, reset_sense=1)
+
+    await tb.cr.wait_clkn(20)
+
+    await tb.m[0].write(0x0010, 0x87654321)
+    r = await tb.m[0].read(0x0010)
+    assert int.from_bytes(r, "little") == 0x87654321
+    r = await tb.m[1].read(0x0010)
+    assert int.from_bytes(r, "little") == 0x00000000
+
+    # All ports concurrently, each with its own blocking write/read sequence
+    x = [[randint(0, 0xFFFFFFFF) for _ in range(32)] for _ in range(PORTS)]
+    tasks = [start_soon(exercise(tb.m[n], x[n])) for n in range(PORTS)]
+    for task in tasks:
+        await task
+
+    for n in range(PORTS):
+        z = await tb.s[n].target.read_dword(31 * 4)
+        assert z == x[n][31]
+
+    await tb.cr.end_test(20)
+
+
+@test()
+async def test_multiport_pipelined(dut):
+    tb = testbench(dut, reset_sense=1)
+
+    await tb.cr.wait_clkn(20)
+
+    for n in range(PORTS):
+        tb.m[n].enable_backpressure(req=True, rready=True)
+        tb.s[n].enable_backpressure(gnt=True, rvalid=True)
+
+    x = [[randint(0, 0xFFFFFFFF) for _ in range(32)] for _ in range(PORTS)]
+    for n in range(PORTS):
+        for i, val in enumerate(x[n]):
+            tb.m[n].write_nowait(0x0000 + i * 0x4, val)
+        for i, val in enumerate(x[n]):
+            tb.m[n].read_nowait(0x0000 + i * 0x4, val)
+    await tb.m.wait()
+
+    for n in range(PORTS):
+        assert tb.m[n].count_rx == 32
+
+    await tb.cr.end_test(20)
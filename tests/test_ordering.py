@@ -0,0 +1,123 @@
+"""ObiHost read-after-write ordering modes and fence(), on the mock bus."""
+
+from random import Random
+
+import pytest
+
+from cocotbext.obi import MockBus, MockSim, ObiHost, ObiOrdering
+from cocotbext.obi.mock import RisingEdge
+
+
+def _read_during_writes(obi_pair, ordering, addr):
+    """Queue 32 writes to 0x100.., then read *addr*; return value and cycles."""
+    with MockSim() as sim:
+        host, _ = obi_pair(sim, out_of_order=True, ordering=ordering)
+
+        async def test():
+            for i in range(32):
+                host.write_nowait(0x100 + 4 * i, 0x1000 + i)
+            start = sim.cycle
+            value = await host.read(addr)
+            return int.from_bytes(value, "little"), sim.cycle - start
+
+        return sim.run_until(test())
+
+
+def test_address_ordering_keeps_the_pipeline_full(obi_pair):
+    _, strict = _read_during_writes(obi_pair, "strict", 0x0)
+    _, address = _read_during_writes(obi_pair, ObiOrdering.ADDRESS, 0x0)
+    # The read is queued behind the writes instead of after they drain
+    assert address < strict
+
+
+def test_address_ordering_waits_for_the_same_word(obi_pair):
+    value, _ = _read_during_writes(obi_pair, "address", 0x100 + 4 * 31)
+    assert value == 0x1000 + 31
+    value, _ = _read_during_writes(obi_pair, "relaxed", 0x100)
+    assert value == 0x1000
+
+
+def test_fence_with_relaxed_ordering(obi_pair):
+    with MockSim() as sim:
+        host, device = obi_pair(sim, out_of_order=True, ordering="relaxed")
+        device.enable_backpressure(1)
+
+        async def test():
+            for i in range(16):
+                host.write_nowait(4 * i, i)
+            await host.fence()
+            assert not host._pending_writes and not host._write_hazards
+            for i in range(16):
+                await host.read(4 * i, i)
+
+        sim.run_until(test())
+
+
+def test_address_ordering_random_traffic(obi_pair):
+    rng = Random(4)
+    with MockSim() as sim:
+        host, device = obi_pair(
+            sim,
+            out_of_order=True,
+            ordering="address",
+            device={"order": "random", "seednum": 5},
+        )
+        device.enable_backpressure(1)
+        model = {}
+
+        async def test():
+            for _ in range(300):
+                addr = rng.randrange(16) * 4
+                if rng.random() < 0.6:
+                    model[addr] = rng.randrange(2**32)
+                    host.write_nowait(addr, model[addr])
+                elif addr in model:
+                    await host.read(addr, model[addr])
+            await host.wait()
+
+        sim.run_until(test())
+        assert not host._write_hazards
+
+
+def test_multi_word_read_hazard(obi_pair):
+    with MockSim() as sim:
+        host, device = obi_pair(sim, out_of_order=True, ordering="address")
+        device.enable_backpressure(1)
+
+        async def test():
+            host.write_nowait(0x40, bytes(range(32)))
+            for i in range(16):
+                host.write_nowait(0x200 + 4 * i, i)
+            # Overlaps the last two words of the burst
+            return await host.read(0x58, length=8)
+
+        value = sim.run_until(test())
+        assert value[:4] == bytes(range(28, 32))
+
+
+def test_bad_ordering():
+    with MockSim() as sim, pytest.raises(ValueError):
+        ObiHost(MockBus(sim), sim.clock, ordering="loose")
+
+
+def test_switch_to_address_ordering_with_writes_in_flight(obi_pair):
+    with MockSim() as sim:
+        host, device = obi_pair(sim, out_of_order=True, ordering="relaxed")
+        device.enable_backpressure(1)
+
+        async def test():
+            for i in range(16):
+                host.write_nowait(0x100 + 4 * i, i)
+            for _ in range(6):
+                await RisingEdge(sim.clock)
+            # Only tracked by address once needed
+            assert not host._write_hazards
+            host.ordering = "address"
+            assert host.ordering is ObiOrdering.ADDRESS
+            tracked = sum(len(ops) for ops in host._write_hazards.values())
+            assert 0 < tracked == len(host._pending_writes)
+            await host.read(0x100 + 4 * 15, 15)
+            host.ordering = ObiOrdering.STRICT
+            assert not host._write_hazards
+
+        sim.run_until(test())
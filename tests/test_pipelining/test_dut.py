@@ -1,10 +1,23 @@
+import os
+import tempfile
 from random import randint
 from cocotb import test
+from cocotb.utils import get_sim_time
 
 from interfaces.clkrst import ClkReset
 
 from cocotbext.obi import ObiHost
 from cocotbext.obi import ObiBus
+from cocotbext.obi import ObiCoverage
+from cocotbext.obi import ObiCoverageCollector
+from cocotbext.obi import ObiMonitor
+from cocotbext.obi import ObiOp
+from cocotbext.obi import ObiOrder
+from cocotbext.obi import ObiOrdering
+from cocotbext.obi import ObiProtocolChecker
+from cocotbext.obi import ObiScoreboard
+from cocotbext.obi import FixedStall
+from cocotbext.obi import RandomStall
 from cocotbext.obi.obi_device import ObiDevice
 
 from cocotbext.obi.address_space import MemoryRegion
@@ -16,6 +29,9 @@ class testbench:
         dut,
         max_outstanding_host=2,
         max_outstanding_device=2,
+        out_of_order=False,
+        order="in_order",
+        sampling="edge",
         reset_sense=1,
         period=10,
     ):
@@ -28,12 +44,20 @@ class testbench:
 
         # Create host with specified max_outstanding
         self.m = ObiHost(
-            self.sbus, getattr(dut, clk_name), max_outstanding=max_outstanding_host
+            self.sbus,
+            getattr(dut, clk_name),
+            max_outstanding=max_outstanding_host,
+            out_of_order=out_of_order,
+            sampling=sampling,
         )
 
         # Create device with specified max_outstanding
         self.s = ObiDevice(
-            self.mbus, getattr(dut, clk_name), max_outstanding=max_outstanding_device
+            self.mbus,
+            getattr(dut, clk_name),
+            max_outstanding=max_outstanding_device,
+            order=order,
+            sampling=sampling,
         )
         region = MemoryRegion(2**self.s.address_width)
         self.s.target = region
@@ -229,3 +253,406 @@ async def test_write_nowait_read_await(dut):
     assert int.from_bytes(r3, "little") == 0x33333333
 
     await tb.cr.end_test(20)
+
+
+@test()
+async def test_out_of_order_host(dut):
+    """Match responses by rid; ids are never reused while in flight"""
+    tb = testbench(
+        dut,
+        max_outstanding_host=4,
+        max_outstanding_device=4,
+        out_of_order=True,
+        reset_sense=1,
+    )
+
+    await tb.cr.wait_clkn(20)
+
+    values = [randint(0, 0xFFFFFFFF) for _ in range(16)]
+    for i, val in enumerate(values):
+        tb.m.write_nowait(0x9000 + i * 4, val)
+    await tb.m.wait()
+
+    for i in range(len(values)):
+        tb.m.read_nowait(0x9000 + i * 4)
+    await tb.m.wait()
+    results = [int.from_bytes(r, "little") for r, _ in tb.m.queue_rx]
+    assert results == values
+    assert len(tb.m._free_ids) == 2
+
+    tb.s.enable_backpressure()
+    tb.m.enable_backpressure()
+    for i, val in enumerate(values):
+        await tb.m.write(0x9000 + i * 4, val ^ 0xFFFFFFFF)
+        await tb.m.read(0x9000 + i * 4, val ^ 0xFFFFFFFF)
+
+    await tb.cr.end_test(20)
+
+
+@test()
+async def test_reordering_device(dut):
+    """Fast region responses overtake slow region responses with other ids"""
+    tb = testbench(
+        dut,
+        max_outstanding_host=4,
+        max_outstanding_device=4,
+        out_of_order=True,
+        order="aid",
+        reset_sense=1,
+    )
+    tb.s.add_latency_region(0xA000, 0x1000, 8)
+
+    await tb.cr.wait_clkn(20)
+
+    for i in range(4):
+        await tb.m.write(0xA000 + i * 4, 0xA0000000 + i)
+        await tb.m.write(0xB000 + i * 4, 0xB0000000 + i)
+
+    tx_ids = {}
+    for i in range(4):
+        tx_ids[tb.m.read_nowait(0xA000 + i * 4)] = 0xA0000000 + i
+        tx_ids[tb.m.read_nowait(0xB000 + i * 4)] = 0xB0000000 + i
+    await tb.m.wait()
+
+    completed = []
+    for r, tx_id in tb.m.queue_rx:
+        assert int.from_bytes(r, "little") == tx_ids[tx_id]
+        completed.append(tx_id)
+    assert completed != sorted(completed)
+
+    # Random order within id constraints, with backpressure on both sides
+    tb.m.clear()
+    tb.s.order = ObiOrder.RANDOM
+    tb.s.enable_backpressure()
+    tb.m.enable_backpressure()
+    for _ in range(4):
+        for i in range(4):
+            tb.m.read_nowait(0xA000 + i * 4, 0xA0000000 + i)
+            tb.m.read_nowait(0xB000 + i * 4, 0xB0000000 + i)
+        await tb.m.wait()
+
+    await tb.cr.end_test(20)
+
+
+@test()
+async def test_rvalid_delay(dut):
+    """Delayed responses while new requests are still granted back-to-back"""
+    tb = testbench(dut, max_outstanding_host=4, max_outstanding_device=4, reset_sense=1)
+
+    await tb.cr.wait_clkn(20)
+
+    tb.s.enable_backpressure(rvalid=True)
+
+    values = [randint(0, 0xFFFFFFFF) for _ in range(32)]
+    for i, val in enumerate(values):
+        tb.m.write_nowait(0xC000 + i * 4, val)
+    await tb.m.wait()
+
+    for i, val in enumerate(values):
+        tb.m.read_nowait(0xC000 + i * 4, val)
+    await tb.m.wait()
+
+    await tb.cr.end_test(20)
+
+
+@test()
+async def test_stall_distribution(dut):
+    """Per-agent stall distributions on req and gnt"""
+    tb = testbench(dut, max_outstanding_host=4, max_outstanding_device=4, reset_sense=1)
+
+    await tb.cr.wait_clkn(20)
+
+    tb.m.set_stall("req", FixedStall(1))
+    tb.s.set_stall("gnt", RandomStall(probability=0.5, low=1, high=2))
+    tb.m.enable_backpressure(1, req=True)
+    tb.s.enable_backpressure(2, gnt=True)
+
+    values = [randint(0, 0xFFFFFFFF) for _ in range(16)]
+    for i, val in enumerate(values):
+        tb.m.write_nowait(0xD000 + i * 4, val)
+    await tb.m.wait()
+
+    for i, val in enumerate(values):
+        tb.m.read_nowait(0xD000 + i * 4, val)
+    await tb.m.wait()
+
+    await tb.cr.end_test(20)
+
+
+@test()
+async def test_stall_schedule(dut):
+    """A saved stall schedule replays the exact same bus timing"""
+    tb = testbench(dut, max_outstanding_host=4, max_outstanding_device=4, reset_sense=1)
+
+    await tb.cr.wait_clkn(20)
+
+    tb.m.enable_backpressure(req=True)
+    tb.s.enable_backpressure(gnt=True, rvalid=True)
+    tb.m.precompute_stalls(256, ["req"])
+    tb.s.precompute_stalls(256, ["gnt", "rvalid"])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        host_path = os.path.join(tmp, "host_stalls.json")
+        device_path = os.path.join(tmp, "device_stalls.json")
+        tb.m.save_stalls(host_path)
+        tb.s.save_stalls(device_path)
+
+        values = [randint(0, 0xFFFFFFFF) for _ in range(32)]
+        elapsed = []
+        for _ in range(2):
+            start = get_sim_time("ns")
+            for i, val in enumerate(values):
+                tb.m.write_nowait(0xE000 + i * 4, val)
+            for i, val in enumerate(values):
+                tb.m.read_nowait(0xE000 + i * 4, val)
+            await tb.m.wait()
+            elapsed.append(get_sim_time("ns") - start)
+
+            tb.m.load_stalls(host_path)
+            tb.s.load_stalls(device_path)
+            await tb.cr.wait_clkn(10)
+
+    assert elapsed[0] == elapsed[1]
+
+    await tb.cr.end_test(20)
+
+
+@test()
+async def test_readonly_sampling(dut):
+    """Host and device sampling in ReadOnly, with backpressure on every channel"""
+    tb = testbench(
+        dut,
+        max_outstanding_host=4,
+        max_outstanding_device=4,
+        out_of_order=True,
+        order=ObiOrder.RANDOM,
+        sampling="readonly",
+        reset_sense=1,
+    )
+
+    await tb.cr.wait_clkn(20)
+
+    tb.m.enable_backpressure()
+    tb.s.enable_backpressure()
+
+    values = [randint(0, 0xFFFFFFFF) for _ in range(32)]
+    for i, val in enumerate(values):
+        tb.m.write_nowait(0xF000 + i * 4, val)
+    for i, val in enumerate(values):
+        tb.m.read_nowait(0xF000 + i * 4, val)
+    await tb.m.wait()
+
+    r = await tb.m.read(0xF000 + 4 * 7)
+    assert int.from_bytes(r, "little") == values[7]
+
+    await tb.cr.end_test(20)
+
+
+@test()
+async def test_protocol_checker(dut):
+    """Backpressured out-of-order traffic passes every protocol rule"""
+    tb = testbench(
+        dut,
+        max_outstanding_host=4,
+        max_outstanding_device=4,
+        out_of_order=True,
+        order=ObiOrder.RANDOM,
+        reset_sense=1,
+    )
+    checker = ObiProtocolChecker(tb.sbus, dut.clk)
+
+    await tb.cr.wait_clkn(20)
+
+    tb.m.enable_backpressure()
+    tb.s.enable_backpressure()
+
+    values = [randint(0, 0xFFFFFFFF) for _ in range(64)]
+    for i, val in enumerate(values):
+        tb.m.write_nowait(0x10000 + i * 4, val)
+    for i, val in enumerate(values):
+        tb.m.read_nowait(0x10000 + i * 4, val)
+    await tb.m.wait()
+    await tb.cr.wait_clkn(2)
+
+    checker.assert_clean()
+    assert checker.outstanding == 0
+
+    await tb.cr.end_test(20)
+
+
+@test()
+async def test_coverage(dut):
+    """Coverage counters add up to the traffic that was sent"""
+    tb = testbench(
+        dut,
+        max_outstanding_host=4,
+        max_outstanding_device=4,
+        out_of_order=True,
+        order=ObiOrder.RANDOM,
+        reset_sense=1,
+    )
+    coverage = ObiCoverage([("low", 0x10000, 0x100), ("high", 0x10100, 0x100)])
+    collector = ObiCoverageCollector(tb.sbus, dut.clk, coverage)
+
+    await tb.cr.wait_clkn(20)
+
+    tb.m.enable_backpressure()
+    tb.s.enable_backpressure()
+
+    writes = 0
+    for _ in range(128):
+        addr = 0x10000 + randint(0, 0x7F) * 4
+        if randint(0, 1):
+            tb.m.write_nowait(addr, randint(0, 0xFFFFFFFF))
+            writes += 1
+        else:
+            tb.m.read_nowait(addr)
+    await tb.m.wait()
+    await tb.cr.wait_clkn(2)
+
+    assert collector.outstanding == 0
+    assert sum(coverage.bins("region").values()) == 128
+    assert coverage.bins("region")["other"] == 0
+    assert coverage.bins("response")["write_ok"] == writes
+    assert coverage.bins("response")["read_ok"] == 128 - writes
+    assert sum(coverage.bins("gnt_stall").values()) == 128
+    assert sum(coverage.bins("back_to_back").values()) > 0
+    tb.m.log.info(coverage.report())
+
+    await tb.cr.end_test(20)
+
+
+@test()
+async def test_scoreboard(dut):
+    """Reads of hazard-heavy out-of-order traffic match the shadow memory"""
+    tb = testbench(
+        dut,
+        max_outstanding_host=4,
+        max_outstanding_device=4,
+        out_of_order=True,
+        order=ObiOrder.RANDOM,
+        reset_sense=1,
+    )
+    monitor = ObiMonitor(tb.sbus, dut.clk)
+    monitor.start()
+    scoreboard = ObiScoreboard(monitor)
+
+    await tb.cr.wait_clkn(20)
+
+    tb.m.enable_backpressure()
+    tb.s.enable_backpressure()
+
+    # A handful of words so reads and writes to the same address overlap
+    for _ in range(256):
+        addr = 0x20000 + randint(0, 7) * 4
+        if randint(0, 1):
+            tb.m.write_nowait(addr, randint(0, 0xFFFFFFFF))
+        else:
+            tb.m.read_nowait(addr)
+    await tb.m.wait()
+    await tb.cr.wait_clkn(2)
+
+    scoreboard.assert_clean()
+    assert scoreboard.reads + scoreboard.writes == 256
+
+    # A read of memory changed behind the bus is caught
+    await tb.m.write(0x20000, 0x12345678)
+    await tb.s.target.write(0x20000, bytes(4))
+    tb.m.read_nowait(0x20000)
+    await tb.m.wait()
+    await tb.cr.wait_clkn(2)
+    assert scoreboard.mismatches == 1
+
+    await tb.cr.end_test(20)
+
+
+@test()
+async def test_transaction_level(dut):
+    """A transaction-level host sees the same memory without bus cycles"""
+    tb = testbench(dut, max_outstanding_host=4, max_outstanding_device=4, reset_sense=1)
+    await tb.cr.wait_clkn(20)
+
+    for i in range(8):
+        tb.m.write_nowait(0x3000 + i * 4, 0x1000 + i)
+    await tb.m.wait()
+
+    fast = ObiHost(tb.sbus, dut.clk, name="fast", target=tb.s)
+    start = get_sim_time("ns")
+    for i in range(8):
+        await fast.read(0x3000 + i * 4, 0x1000 + i)
+        await fast.write(0x3000 + i * 4, 0x2000 + i)
+    assert get_sim_time("ns") == start
+
+    fast.latency = 2
+    await fast.write(0x3100, 0xCAFEF00D)
+    assert get_sim_time("ns") == start + 2 * tb.cr.period
+
+    # Writes made by the fast host are seen on the bus
+    for i in range(8):
+        await tb.m.read(0x3000 + i * 4, 0x2000 + i)
+    await tb.m.read(0x3100, 0xCAFEF00D)
+
+    await tb.cr.end_test(20)
+
+
+@test()
+async def test_ordering_modes(dut):
+    """Address-ordered reads overlap writes to other words; fence() drains"""
+    tb = testbench(
+        dut,
+        max_outstanding_host=4,
+        max_outstanding_device=4,
+        out_of_order=True,
+        order="random",
+        reset_sense=1,
+    )
+    tb.m.ordering = ObiOrdering.ADDRESS
+    tb.s.enable_backpressure()
+    await tb.cr.wait_clkn(20)
+
+    for i in range(16):
+        tb.m.write_nowait(0x9000 + i * 4, 0x9000 + i)
+    # Same word as a queued write: waits for it
+    await tb.m.read(0x9000 + 15 * 4, 0x9000 + 15)
+    # Unwritten words are read without waiting for the writes
+    for i in range(16):
+        tb.m.write_nowait(0x9100 + i * 4, 0x9100 + i)
+    await tb.m.read(0x9400, 0)
+
+    tb.m.ordering = ObiOrdering.RELAXED
+    for i in range(16):
+        tb.m.write_nowait(0x9200 + i * 4, 0x9200 + i)
+    await tb.m.fence()
+    assert not tb.m._pending_writes
+    for i in range(16):
+        await tb.m.read(0x9200 + i * 4, 0x9200 + i)
+
+    await tb.m.wait()
+    await tb.cr.end_test(20)
+
+
+@test()
+async def test_submit_batch(dut):
+    """A 256-write register sequence and its read-back as two batches"""
+    tb = testbench(
+        dut,
+        max_outstanding_host=4,
+        max_outstanding_device=4,
+        out_of_order=True,
+        order="random",
+        reset_sense=1,
+    )
+    tb.s.enable_backpressure()
+    await tb.cr.wait_clkn(20)
+
+    writes = [
+        ObiOp(0xA000 + i * 4, randint(0, 0xFFFFFFFF), write=True) for i in range(256)
+    ]
+    batch = tb.m.submit(writes)
+    await batch
+    assert batch.done()
+
+    results = await tb.m.submit(ObiOp(op.addr) for op in writes)
+    assert [int.from_bytes(r, "little") for r in results] == [op.data for op in writes]
+
+    await tb.cr.end_test(20)
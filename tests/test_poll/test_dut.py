@@ -63,3 +63,25 @@ async def test_dut_poll3(dut):
     await tb.intf.poll(0x04, b"\x00\x00\x00\x00")
 
     await tb.cr.end_test(20)
+
+
+@test()
+async def test_dut_poll_engine(dut):
+    tb = testbench(dut)
+
+    await tb.cr.wait_clkn(20)
+
+    await tb.intf.write(0x00, 1)
+    result = await tb.intf.poll(0x04, 0, mask=0x1, interval=1, backoff=2)
+    assert result.matched
+    assert result.value & 0x1 == 0
+    assert result.reads >= 1
+
+    # Busy is never set without a start, so this poll runs out of budget
+    tb.intf.exception_enabled = False
+    result = await tb.intf.poll(0x04, predicate=lambda v: v & 0x1, max_cycles=50)
+    assert not result.matched
+    assert result.cycles >= 50
+    assert tb.intf.exception_occurred
+
+    await tb.cr.end_test(20)
@@ -0,0 +1,99 @@
+"""ObiHost.poll reads, backoff and cycle budget on the mock bus (no simulator)."""
+
+import logging
+
+import pytest
+
+from cocotbext.obi import MemoryRegion, MockBus, MockSim, ObiDevice, ObiHost
+from cocotbext.obi.mock import RisingEdge
+
+STATUS = 0x40
+
+
+def _poll(set_at, value=1, **kwargs):
+    """Poll STATUS, which changes to *value* at cycle *set_at*."""
+    with MockSim() as sim:
+        bus = MockBus(sim)
+        host = ObiHost(bus, sim.clock, max_outstanding=4)
+        device = ObiDevice(bus, sim.clock, max_outstanding=4)
+
+        async def set_status():
+            while sim.cycle < set_at:
+                await RisingEdge(sim.clock)
+            await device.poke(STATUS, value)
+
+        sim.start_soon(set_status())
+        return sim.run_until(host.poll(STATUS, **kwargs)), host
+
+
+def test_back_to_back_until_match(caplog):
+    with caplog.at_level(logging.DEBUG, logger="cocotb.obi_host"):
+        result, host = _poll(50, data=1)
+        assert host.log.level == logging.INFO
+    assert result.matched
+    assert result.value == 1
+    assert 50 <= result.cycles <= 55
+    # One read per round trip, none of them logged
+    assert 15 < result.reads < 30
+    messages = [r.getMessage()[:4] for r in caplog.records]
+    assert messages.count("Poll") == 2
+    assert "Read" not in messages and "Valu" not in messages
+    assert host.idle
+
+
+def test_mask_and_predicate():
+    result, _ = _poll(20, value=0xA5, data=0x05, mask=0x0F)
+    assert result.matched and result.value == 0xA5
+    result, _ = _poll(20, value=0xA5, predicate=lambda v: v > 0x80)
+    assert result.matched and result.value == 0xA5
+
+
+def test_backoff_and_pipelining():
+    back_to_back, _ = _poll(200, data=1)
+    backoff, _ = _poll(200, data=1, interval=1, backoff=2, max_interval=16)
+    pipelined, _ = _poll(200, data=1, outstanding=4)
+    assert backoff.matched and pipelined.matched
+    assert backoff.reads < 25 < back_to_back.reads < pipelined.reads
+    assert backoff.cycles <= 200 + 16 + 4
+
+
+def test_cycle_budget():
+    with pytest.raises(TimeoutError, match="after .* reads"):
+        _poll(1000, data=1, max_cycles=100)
+
+    with MockSim() as sim:
+        bus = MockBus(sim)
+        host = ObiHost(bus, sim.clock)
+        ObiDevice(bus, sim.clock)
+        host.exception_enabled = False
+        result = sim.run_until(host.poll(STATUS, 1, interval=10, max_cycles=100))
+        assert not result.matched
+        assert 100 <= result.cycles <= 105
+        assert result.reads < 12
+        assert host.exception_occurred
+
+
+class _InstantHost(ObiHost):
+    """Completes every transfer without simulation time passing."""
+
+    async def _run_direct(self):
+        while True:
+            while not self.queue_tx:
+                self._update_idle()
+                self.sync.clear()
+                await self.sync.wait()
+            op = self.queue_tx.popleft()
+            self._complete(op, False, 0)
+
+
+def test_cycle_budget_without_time_passing():
+    with MockSim() as sim:
+        host = _InstantHost(MockBus(sim), sim.clock, target=MemoryRegion(2**12))
+        with pytest.raises(TimeoutError, match="after 100 reads, 0 cycles"):
+            sim.run_until(host.poll(STATUS, 1, max_cycles=100))
+        assert sim.cycle == 0
+
+
+def test_poll_needs_a_condition():
+    with pytest.raises(ValueError, match="predicate"):
+        _poll(0)
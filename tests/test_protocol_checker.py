@@ -0,0 +1,68 @@
+"""Unit tests for the OBI protocol checker rules (no simulator)."""
+
+import pytest
+
+from cocotbext.obi.obi_checker import RULES, ObiProtocolChecker
+
+
+class _Bus:
+    _name = "test"
+    addr = [0] * 32
+    we = [0]
+    be = [0] * 4
+    wdata = [0] * 32
+    rdata = [0] * 32
+    err = [0]
+
+
+def _checker():
+    return ObiProtocolChecker(_Bus(), None, autostart=False)
+
+
+def _cycle(chk, req=False, gnt=False, a=None, rvalid=False, rready=False, r=None):
+    chk._check(req, gnt, a, rvalid, rready, r)
+
+
+def test_clean_pipelined_traffic():
+    chk = _checker()
+    _cycle(chk, req=True, gnt=False, a=(0x10, 1, 0xF, 1))
+    _cycle(chk, req=True, gnt=True, a=(0x10, 1, 0xF, 1))
+    _cycle(chk, req=True, gnt=True, rvalid=True, rready=False, r=(0, 0))
+    _cycle(chk, rvalid=True, rready=True, r=(0, 0))
+    _cycle(chk, rvalid=True, rready=True)
+    _cycle(chk)
+    assert chk.violation_count == 0
+    assert chk.outstanding == 0
+    assert chk.cycles == 6
+    chk.assert_clean()
+
+
+def test_request_must_hold_until_gnt():
+    chk = _checker()
+    _cycle(chk, req=True, a=(0x10, 0, 0xF, 0))
+    _cycle(chk, req=True, a=(0x14, 0, 0xF, 0))
+    _cycle(chk, req=False)
+    assert chk.violations["req_unstable"] == 1
+    assert chk.violations["req_retracted"] == 1
+
+
+def test_response_must_hold_until_rready():
+    chk = _checker()
+    _cycle(chk, req=True, gnt=True)
+    _cycle(chk, rvalid=True, r=(1, 0))
+    _cycle(chk, rvalid=True, r=(2, 0))
+    _cycle(chk, rvalid=False)
+    assert chk.violations["resp_unstable"] == 1
+    assert chk.violations["rvalid_retracted"] == 1
+
+
+def test_response_without_request():
+    chk = _checker()
+    _cycle(chk, req=True, gnt=True)
+    _cycle(chk, rvalid=True, rready=True)
+    _cycle(chk, rvalid=True, rready=True)
+    assert chk.violations["resp_without_req"] == 1
+    with pytest.raises(AssertionError, match="resp_without_req=1"):
+        chk.assert_clean()
+    chk.clear()
+    assert chk.violations == dict.fromkeys(RULES, 0)
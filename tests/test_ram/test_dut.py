@@ -3,6 +3,7 @@ import os
 import cocotb
 from cocotb.clock import Clock
 from cocotb.triggers import RisingEdge
+from cocotb.utils import get_sim_time
 
 from cocotbext.obi import ObiBus, ObiHost
 from cocotbext.obi.obi_device import ObiDevice
@@ -38,3 +39,34 @@ async def test_ram_bulk_rw(dut):
         rb = await host.read(base + i)
         read_back += rb
     assert bytes(read_back[: len(data)]) == data
+
+
+@cocotb.test()
+async def test_ram_backdoor(dut):
+    cocotb.start_soon(Clock(dut.clk, 10, "ns").start())
+
+    dut.rst.value = 1
+    for _ in range(5):
+        await RisingEdge(dut.clk)
+    dut.rst.value = 0
+
+    bus = ObiBus.from_prefix(dut, "s_obi")
+    dbus = ObiBus.from_prefix(dut, "m_obi")
+    host = ObiHost(bus, dut.clk)
+    device = ObiDevice(dbus, dut.clk, size_bytes=1024)
+    written = []
+    device.add_backdoor_hook(lambda addr, data: written.append((addr, data)))
+
+    # Preload and patch the memory without bus cycles
+    start = get_sim_time("ns")
+    data = bytes(range(64))
+    await device.load(0x100, data)
+    await device.poke(0x104, 0xAABBCCDD, strb=0b0110)
+    assert get_sim_time("ns") == start
+    assert written == [(0x100, data), (0x105, b"\xcc\xbb")]
+
+    # The bus sees the backdoor writes, and the backdoor the bus writes
+    await host.read(0x104, 0x07BBCC04)
+    await host.write(0x140, 0x12345678)
+    assert await device.peek(0x140) == 0x12345678
+    assert await device.dump(0x100, 8) == bytes.fromhex("00010203 04ccbb07")
@@ -0,0 +1,138 @@
+"""Restarting ObiHost mid-transfer on the mock bus (no simulator)."""
+
+import pytest
+
+from cocotbext.obi import (
+    FixedLatency,
+    MockBus,
+    MockSim,
+    ObiDevice,
+    ObiHost,
+    ObiOp,
+    StallSchedule,
+)
+
+
+def test_restart_frees_id_of_withdrawn_request(obi_pair):
+    with MockSim() as sim:
+        # Device not started: gnt stays low and the request is left presented
+        host, device = obi_pair(sim, out_of_order=True, device={"autostart": False})
+        for i in range(8):
+            host.write_nowait(4 * i, i)
+            sim.run(3)
+            assert host._presented is not None
+            assert len(host._free_ids) == 3
+            host.start()
+            assert len(host._free_ids) == 4
+            assert not host._inflight and not host.outstanding
+
+        device.start()
+
+        async def test():
+            for i in range(32):
+                host.write_nowait(0x100 + 4 * i, i)
+            await host.wait()
+            for i in range(32):
+                assert await device.peek(0x100 + 4 * i) == i
+
+        sim.run_until(test())
+        assert sorted(host._free_ids) == [0, 1, 2, 3]
+
+
+def test_restart_reissues_withdrawn_write(obi_pair):
+    with MockSim() as sim:
+        host, device = obi_pair(sim, device={"autostart": False})
+        host.write_nowait(0x4, 1)
+        host.write_nowait(0x8, 1)
+        sim.run(3)
+        assert host._presented is not None
+
+        fenced = []
+
+        async def fence():
+            await host.fence()
+            fenced.append(sim.cycle)
+
+        sim.start_soon(fence())
+        sim.run(2)
+        assert not fenced
+
+        host.start()
+        device.start()
+
+        async def test():
+            await host.write(0x4, 2)
+            assert await host.read(0x4) == b"\x02\x00\x00\x00"
+            await host.fence()
+
+        sim.run_until(test())
+        assert fenced
+        assert not host._pending_writes and not host._writes_done
+        # The queued write was still issued after the restart
+        assert sim.run_until(device.peek(0x8)) == 1
+
+
+def test_restart_during_rready_stall():
+    with MockSim() as sim:
+        bus = MockBus(sim, id_width=2)
+        host = ObiHost(bus, sim.clock, max_outstanding=4)
+        device = ObiDevice(bus, sim.clock, max_outstanding=4)
+        host.set_stall("rready", StallSchedule([20]))
+        host.enable_backpressure(rready=True)
+        for i in range(4):
+            host.write_nowait(4 * i, i)
+        sim.step()
+        while int(bus.rready.value):
+            sim.step()
+        assert host._rready_stall
+
+        host.start()
+        host.disable_backpressure()
+        sim.step()
+        assert int(bus.rready.value) == 1
+        assert not host._rready_stall
+        # Let the device return the responses still outstanding
+        sim.run(10)
+
+        async def test():
+            await host.write(0x100, 0x1234)
+            await host.read(0x100, 0x1234)
+
+        sim.run_until(test())
+        assert sim.run_until(device.peek(0x100)) == 0x1234
+
+
+@pytest.mark.parametrize("order", ["in_order", "random"])
+def test_restart_with_responses_in_flight(obi_pair, order):
+    with MockSim() as sim:
+        host, device = obi_pair(
+            sim,
+            out_of_order=order != "in_order",
+            device={"max_outstanding": 2, "order": order, "timing": FixedLatency(8)},
+        )
+        for i in range(16):
+            sim.run_until(device.poke(4 * i, 0x100 + i))
+
+        results = {}
+
+        async def read(addr):
+            results[addr] = await host.read(addr)
+
+        batch = host.submit(ObiOp(4 * i) for i in range(8, 16))
+        for i in range(8):
+            sim.start_soon(read(4 * i))
+        sim.run(6)
+        # Two transfers granted, a third presented while gnt is low
+        assert len(host.outstanding) == 2 and host._presented is not None
+
+        host.start()
+        sim.run_until(host.wait())
+        assert batch.done()
+        assert [int.from_bytes(d, "little") for d in batch.results] == [
+            0x100 + i for i in range(8, 16)
+        ]
+        assert {a: int.from_bytes(d, "little") for a, d in results.items()} == {
+            4 * i: 0x100 + i for i in range(8)
+        }
+        assert not host.outstanding and not host._inflight
+        assert sorted(host._free_ids) == [0, 1, 2, 3]
@@ -0,0 +1,105 @@
+"""Unit tests for the OBI scoreboard shadow memory checks (no simulator)."""
+
+from collections import deque
+
+import pytest
+
+from cocotbext.obi import MockSim
+from cocotbext.obi.obi_monitor import ObiMonitor, ObiTransaction
+from cocotbext.obi.obi_scoreboard import ObiScoreboard
+
+
+class _Bus:
+    _name = "test"
+    addr = [0] * 16
+    we = [0]
+    be = [0] * 4
+    wdata = [0] * 32
+    rdata = [0] * 32
+    err = [0]
+
+
+def _scoreboard(**kwargs):
+    return ObiScoreboard(ObiMonitor(_Bus(), None), autostart=False, **kwargs)
+
+
+def _write(seq, addr, wdata, be=0xF, err=False):
+    return ObiTransaction(
+        addr=addr, we=True, be=be, wdata=wdata, aid=0, err=err, seq=seq
+    )
+
+
+def _read(seq, addr, rdata, be=0xF, err=False):
+    return ObiTransaction(
+        addr=addr, we=False, be=be, wdata=0, aid=0, rdata=rdata, err=err, seq=seq
+    )
+
+
+def test_be_masks_and_unwritten_bytes():
+    sb = _scoreboard()
+    sb.process(
+        [
+            _write(0, 0x10, 0x11223344),
+            _write(1, 0x10, 0xAABBCCDD, be=0x2),
+            _read(2, 0x10, 0x1122CC44),
+            # Only the low half of 0x20 is known
+            _write(3, 0x20, 0x00005678, be=0x3),
+            _read(4, 0x20, 0xFFFF5678),
+        ]
+    )
+    assert (sb.reads, sb.writes, sb.mismatches) == (2, 3, 0)
+    sb.process([_read(5, 0x10, 0x1122CC45)])
+    assert sb.mismatches == 1
+    with pytest.raises(AssertionError, match="read 0x00000010 returned 0x1122cc45"):
+        sb.assert_clean()
+
+
+def test_errors_and_excluded_regions():
+    sb = _scoreboard()
+    sb.exclude(0x100, 0x10)
+    sb.load(0x0, bytes(4))
+    sb.process(
+        [
+            _write(0, 0x0, 0x12345678, err=True),
+            _read(1, 0x0, 0),
+            _read(2, 0x0, 0xDEAD, err=True),
+            _write(3, 0x104, 1),
+            _read(4, 0x104, 2),
+        ]
+    )
+    assert (sb.errors, sb.skipped, sb.mismatches) == (2, 2, 0)
+
+
+def test_applies_in_grant_order():
+    sb = _scoreboard(check_unwritten=True)
+    # The read was granted after the write but its response came first
+    sb.process([_read(1, 0x8, 0xCAFE)])
+    assert sb.reads == 0
+    sb.process([_write(0, 0x8, 0xCAFE)])
+    assert (sb.reads, sb.writes, sb.mismatches) == (1, 1, 0)
+
+
+def test_ignores_transactions_granted_before_it():
+    monitor = ObiMonitor(_Bus(), None)
+    monitor._seq = 5
+    sb = ObiScoreboard(monitor, autostart=False)
+    sb.process([_write(4, 0x0, 1), _write(5, 0x0, 2), _read(6, 0x0, 2)])
+    assert (sb.reads, sb.writes, sb.mismatches) == (1, 1, 0)
+
+
+def test_skips_requests_never_answered():
+    with MockSim() as sim:
+        monitor = ObiMonitor(_Bus(), sim.clock)
+        sb = ObiScoreboard(monitor)
+        # Seq 0 still waits for its response: seq 1 is held back
+        monitor._seq = 3
+        monitor._pending = {0: deque([_write(0, 0x0, 1)])}
+        sb._receive(_write(1, 0x4, 1))
+        sim.step()
+        assert (sb.writes, sb.missing) == (0, 0)
+        # Its response was lost (e.g. the bus was reset)
+        monitor._pending = {}
+        sb._receive(_read(2, 0x4, 1))
+        sim.step()
+        assert (sb.writes, sb.reads, sb.missing) == (1, 1, 1)
+        sb.assert_clean()
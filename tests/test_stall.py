@@ -0,0 +1,174 @@
+"""Unit tests for per-agent backpressure stall distributions."""
+
+from random import Random
+
+import pytest
+
+from cocotbext.obi import MockBus, MockSim, ObiDevice, ObiHost
+from cocotbext.obi.mock import ReadOnly, RisingEdge
+from cocotbext.obi.obi_base import ObiBase
+from cocotbext.obi.stall import FixedStall, NoStall, RandomStall, StallSchedule
+
+
+class _Bus:
+    _name = "test"
+    addr = [0] * 32
+    wdata = [0] * 32
+    rdata = [0] * 32
+
+
+def _stalls(agent, channel, n=200):
+    return [agent._stall_cycles(True, channel) for _ in range(n)]
+
+
+def test_random_stall_range():
+    dist = RandomStall(probability=0.25, low=1, high=8)
+    rng = Random(1)
+    values = [dist(rng) for _ in range(4000)]
+    assert set(values) == set(range(0, 9))
+    assert 0.2 < sum(1 for v in values if v) / len(values) < 0.3
+
+
+def test_fixed_and_no_stall():
+    rng = Random(0)
+    assert FixedStall(3)(rng) == 3
+    assert NoStall()(rng) == 0
+    with pytest.raises(ValueError):
+        RandomStall(probability=2.0)
+
+
+def test_agent_streams_are_independent():
+    a = ObiBase(_Bus(), None, seednum=1234)
+    expected = _stalls(a, "gnt")
+
+    b = ObiBase(_Bus(), None, seednum=1234)
+    other = ObiBase(_Bus(), None, seednum=99)
+    _stalls(other, "gnt")
+    assert _stalls(b, "gnt") == expected
+
+    b.enable_backpressure(1234)
+    assert _stalls(b, "gnt") == expected
+
+
+def test_set_stall():
+    a = ObiBase(_Bus(), None, seednum=5)
+    a.set_stall("req", FixedStall(2))
+    assert a.req_delay == 0
+    a.enable_backpressure(req=True)
+    assert a.req_delay == 2
+    assert a.gnt_delay == 0
+    with pytest.raises(ValueError):
+        a.set_stall("addr", NoStall())
+
+
+def test_schedule_replay():
+    sched = StallSchedule([0, 3, 0, 1])
+    rng = Random(0)
+    assert [sched(rng) for _ in range(6)] == [0, 3, 0, 1, 0, 3]
+    sched.reset()
+    assert sched(rng) == 0
+    with pytest.raises(ValueError):
+        StallSchedule([])
+
+
+def test_schedule_generate_matches_distribution():
+    dist = RandomStall()
+    sched = StallSchedule.generate(dist, 500, 42)
+    rng = Random(42)
+    assert list(sched.stalls) == [dist(rng) for _ in range(500)]
+    assert StallSchedule.from_hex(sched.to_hex()).stalls == sched.stalls
+
+
+def test_precompute_save_load(tmp_path):
+    a = ObiBase(_Bus(), None, seednum=7)
+    a.enable_backpressure()
+    a.precompute_stalls(64, ["req", "gnt"])
+    assert isinstance(a.stall["req"], StallSchedule)
+    assert not isinstance(a.stall["rready"], StallSchedule)
+    path = tmp_path / "stalls.json"
+    a.save_stalls(path)
+    expected = _stalls(a, "req", 100)
+
+    b = ObiBase(_Bus(), None, seednum=8)
+    b.enable_backpressure()
+    b.load_stalls(path)
+    assert _stalls(b, "req", 100) == expected
+    assert isinstance(b.stall["gnt"], StallSchedule)
+
+
+@pytest.mark.parametrize("channel", ["req", "gnt"])
+@pytest.mark.parametrize("cycles", [1, 3])
+def test_fixed_stall_delays_every_beat(channel, cycles):
+    with MockSim() as sim:
+        bus = MockBus(sim)
+        host = ObiHost(bus, sim.clock, max_outstanding=4)
+        device = ObiDevice(bus, sim.clock, max_outstanding=4)
+        agent = host if channel == "req" else device
+        agent.set_stall(channel, FixedStall(cycles))
+        agent.enable_backpressure(**{channel: True})
+        accepted = []
+
+        async def sample():
+            while True:
+                await ReadOnly()
+                if int(bus.req.value) and int(bus.gnt.value):
+                    accepted.append(sim.cycle)
+                await RisingEdge(sim.clock)
+
+        sim.start_soon(sample())
+
+        async def test():
+            for i in range(8):
+                host.write_nowait(4 * i, i)
+            await host.wait()
+            for i in range(8):
+                await host.read(4 * i, i)
+
+        sim.run_until(test(), max_cycles=1000)
+        # One stall of exactly *cycles* between back-to-back beats
+        gaps = {b - a for a, b in zip(accepted[:8], accepted[1:8])}
+        assert gaps == {cycles + 1}
+
+
+def _blocking_gnt_waits(distribution, transfers=100):
+    """gnt stall cycles seen by each of *transfers* blocking accesses."""
+    with MockSim() as sim:
+        bus = MockBus(sim)
+        host = ObiHost(bus, sim.clock)
+        device = ObiDevice(bus, sim.clock, seednum=5)
+        device.set_stall("gnt", distribution)
+        device.enable_backpressure(gnt=True)
+        waits = []
+
+        async def sample():
+            wait = 0
+            while True:
+                await ReadOnly()
+                if int(bus.req.value):
+                    if int(bus.gnt.value):
+                        waits.append(wait)
+                        wait = 0
+                    else:
+                        wait += 1
+                await RisingEdge(sim.clock)
+
+        sim.start_soon(sample())
+
+        async def test():
+            for i in range(transfers // 2):
+                await host.write(4 * i, i)
+                for _ in range(3):
+                    await RisingEdge(sim.clock)
+                await host.read(4 * i, i)
+
+        sim.run_until(test())
+        return waits
+
+
+def test_blocking_accesses_see_gnt_stalls():
+    # The stall of the next beat is drawn as one is accepted and is only
+    # spent while req waits, so idle cycles in between don't use it up
+    assert _blocking_gnt_waits(FixedStall(2)) == [2] * 100
+    waits = _blocking_gnt_waits(RandomStall(probability=0.5, low=1, high=2))
+    assert len(waits) == 100
+    assert 30 < sum(1 for wait in waits if wait) < 70
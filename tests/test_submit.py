@@ -0,0 +1,112 @@
+"""ObiHost.submit() batches on the mock bus (no simulator)."""
+
+import pytest
+
+from cocotbext.obi import (
+    MemoryRegion,
+    MockBus,
+    MockSim,
+    ObiHost,
+    ObiOp,
+)
+
+
+def test_batch_results_in_order(obi_pair):
+    with MockSim() as sim:
+        host, _ = obi_pair(sim)
+        ops = [ObiOp(4 * i, 0x100 + i, write=True) for i in range(200)]
+        ops += [ObiOp(4 * i) for i in range(0, 200, 10)]
+        ops.append(ObiOp(0x20, 0x108))
+
+        async def test():
+            batch = host.submit(ops)
+            assert not batch.done()
+            results = await batch
+            assert batch.done() and host.idle
+            return results
+
+        results = sim.run_until(test())
+        assert len(results) == 21
+        assert results[:20] == [
+            (0x100 + i).to_bytes(4, "little") for i in range(0, 200, 10)
+        ]
+        assert not host.queue_rx
+
+
+def test_batch_out_of_order_responses(obi_pair):
+    with MockSim() as sim:
+        host, _ = obi_pair(
+            sim, out_of_order=True, device={"order": "random", "seednum": 2}
+        )
+        host.return_int = True
+
+        async def test():
+            await host.submit(ObiOp(4 * i, i, write=True) for i in range(32))
+            return await host.submit(ObiOp(4 * i) for i in reversed(range(32)))
+
+        assert sim.run_until(test()) == list(reversed(range(32)))
+
+
+def test_batch_strobes_and_mismatch(obi_pair):
+    with MockSim() as sim:
+        host, _ = obi_pair(sim)
+
+        async def test():
+            await host.submit(
+                [
+                    ObiOp(0x40, 0x11223344, write=True),
+                    ObiOp(0x40, 0xAABBCCDD, write=True, strb=0b0101),
+                    ObiOp(0x40, 0x11BB33DD),
+                ]
+            )
+            host.submit([ObiOp(0x40, 0)])
+            await host.wait()
+
+        with pytest.raises(ValueError, match="doesn't match"):
+            sim.run_until(test())
+
+
+def test_empty_batch_and_wide_data(obi_pair):
+    with MockSim() as sim:
+        host, _ = obi_pair(sim)
+
+        async def test():
+            return await host.submit([])
+
+        assert sim.run_until(test()) == []
+        assert host.idle
+        with pytest.raises(ValueError):
+            host.submit([ObiOp(0, 1, write=True), ObiOp(4, bytes(8), write=True)])
+        # Nothing was queued
+        assert host.idle and not host._pending_writes
+        with pytest.raises(ValueError, match="no data"):
+            ObiOp(0x8, write=True)
+
+
+def test_batch_with_blocking_calls(obi_pair):
+    with MockSim() as sim:
+        host, _ = obi_pair(sim)
+
+        async def test():
+            batch = host.submit(ObiOp(4 * i, i, write=True) for i in range(16))
+            # A strict read after the batch waits for its writes
+            await host.read(0x3C, 15)
+            assert batch.done()
+            await host.write(0x100, 0xCAFE)
+            return await host.submit([ObiOp(0x100), ObiOp(0x0)])
+
+        assert sim.run_until(test()) == [(0xCAFE).to_bytes(4, "little"), bytes(4)]
+
+
+def test_batch_transaction_level():
+    with MockSim() as sim:
+        bus = MockBus(sim)
+        host = ObiHost(bus, sim.clock, target=MemoryRegion(2**12))
+
+        async def test():
+            ops = [ObiOp(4 * i, i, write=True) for i in range(8)]
+            ops += [ObiOp(4 * i, i) for i in range(8)]
+            return await host.submit(ops)
+
+        assert len(sim.run_until(test())) == 8
+        assert sim.cycle == 0
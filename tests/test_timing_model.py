@@ -0,0 +1,64 @@
+"""Unit tests for the ObiDevice timing models."""
+
+import pytest
+
+from cocotbext.obi.timing_model import (
+    BandwidthLimit,
+    BankConflict,
+    CompositeTiming,
+    FixedLatency,
+    RefreshWindow,
+    RegionLatency,
+)
+
+
+def test_fixed_latency():
+    t = FixedLatency(5, write_cycles=2)
+    assert t.accept(0, 0x0, False) == 5
+    assert t.accept(0, 0x0, True) == 2
+    assert t.can_accept(123)
+
+
+def test_region_latency():
+    t = RegionLatency(default=1)
+    t.add(0x1000, 0x100, 20)
+    assert t.accept(0, 0x1000, False) == 20
+    assert t.accept(0, 0x10FF, False) == 20
+    assert t.accept(0, 0x1100, False) == 1
+    with pytest.raises(ValueError):
+        t.add(0x10F0, 0x20, 3)
+
+
+def test_bandwidth_limit():
+    t = BandwidthLimit(2, 4)
+    granted = []
+    for cycle in range(12):
+        if t.can_accept(cycle):
+            t.accept(cycle, 0, False)
+            granted.append(cycle)
+    assert granted == [0, 1, 4, 5, 8, 9]
+
+
+def test_bank_conflict():
+    t = BankConflict(banks=4, interleave=4, busy=3)
+    assert t.accept(0, 0x0, False) == 0
+    assert t.accept(1, 0x4, False) == 0
+    assert t.accept(1, 0x10, False) == 2
+    assert t.accept(10, 0x0, False) == 0
+    t.reset()
+    assert t.accept(0, 0x0, False) == 0
+
+
+def test_refresh_window():
+    t = RefreshWindow(period=10, duration=3, offset=2)
+    blocked = [c for c in range(20) if not t.can_accept(c)]
+    assert blocked == [2, 3, 4, 12, 13, 14]
+
+
+def test_composite():
+    t = CompositeTiming(FixedLatency(4), BandwidthLimit(1, 2), RefreshWindow(8, 2))
+    assert not t.can_accept(0)
+    assert t.can_accept(2)
+    assert t.accept(2, 0, False) == 4
+    assert not t.can_accept(3)
+    assert t.can_accept(4)
@@ -0,0 +1,123 @@
+"""ObiHost transaction-level mode on the mock bus (no simulator)."""
+
+import pytest
+
+from cocotbext.obi import (
+    AddressSpace,
+    MemoryRegion,
+    MockBus,
+    MockSim,
+    ObiDevice,
+    ObiHost,
+    ObiMultiHost,
+    ObiRam,
+)
+
+REGS = {"CTRL": 0x0, "DATA": 0x4, "BUF": 0x10}
+
+
+async def _sequence(host):
+    """Register-style traffic; returns what was read back."""
+    host.addaddrmap(REGS)
+    await host.write("CTRL", 0x11223344)
+    await host.write("CTRL", 0xAABB, strb=0x3)
+    for i in range(4):
+        host.write_nowait("BUF", 0x100 + i, index=i)
+    await host.read("CTRL", 0x1122AABB)
+    return [await host.read("BUF", index=i) for i in range(4)]
+
+
+def _run(**kwargs):
+    with MockSim() as sim:
+        bus = MockBus(sim)
+        device = ObiDevice(MockBus(sim), sim.clock, target=MemoryRegion(2**12))
+        if kwargs.pop("pin_level", False):
+            device = ObiDevice(bus, sim.clock, target=device.target)
+            host = ObiHost(bus, sim.clock)
+        else:
+            host = ObiHost(bus, sim.clock, target=device, **kwargs)
+        result = sim.run_until(_sequence(host))
+        return result, sim.cycle, host, bus
+
+
+def test_same_results_as_pin_level():
+    expected, _, _, _ = _run(pin_level=True)
+    assert expected == [(0x100 + i).to_bytes(4, "little") for i in range(4)]
+
+    result, cycles, host, bus = _run()
+    assert result == expected
+    assert cycles == 0
+    assert host.idle
+    assert int(bus.req.value) == 0
+
+    result, cycles, _, _ = _run(latency=2)
+    assert result == expected
+    # Eleven transfers, one at a time
+    assert cycles == 22
+
+
+def test_memory_target_strobes_and_errors():
+    space = AddressSpace(2**16)
+    space.register_region(MemoryRegion(0x100), 0x0)
+    with MockSim() as sim:
+        host = ObiHost(MockBus(sim, addr_width=16), sim.clock, target=space)
+
+        async def test():
+            await host.write(0x20, b"\x01\x02\x03\x04")
+            await host.write(0x20, b"\xff\xff\xff\xff", strb=0x5)
+            assert await host.read(0x20) == b"\xff\x02\xff\x04"
+            await host.write(0x8000, 1, error_expected=True)
+            await host.read(0x8000, error_expected=True)
+
+        sim.run_until(test())
+        # Like a pin-level response, a mismatch fails the host's coroutine
+        with pytest.raises(ValueError, match="doesn't match"):
+            sim.run_until(host.read(0x20, 0))
+
+
+def test_obi_ram_target_and_errors():
+    with MockSim() as sim:
+        ram = ObiRam(MockBus(sim), sim.clock, size=2**12, autostart=False)
+        host = ObiHost(MockBus(sim), sim.clock, target=ram, latency=1)
+        host.return_int = True
+
+        async def test():
+            await host.write(0x40, 0xDEADBEEF)
+            assert ram.read(0x40, 4) == bytes.fromhex("efbeadde")
+            return await host.read(0x40)
+
+        assert sim.run_until(test()) == 0xDEADBEEF
+        assert sim.cycle == 2
+
+
+def test_invalid_configurations():
+    with MockSim() as sim:
+        narrow = ObiDevice(MockBus(sim, data_width=32), sim.clock)
+        with pytest.raises(ValueError, match="data width"):
+            ObiHost(MockBus(sim, data_width=64), sim.clock, target=narrow)
+        with pytest.raises(ValueError, match="latency"):
+            ObiHost(MockBus(sim), sim.clock, target=narrow, latency=-1)
+        with pytest.raises(ValueError, match="multi-host"):
+            ObiMultiHost([MockBus(sim)], sim.clock, target=narrow)
+
+
+def test_poll_takes_time_at_zero_latency():
+    with MockSim() as sim:
+        memory = MemoryRegion(2**12)
+        host = ObiHost(MockBus(sim), sim.clock, target=memory)
+        host.exception_enabled = False
+        result = sim.run_until(host.poll(0x0, 1, max_cycles=100))
+        assert not result.matched
+        assert 100 <= result.cycles <= 101
+        assert result.reads <= 101
+
+        async def set_flag():
+            await memory.write(0x0, b"\x01\x00\x00\x00")
+
+        sim.start_soon(set_flag())
+        result = sim.run_until(host.poll(0x0, 1, max_cycles=100))
+        assert result.matched and result.reads == 1
+        # Other transfers still take no time
+        cycle = sim.cycle
+        sim.run_until(host.read(0x0, 1))
+        assert sim.cycle == cycle